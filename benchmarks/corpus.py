@@ -0,0 +1,125 @@
+"""Deterministic synthetic resume corpus generator."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from io import BytesIO
+
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fabio", "Gabriel", "Helena", "Igor"]
+LAST_NAMES = ["Silva", "Souza", "Costa", "Pereira", "Almeida", "Gomes", "Ribeiro", "Martins"]
+SKILLS = [
+    "Python",
+    "Java",
+    "Go",
+    "Kubernetes",
+    "Docker",
+    "AWS",
+    "PostgreSQL",
+    "Kafka",
+    "React",
+    "TypeScript",
+    "Terraform",
+    "FastAPI",
+]
+TITLES = ["Backend Engineer", "Software Developer", "Data Engineer", "Tech Lead", "SRE"]
+COMPANIES = ["Acme Corp", "Initech", "Globex", "Umbrella", "Hooli", "Stark Industries"]
+SENTENCES = [
+    "Designed and operated event-driven services handling millions of requests per day.",
+    "Led migration of monolith components to containerized microservices.",
+    "Mentored junior engineers and drove code review practices.",
+    "Improved p99 latency by profiling hot paths and adding caching layers.",
+    "Built CI/CD pipelines with automated testing and progressive rollouts.",
+]
+
+
+@dataclass(frozen=True)
+class CorpusItem:
+    """A generated resume with its ground-truth text and page count."""
+
+    upload: UploadedFile
+    text: str
+    pages: int
+    kind: str
+
+
+def resume_text(rng: random.Random, pages: int = 1) -> str:
+    """Return a plausible resume body long enough to fill ``pages`` pages."""
+
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.split()[0].lower()}@example.com",
+        "",
+        "Summary",
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience.",
+        "",
+        "Skills: " + ", ".join(rng.sample(SKILLS, k=rng.randint(3, 7))),
+        "",
+        "Work Experience",
+    ]
+    year = 2024
+    for _ in range(3 * pages):
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(TITLES)} - {rng.choice(COMPANIES)}")
+        lines.append(f"{start} - {year}")
+        lines.extend(rng.sample(SENTENCES, k=3))
+        year = start
+    lines.extend(["", "Education", f"BSc Computer Science, {year - 4} - {year}"])
+    return "\n".join(lines)
+
+
+def text_pdf(text: str, pages: int) -> bytes:
+    """Render ``text`` into a PDF with a text layer spread over ``pages`` pages."""
+
+    import fitz  # PyMuPDF
+
+    document = fitz.open()
+    lines = text.splitlines()
+    per_page = max(1, -(-len(lines) // pages))
+    for index in range(pages):
+        page = document.new_page()
+        page.insert_text((50, 60), "\n".join(lines[index * per_page : (index + 1) * per_page]))
+    return document.tobytes()
+
+
+def scanned_image(text: str) -> bytes:
+    """Render ``text`` into a PNG, emulating a scanned single-page resume."""
+
+    from PIL import Image, ImageDraw
+
+    lines = text.splitlines()
+    image = Image.new("RGB", (1240, 40 + 18 * len(lines)), "white")
+    draw = ImageDraw.Draw(image)
+    for index, line in enumerate(lines):
+        draw.text((40, 20 + 18 * index), line, fill="black")
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def generate_corpus(size: int, seed: int = 7, max_pages: int = 3) -> list[CorpusItem]:
+    """Return ``size`` resumes cycling through text PDFs, scanned images and multi-page PDFs."""
+
+    rng = random.Random(seed)
+    items: list[CorpusItem] = []
+    for index in range(size):
+        kind = ("text_pdf", "scanned_image", "multi_page_pdf")[index % 3]
+        pages = rng.randint(2, max_pages) if kind == "multi_page_pdf" else 1
+        text = resume_text(rng, pages)
+        if kind == "scanned_image":
+            upload = UploadedFile(
+                filename=f"resume-{index:04d}.png",
+                content_type="image/png",
+                data=scanned_image(text),
+            )
+        else:
+            upload = UploadedFile(
+                filename=f"resume-{index:04d}.pdf",
+                content_type="application/pdf",
+                data=text_pdf(text, pages),
+            )
+        items.append(CorpusItem(upload=upload, text=text, pages=pages, kind=kind))
+    return items
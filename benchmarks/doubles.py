@@ -0,0 +1,189 @@
+"""Deterministic in-process doubles for the pipeline's external dependencies."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
+
+from benchmarks.corpus import CorpusItem
+from resume_ai.application.dto.audit_query import AuditLogPage, AuditLogQuery
+from resume_ai.application.dto.resume_search import ChunkFilter
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.domain.models.resume import (
+    ResumeChunk,
+    ResumeDocument,
+    ResumeProfile,
+    ResumeSummary,
+)
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+
+EMBEDDING_DIMENSIONS = 64
+
+
+class FixedClock:
+    """Clock frozen at a fixed instant so parsed durations never drift."""
+
+    def __init__(self, instant: datetime | None = None) -> None:
+        self._instant = instant or datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def now(self) -> datetime:
+        return self._instant
+
+
+class CorpusOCRService:
+    """Returns the ground-truth text of generated resumes, optionally simulating latency."""
+
+    def __init__(self, corpus: Iterable[CorpusItem], page_latency: float = 0.0) -> None:
+        self._items = {item.upload.content_hash(): item for item in corpus}
+        self._page_latency = page_latency
+
+    async def extract_text(self, file: UploadedFile) -> str:
+        item = self._items[file.content_hash()]
+        if self._page_latency:
+            await asyncio.sleep(self._page_latency * item.pages)
+        return item.text
+
+
+class HashEmbeddingService:
+    """Maps texts to unit vectors derived from their SHA-256 digest."""
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS, latency: float = 0.0) -> None:
+        self._dimensions = dimensions
+        self._latency = latency
+
+    async def embed_documents(self, texts: Iterable[str]) -> Sequence[list[float]]:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return [self._embed(text) for text in texts]
+
+    async def embed_query(self, text: str) -> list[float]:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return self._embed(text)
+
+    def _embed(self, text: str) -> list[float]:
+        seed = hashlib.sha256(text.encode("utf-8")).digest()
+        raw = [
+            seed[index % len(seed)] * (index + 1) % 251 - 125.0
+            for index in range(self._dimensions)
+        ]
+        norm = math.sqrt(sum(value * value for value in raw)) or 1.0
+        return [value / norm for value in raw]
+
+
+class InMemoryVectorStore:
+    """Brute-force cosine vector store keeping chunks in process memory."""
+
+    def __init__(self, embedding_service: HashEmbeddingService) -> None:
+        self._embedding_service = embedding_service
+        self._chunks: dict[str, ResumeChunk] = {}
+        self._vectors: dict[str, list[float]] = {}
+
+    async def upsert_chunks(self, chunks: Iterable[ResumeChunk]) -> None:
+        chunks = list(chunks)
+        if not chunks:
+            return
+        vectors = await self._embedding_service.embed_documents(chunk.text for chunk in chunks)
+        for chunk, vector in zip(chunks, vectors, strict=True):
+            self._chunks[chunk.chunk_id] = chunk
+            self._vectors[chunk.chunk_id] = vector
+
+    async def fetch_resume_chunks(
+        self, resume_id: str, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> list[ResumeChunk]:
+        chunks = [
+            chunk
+            for chunk in self._chunks.values()
+            if chunk.metadata.get("resume_id") == resume_id and _tenant(chunk) == tenant_id
+        ]
+        return sorted(chunks, key=lambda chunk: int(chunk.metadata.get("position", "0")))
+
+    async def link_resume(
+        self, resume_id: str, request_id: str, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> None:
+        return None
+
+    async def query(
+        self,
+        text: str,
+        limit: int = 5,
+        filters: ChunkFilter | None = None,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> list[ResumeChunk]:
+        query_vector = await self._embedding_service.embed_query(text)
+        scored = sorted(
+            (
+                (chunk_id, vector)
+                for chunk_id, vector in self._vectors.items()
+                if _tenant(self._chunks[chunk_id]) == tenant_id
+                and (filters is None or _matches(self._chunks[chunk_id], filters))
+            ),
+            key=lambda item: sum(a * b for a, b in zip(query_vector, item[1], strict=True)),
+            reverse=True,
+        )
+        return [self._chunks[chunk_id] for chunk_id, _ in scored[:limit]]
+
+
+def _tenant(chunk: ResumeChunk) -> str:
+    return chunk.metadata.get("tenant_id") or DEFAULT_TENANT_ID
+
+
+def _matches(chunk: ResumeChunk, filters: ChunkFilter) -> bool:
+    profile = ResumeProfile.from_metadata(chunk.metadata)
+    if filters.skills:
+        found = [skill in profile.skills for skill in filters.skills]
+        if not (any(found) if filters.match_any_skill else all(found)):
+            return False
+    if filters.min_years is not None and (profile.years_of_experience or 0) < filters.min_years:
+        return False
+    if filters.sections and chunk.metadata.get("section") not in filters.sections:
+        return False
+    return not filters.resume_ids or chunk.metadata.get("resume_id") in filters.resume_ids
+
+
+class TemplateLLMService:
+    """Produces summaries and answers from templates after an optional fixed delay."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self._latency = latency
+
+    async def summarize_resume(self, resume: ResumeDocument) -> ResumeSummary:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return ResumeSummary(
+            resume_id=resume.resume_id,
+            summary=resume.extracted_text.splitlines()[0] if resume.extracted_text else "",
+            highlights=resume.profile.skills[:3],
+        )
+
+    async def answer_query(self, query: str, resumes: Sequence[ResumeDocument]) -> dict:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return {
+            "answer": f"{len(resumes)} resume(s) considered for: {query}",
+            "justifications": [resume.filename for resume in resumes],
+            "referenced_resumes": [resume.resume_id for resume in resumes],
+        }
+
+
+class InMemoryAuditRepository:
+    """Keeps audit logs in a list, optionally simulating a database round trip."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.logs: list[AuditLog] = []
+        self._latency = latency
+
+    async def save(self, log: AuditLog) -> None:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        self.logs.append(log)
+
+    async def list_logs(self, query: AuditLogQuery | None = None) -> AuditLogPage:
+        query = query or AuditLogQuery()
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return AuditLogPage(items=list(reversed(self.logs))[: query.limit], next_cursor=None)
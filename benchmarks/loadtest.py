@@ -0,0 +1,282 @@
+"""Load test for the HTTP API driving the real ASGI app with in-process stand-ins.
+
+Usage::
+
+    python -m benchmarks.loadtest --concurrency 1,4,16,64 --requests 400 --output load.json
+    python -m benchmarks.loadtest --base-url http://localhost:8000 --concurrency 8
+
+Without ``--base-url`` the FastAPI app runs in process and OCR, OpenAI, Qdrant and Mongo
+are replaced by the deterministic doubles from ``benchmarks.doubles`` with the configured
+latencies. With ``--base-url`` requests go to a running deployment instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from benchmarks.corpus import CorpusItem, generate_corpus
+from benchmarks.doubles import (
+    CorpusOCRService,
+    FixedClock,
+    HashEmbeddingService,
+    InMemoryAuditRepository,
+    InMemoryVectorStore,
+    TemplateLLMService,
+)
+from benchmarks.pipeline import git_revision, latency_summary
+
+PROCESS_ENDPOINT = "/v1/resumes/process"
+LOGS_ENDPOINT = "/v1/logs"
+QUERIES = (
+    "Python developers with 5+ years of experience",
+    "Who has Kubernetes or Terraform experience?",
+    "Which candidate is the best fit for a tech lead role?",
+)
+
+
+@dataclass
+class EndpointStats:
+    """Latencies and outcomes collected for one endpoint."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        total = len(self.latencies)
+        summary = latency_summary(self.latencies) if self.latencies else {}
+        return {
+            "requests": total,
+            "errors": self.errors,
+            "error_rate": round(self.errors / total, 4) if total else 0.0,
+            "throughput_rps": round(total / elapsed, 3) if elapsed else 0.0,
+            "status_codes": dict(self.status_codes),
+            **summary,
+        }
+
+
+@dataclass(frozen=True)
+class FileMix:
+    """Relative weights of the generated resume kinds."""
+
+    weights: dict[str, float]
+
+    @classmethod
+    def parse(cls, raw: str) -> "FileMix":
+        weights = {}
+        for part in raw.split(","):
+            kind, _, weight = part.partition("=")
+            weights[kind.strip()] = float(weight or 1)
+        return cls(weights=weights)
+
+
+class Workload:
+    """Produces the randomized request sequence for one load level."""
+
+    def __init__(
+        self,
+        corpus: list[CorpusItem],
+        mix: FileMix,
+        files_per_request: int,
+        query_ratio: float,
+        logs_ratio: float,
+        seed: int,
+    ) -> None:
+        self._by_kind: dict[str, list[CorpusItem]] = defaultdict(list)
+        for item in corpus:
+            self._by_kind[item.kind].append(item)
+        unknown = set(mix.weights) - set(self._by_kind)
+        if unknown:
+            raise ValueError(f"Unknown file kinds in mix: {', '.join(sorted(unknown))}")
+        self._kinds = list(mix.weights)
+        self._weights = [mix.weights[kind] for kind in self._kinds]
+        self._files_per_request = files_per_request
+        self._query_ratio = query_ratio
+        self._logs_ratio = logs_ratio
+        self._rng = random.Random(seed)
+        self._sequence = 0
+
+    def next_request(self) -> tuple[str, dict[str, Any]]:
+        """Return the endpoint and httpx keyword arguments of the next request."""
+
+        self._sequence += 1
+        if self._rng.random() < self._logs_ratio:
+            return LOGS_ENDPOINT, {"params": {"limit": 50}}
+        kinds = self._rng.choices(self._kinds, weights=self._weights, k=self._files_per_request)
+        items = [self._rng.choice(self._by_kind[kind]) for kind in kinds]
+        data = {"request_id": f"load-{self._sequence}", "user_id": f"user-{self._sequence % 7}"}
+        if self._rng.random() < self._query_ratio:
+            data["query"] = self._rng.choice(QUERIES)
+        files = [
+            ("files", (item.upload.filename, item.upload.data, item.upload.content_type))
+            for item in items
+        ]
+        return PROCESS_ENDPOINT, {"data": data, "files": files}
+
+
+async def run_level(
+    client: httpx.AsyncClient, workload: Workload, concurrency: int, total_requests: int
+) -> dict[str, Any]:
+    """Send ``total_requests`` requests with ``concurrency`` concurrent workers."""
+
+    stats: dict[str, EndpointStats] = defaultdict(EndpointStats)
+    remaining = total_requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            endpoint, kwargs = workload.next_request()
+            method = client.post if endpoint == PROCESS_ENDPOINT else client.get
+            started = time.perf_counter()
+            try:
+                response = await method(endpoint, **kwargs)
+                status_code = str(response.status_code)
+                failed = response.status_code >= 400
+            except httpx.HTTPError as exc:
+                status_code = type(exc).__name__
+                failed = True
+            endpoint_stats = stats[endpoint]
+            endpoint_stats.latencies.append(time.perf_counter() - started)
+            endpoint_stats.status_codes[status_code] += 1
+            endpoint_stats.errors += int(failed)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    overall = EndpointStats()
+    for endpoint_stats in stats.values():
+        overall.latencies.extend(endpoint_stats.latencies)
+        overall.errors += endpoint_stats.errors
+        for code, count in endpoint_stats.status_codes.items():
+            overall.status_codes[code] += count
+    return {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "overall": overall.report(elapsed),
+        "endpoints": {name: item.report(elapsed) for name, item in sorted(stats.items())},
+    }
+
+
+def in_process_client(corpus: list[CorpusItem], args: argparse.Namespace) -> httpx.AsyncClient:
+    """Return a client bound to the ASGI app with external services replaced by doubles."""
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
+    from resume_ai.infrastructure.config.settings import get_settings
+    from resume_ai.interfaces.api import dependencies
+    from resume_ai.interfaces.api.dependencies.container import ServiceContainer
+    from resume_ai.interfaces.api.main import app
+
+    audit_repository = InMemoryAuditRepository(latency=args.mongo_latency)
+    use_case = ProcessResumesUseCase(
+        ocr_service=CorpusOCRService(corpus, page_latency=args.ocr_latency),
+        llm_service=TemplateLLMService(latency=args.llm_latency),
+        vector_store=InMemoryVectorStore(HashEmbeddingService(latency=args.embedding_latency)),
+        audit_repository=audit_repository,
+        clock=FixedClock(),
+    )
+    app.dependency_overrides[dependencies.provide_use_case] = lambda: use_case
+    app.dependency_overrides[dependencies.provide_audit_repository] = lambda: audit_repository
+    # Admission control is in-process state, so the real controller is exercised too.
+    admission = ServiceContainer(get_settings()).admission()
+    app.dependency_overrides[dependencies.provide_admission_controller] = lambda: admission
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=args.timeout
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every configured concurrency level and return the report."""
+
+    corpus = generate_corpus(args.corpus_size, seed=args.seed)
+    levels = [int(level) for level in args.concurrency.split(",")]
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+    else:
+        client = in_process_client(corpus, args)
+
+    results = []
+    async with client:
+        for level in levels:
+            workload = Workload(
+                corpus,
+                FileMix.parse(args.mix),
+                args.files_per_request,
+                args.query_ratio,
+                args.logs_ratio,
+                seed=args.seed + level,
+            )
+            results.append(await run_level(client, workload, level, args.requests))
+    return {
+        "git": git_revision(),
+        "target": args.base_url or "in-process",
+        "config": {
+            "requests_per_level": args.requests,
+            "mix": args.mix,
+            "files_per_request": args.files_per_request,
+            "query_ratio": args.query_ratio,
+            "logs_ratio": args.logs_ratio,
+            "latency_s": {
+                "ocr_page": args.ocr_latency,
+                "llm": args.llm_latency,
+                "embedding": args.embedding_latency,
+                "mongo": args.mongo_latency,
+            },
+        },
+        "levels": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest")
+    parser.add_argument(
+        "--concurrency", default="1,4,16", help="comma-separated concurrency levels to sweep"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="requests per level")
+    parser.add_argument(
+        "--mix",
+        default="text_pdf=0.5,scanned_image=0.3,multi_page_pdf=0.2",
+        help="relative weights of the generated file kinds",
+    )
+    parser.add_argument("--files-per-request", type=int, default=3)
+    parser.add_argument("--query-ratio", type=float, default=0.5)
+    parser.add_argument(
+        "--logs-ratio", type=float, default=0.2, help="share of requests sent to /v1/logs"
+    )
+    parser.add_argument("--corpus-size", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--ocr-latency", type=float, default=0.05, help="seconds per OCR page")
+    parser.add_argument("--llm-latency", type=float, default=0.4, help="seconds per LLM call")
+    parser.add_argument(
+        "--embedding-latency", type=float, default=0.05, help="seconds per embedding call"
+    )
+    parser.add_argument("--mongo-latency", type=float, default=0.005)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--base-url", help="target a running server instead of the ASGI app")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(rendered + "\n")
+    print(rendered)
+    return 0 if all(level["overall"]["errors"] == 0 for level in report["levels"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
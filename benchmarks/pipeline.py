@@ -0,0 +1,309 @@
+"""Ingestion pipeline benchmarks with machine-readable, comparable results.
+
+Usage::
+
+    python -m benchmarks.pipeline run --output bench/results.json
+    python -m benchmarks.pipeline compare bench/baseline.json bench/results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from benchmarks.corpus import CorpusItem, generate_corpus
+from benchmarks.doubles import (
+    CorpusOCRService,
+    FixedClock,
+    HashEmbeddingService,
+    InMemoryAuditRepository,
+    InMemoryVectorStore,
+    TemplateLLMService,
+)
+from resume_ai.application.dto.resume_request import ProcessResumesRequest
+from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
+from resume_ai.domain.services.resume_parser import ResumeParser
+
+SCHEMA_VERSION = 1
+BENCHMARK_QUERY = "Python developers with 5+ years of experience"
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``samples``."""
+
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples: list[float]) -> dict[str, float]:
+    """Return latency percentiles in milliseconds."""
+
+    return {
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+    }
+
+
+def build_use_case(corpus: list[CorpusItem], llm_latency: float = 0.0) -> ProcessResumesUseCase:
+    """Return a use case wired to deterministic doubles with an empty vector store."""
+
+    embeddings = HashEmbeddingService()
+    return ProcessResumesUseCase(
+        ocr_service=CorpusOCRService(corpus),
+        llm_service=TemplateLLMService(latency=llm_latency),
+        vector_store=InMemoryVectorStore(embeddings),
+        audit_repository=InMemoryAuditRepository(),
+        clock=FixedClock(),
+    )
+
+
+def bench_ocr(corpus: list[CorpusItem]) -> dict[str, Any]:
+    """Measure OCR throughput with PaddleOCR and page rasterisation on its own."""
+
+    from resume_ai.infrastructure.ocr.paddle_ocr_service import PaddleOCRService
+
+    pages = sum(item.pages for item in corpus)
+    started = time.perf_counter()
+    for item in corpus:
+        if item.upload.extension() == "pdf":
+            for _ in PaddleOCRService._load_pdf(item.upload):
+                pass
+        else:
+            PaddleOCRService._load_image(item.upload)
+    raster_seconds = time.perf_counter() - started
+    result: dict[str, Any] = {
+        "pages": pages,
+        "rasterize_pages_per_sec": round(pages / raster_seconds, 3),
+    }
+
+    try:
+        service = PaddleOCRService()
+    except RuntimeError as exc:
+        result["backend"] = "unavailable"
+        result["skipped"] = str(exc)
+        return result
+
+    async def _extract_all() -> None:
+        for item in corpus:
+            await service.extract_text(item.upload)
+
+    started = time.perf_counter()
+    asyncio.run(_extract_all())
+    seconds = time.perf_counter() - started
+    result["backend"] = "paddleocr"
+    result["pages_per_sec"] = round(pages / seconds, 3)
+    return result
+
+
+def bench_chunking(corpus: list[CorpusItem], rounds: int) -> dict[str, Any]:
+    """Measure parsing plus chunking throughput over the corpus text."""
+
+    use_case = build_use_case(corpus)
+    parser = ResumeParser()
+    reference_date = FixedClock().now()
+    chunks = 0
+    started = time.perf_counter()
+    for round_number in range(rounds):
+        for index, item in enumerate(corpus):
+            profile = parser.parse(item.text, reference_date=reference_date)
+            chunks += len(use_case._create_chunks(f"{round_number}-{index}", "bench", profile))
+    seconds = time.perf_counter() - started
+    return {
+        "documents": len(corpus) * rounds,
+        "chunks": chunks,
+        "chunks_per_sec": round(chunks / seconds, 3),
+        "documents_per_sec": round(len(corpus) * rounds / seconds, 3),
+    }
+
+
+async def _execute_batches(
+    corpus: list[CorpusItem], iterations: int, batch_size: int, llm_latency: float
+) -> list[float]:
+    samples: list[float] = []
+    for iteration in range(iterations):
+        # A fresh store per request keeps every run on the cold, non-deduplicated path.
+        use_case = build_use_case(corpus, llm_latency=llm_latency)
+        start = iteration * batch_size
+        batch = [corpus[(start + offset) % len(corpus)].upload for offset in range(batch_size)]
+        request = ProcessResumesRequest(
+            request_id=f"bench-{iteration}",
+            user_id="bench",
+            files=batch,
+            query=BENCHMARK_QUERY,
+        )
+        started = time.perf_counter()
+        await use_case.execute(request)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_execute(
+    corpus: list[CorpusItem], iterations: int, batch_size: int, llm_latency: float
+) -> dict[str, Any]:
+    """Measure end-to-end ``ProcessResumesUseCase.execute`` latency."""
+
+    asyncio.run(_execute_batches(corpus, 1, batch_size, llm_latency))  # warm-up
+    samples = asyncio.run(_execute_batches(corpus, iterations, batch_size, llm_latency))
+    return {"iterations": iterations, "batch_size": batch_size, **latency_summary(samples)}
+
+
+def bench_memory(corpus: list[CorpusItem], batch_size: int) -> dict[str, Any]:
+    """Measure peak traced allocations of one request over the whole batch."""
+
+    tracemalloc.start()
+    try:
+        asyncio.run(_execute_batches(corpus, 1, batch_size, 0.0))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    max_rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "peak_traced_mib": round(peak / 1024 / 1024, 3),
+        "max_rss_mib": round(max_rss_kib / 1024, 3),
+    }
+
+
+def git_revision() -> dict[str, Any]:
+    """Return the current commit and whether the working tree has local changes."""
+
+    def _git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        return {"commit": _git("rev-parse", "HEAD"), "dirty": bool(_git("status", "--porcelain"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": None}
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every benchmark and return the results document."""
+
+    corpus = generate_corpus(args.corpus_size, seed=args.seed, max_pages=args.max_pages)
+    benchmarks: dict[str, Callable[[], dict[str, Any]]] = {
+        "ocr": lambda: bench_ocr(corpus),
+        "chunking": lambda: bench_chunking(corpus, args.rounds),
+        "execute": lambda: bench_execute(
+            corpus, args.iterations, args.batch_size, args.llm_latency
+        ),
+        "memory": lambda: bench_memory(corpus, args.batch_size),
+    }
+    results = {
+        name: bench() for name, bench in benchmarks.items() if name not in set(args.skip)
+    }
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "git": git_revision(),
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "config": {
+            "corpus_size": args.corpus_size,
+            "seed": args.seed,
+            "max_pages": args.max_pages,
+            "rounds": args.rounds,
+            "iterations": args.iterations,
+            "batch_size": args.batch_size,
+            "llm_latency": args.llm_latency,
+        },
+        "results": results,
+    }
+
+
+def flatten_metrics(results: dict[str, Any]) -> dict[str, float]:
+    """Return numeric result fields keyed as ``benchmark.metric``."""
+
+    return {
+        f"{name}.{metric}": float(value)
+        for name, values in results.items()
+        for metric, value in values.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+
+
+def higher_is_better(metric: str) -> bool:
+    """Return whether a larger value of ``metric`` is an improvement."""
+
+    return metric.endswith("_per_sec")
+
+
+def compare(baseline: dict[str, Any], candidate: dict[str, Any], threshold: float) -> int:
+    """Print metric deltas and return the number of regressions beyond ``threshold``."""
+
+    before = flatten_metrics(baseline["results"])
+    after = flatten_metrics(candidate["results"])
+    print(
+        f"baseline {baseline['git']['commit'][:12]} -> candidate {candidate['git']['commit'][:12]}"
+    )
+    regressions = 0
+    for metric in sorted(before.keys() & after.keys()):
+        old, new = before[metric], after[metric]
+        change = (new - old) / old if old else 0.0
+        worse = -change if higher_is_better(metric) else change
+        tracked = metric.endswith(("_per_sec", "_ms", "_mib"))
+        flag = ""
+        if tracked and worse > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{metric:40} {old:>14.3f} {new:>14.3f} {change:>+9.1%}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.pipeline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--corpus-size", type=int, default=30)
+    run_parser.add_argument("--seed", type=int, default=7)
+    run_parser.add_argument("--max-pages", type=int, default=3)
+    run_parser.add_argument("--rounds", type=int, default=5, help="chunking passes over the corpus")
+    run_parser.add_argument("--iterations", type=int, default=50)
+    run_parser.add_argument("--batch-size", type=int, default=5, help="files per request")
+    run_parser.add_argument(
+        "--llm-latency", type=float, default=0.0, help="simulated seconds per LLM call"
+    )
+    run_parser.add_argument(
+        "--skip", action="append", default=[], choices=["ocr", "chunking", "execute", "memory"]
+    )
+    run_parser.add_argument("--output", help="write the JSON results to this path")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.10, help="relative slowdown reported as regression"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        with open(args.candidate, encoding="utf-8") as candidate_file:
+            candidate = json.load(candidate_file)
+        return 1 if compare(baseline, candidate, args.threshold) else 0
+
+    document = run(args)
+    rendered = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(rendered + "\n")
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""CPU cost of encoding API responses: pydantic round trip versus direct orjson encoding.
+
+Usage::
+
+    python -m benchmarks.serialization --summaries 200 --logs 100 --output serialization.json
+
+The legacy path rebuilds the route's pydantic schema from the use-case dataclasses and lets
+FastAPI validate and encode it, exactly as the routes did before ``DataclassJSONResponse``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from benchmarks.pipeline import git_revision
+from resume_ai.application.dto.resume_request import (
+    ProcessResumesResponse,
+    QueryAnswerResponse,
+    ResumeSummaryResponse,
+)
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.interfaces.api.responses import DataclassJSONResponse
+from resume_ai.interfaces.api.schemas.audit import AuditLogSchema
+from resume_ai.interfaces.api.schemas.resume import ProcessResumesResponseSchema
+
+# The response fields FastAPI builds from each route's ``response_model``.
+PROCESS_FIELD = create_model_field(name="Response", type_=ProcessResumesResponseSchema)
+AUDIT_FIELD = create_model_field(name="Response", type_=List[AuditLogSchema])
+
+
+def process_response(summaries: int) -> ProcessResumesResponse:
+    return ProcessResumesResponse(
+        request_id="bench",
+        summaries=[
+            ResumeSummaryResponse(
+                resume_id=f"{index:032x}",
+                filename=f"resume-{index}.pdf",
+                summary="Senior backend engineer leading Python and AWS platform teams. " * 4,
+                highlights=["Python", "AWS", "Kubernetes", "Mentoring", "PostgreSQL"],
+            )
+            for index in range(summaries)
+        ],
+        query_answer=QueryAnswerResponse(
+            request_id="bench",
+            answer="Several candidates match the requested profile.",
+            justifications=[f"resume-{index}.pdf: Python, AWS" for index in range(summaries)],
+            referenced_resumes=[f"{index:032x}" for index in range(summaries)],
+        ),
+    )
+
+
+def audit_page(logs: int) -> list[AuditLog]:
+    start = datetime(2025, 11, 6, tzinfo=timezone.utc)
+    response = asdict(process_response(5))
+    return [
+        AuditLog(
+            request_id=f"request-{index}",
+            user_id=f"user-{index % 7}",
+            timestamp=start - timedelta(seconds=index),
+            query="Python developers with 5+ years of experience",
+            result=response,
+        )
+        for index in range(logs)
+    ]
+
+
+async def legacy_process(response: ProcessResumesResponse) -> bytes:
+    schema = ProcessResumesResponseSchema(
+        request_id=response.request_id,
+        summaries=[asdict(summary) for summary in response.summaries],
+        query_answer=asdict(response.query_answer) if response.query_answer else None,
+        complete=response.complete,
+    )
+    return JSONResponse(await serialize_response(field=PROCESS_FIELD, response_content=schema)).body
+
+
+async def legacy_audit(logs: list[AuditLog]) -> bytes:
+    content = [
+        AuditLogSchema(
+            request_id=log.request_id,
+            user_id=log.user_id,
+            timestamp=log.timestamp,
+            query=log.query,
+            result=log.result,
+            tenant_id=log.tenant_id,
+        )
+        for log in logs
+    ]
+    return JSONResponse(await serialize_response(field=AUDIT_FIELD, response_content=content)).body
+
+
+async def direct(content: Any) -> bytes:
+    return DataclassJSONResponse(content).body
+
+
+async def measure(encode: Callable[[], Awaitable[bytes]], iterations: int) -> dict[str, float]:
+    """Return CPU microseconds per response and the encoded size."""
+
+    body = await encode()
+    samples = []
+    for _ in range(iterations):
+        started = time.process_time()
+        await encode()
+        samples.append((time.process_time() - started) * 1_000_000)
+    return {
+        "cpu_us_mean": round(statistics.fmean(samples), 1),
+        "cpu_us_p50": round(statistics.median(samples), 1),
+        "bytes": len(body),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    response = process_response(args.summaries)
+    logs = audit_page(args.logs)
+    results: dict[str, Any] = {}
+    for name, legacy, fast in (
+        ("process", lambda: legacy_process(response), lambda: direct(response)),
+        ("audit_logs", lambda: legacy_audit(logs), lambda: direct(logs)),
+    ):
+        if json.loads(await legacy()) != json.loads(await fast()):
+            raise AssertionError(f"{name}: the encodings differ")
+        before = await measure(legacy, args.iterations)
+        after = await measure(fast, args.iterations)
+        results[name] = {
+            "legacy": before,
+            "direct": after,
+            "cpu_us_saved_per_response": round(before["cpu_us_mean"] - after["cpu_us_mean"], 1),
+            "speedup": round(before["cpu_us_mean"] / max(after["cpu_us_mean"], 0.1), 2),
+        }
+    return {
+        "git": git_revision(),
+        "config": {"summaries": args.summaries, "logs": args.logs, "iterations": args.iterations},
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serialization", description=__doc__)
+    parser.add_argument("--summaries", type=int, default=200, help="summaries per response")
+    parser.add_argument("--logs", type=int, default=100, help="audit logs per page")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(report + "\n")
+    print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
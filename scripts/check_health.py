@@ -1,13 +1,20 @@
+import argparse
 import asyncio
+import sys
 
 import httpx
 
 
-async def main() -> None:
-    async with httpx.AsyncClient() as client:
-        response = await client.get("http://localhost:8000/health")
-        print(response.status_code, response.json())
+async def main(base_url: str) -> int:
+    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
+        liveness = await client.get("/health")
+        print("health", liveness.status_code, liveness.json())
+        readiness = await client.get("/ready")
+        print("ready", readiness.status_code, readiness.json())
+    return 0 if liveness.status_code == 200 and readiness.status_code == 200 else 1
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Check liveness and readiness of the API.")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    sys.exit(asyncio.run(main(parser.parse_args().base_url)))
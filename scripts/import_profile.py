@@ -0,0 +1,80 @@
+"""Measure import time of the API entry point, broken down by module and package.
+
+Runs ``python -X importtime`` in a fresh interpreter so cached modules do not skew the
+numbers. Usage::
+
+    python scripts/import_profile.py [module] [--top 20] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def profile_imports(module: str) -> list[tuple[str, int, int]]:
+    """Return ``(module, self_us, cumulative_us)`` for every module imported by ``module``."""
+
+    python_path = [str(SRC_DIR), *filter(None, [os.environ.get("PYTHONPATH")])]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(python_path)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="resume_ai.interfaces.api.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print a JSON document instead")
+    args = parser.parse_args()
+
+    entries = profile_imports(args.module)
+    total_us = next((cumulative for name, _, cumulative in entries if name == args.module), 0)
+    by_package: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in entries:
+        by_package[name.split(".")[0]] += self_us
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[: args.top]
+    slowest = sorted(entries, key=lambda item: item[2], reverse=True)[: args.top]
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "module": args.module,
+                    "total_ms": total_us / 1000,
+                    "packages_ms": {name: us / 1000 for name, us in packages},
+                    "modules_cumulative_ms": {name: cum / 1000 for name, _, cum in slowest},
+                },
+                indent=2,
+            )
+        )
+        return
+
+    print(f"import {args.module}: {total_us / 1000:.1f} ms")
+    print("\nself time by top-level package:")
+    for name, us in packages:
+        print(f"  {us / 1000:9.1f} ms  {name}")
+    print("\nslowest modules (cumulative):")
+    for name, _, cumulative in slowest:
+        print(f"  {cumulative / 1000:9.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
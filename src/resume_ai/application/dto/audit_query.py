@@ -0,0 +1,29 @@
+"""Data transfer objects for audit log queries."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
+
+
+@dataclass(frozen=True)
+class AuditLogQuery:
+    """Filters and keyset pagination for listing audit logs."""
+
+    limit: int = 50
+    user_id: str | None = None
+    request_id: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    cursor: str | None = None
+    include_result: bool = False
+    tenant_id: str = DEFAULT_TENANT_ID
+
+
+@dataclass(frozen=True)
+class AuditLogPage:
+    """One page of audit logs, newest first."""
+
+    items: list[AuditLog] = field(default_factory=list)
+    next_cursor: str | None = None
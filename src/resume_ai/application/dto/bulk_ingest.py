@@ -0,0 +1,45 @@
+"""Data transfer objects for bulk resume ingestion."""
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+
+
+@dataclass(frozen=True)
+class BulkIngestRequest:
+    """A stream of resume files to index under one ingestion run."""
+
+    request_id: str
+    user_id: str
+    files: Iterable[UploadedFile]
+    skip_summaries: bool = False
+    tenant_id: str = DEFAULT_TENANT_ID
+
+
+@dataclass
+class BulkIngestStats:
+    """Running counters of a bulk ingestion."""
+
+    discovered: int = 0
+    skipped: int = 0
+    reused: int = 0
+    processed: int = 0
+    failed: int = 0
+    chunks: int = 0
+    summaries: int = 0
+    elapsed_seconds: float = 0.0
+    failures: dict[str, str] = field(default_factory=dict)
+
+    def files_per_second(self) -> float:
+        """Return indexed or reused files per second."""
+
+        if not self.elapsed_seconds:
+            return 0.0
+        return (self.processed + self.reused) / self.elapsed_seconds
+
+    def chunks_per_second(self) -> float:
+        """Return indexed chunks per second."""
+
+        return self.chunks / self.elapsed_seconds if self.elapsed_seconds else 0.0
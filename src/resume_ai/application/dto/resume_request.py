@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from typing import List
 
+from resume_ai.domain.value_objects.deadline import Deadline
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
 from resume_ai.domain.value_objects.uploaded_file import UploadedFile
 
 
@@ -14,6 +16,8 @@ class ProcessResumesRequest:
     user_id: str
     query: str | None
     files: List[UploadedFile] = field(default_factory=list)
+    deadline: Deadline = field(default_factory=Deadline)
+    tenant_id: str = DEFAULT_TENANT_ID
 
 
 @dataclass(frozen=True)
@@ -24,6 +28,7 @@ class ResumeSummaryResponse:
     filename: str
     summary: str
     highlights: list[str]
+    complete: bool = True
 
 
 @dataclass(frozen=True)
@@ -34,6 +39,7 @@ class QueryAnswerResponse:
     answer: str
     justifications: list[str]
     referenced_resumes: list[str]
+    complete: bool = True
 
 
 @dataclass(frozen=True)
@@ -43,4 +49,12 @@ class ProcessResumesResponse:
     request_id: str
     summaries: list[ResumeSummaryResponse]
     query_answer: QueryAnswerResponse | None = None
+    # Whether every summary and the answer finished within the deadline. Stored rather
+    # than computed so the response serializes field for field like its API schema.
+    complete: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        answered = self.query_answer is None or self.query_answer.complete
+        complete = answered and all(summary.complete for summary in self.summaries)
+        object.__setattr__(self, "complete", complete)
 
@@ -0,0 +1,56 @@
+"""Data transfer objects for searching the indexed resume corpus."""
+
+from dataclasses import dataclass, field
+
+from resume_ai.application.dto.resume_request import QueryAnswerResponse
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
+
+
+@dataclass(frozen=True)
+class ChunkFilter:
+    """Structured restrictions applied to indexed chunks during retrieval."""
+
+    skills: tuple[str, ...] = ()
+    match_any_skill: bool = False
+    min_years: float | None = None
+    sections: tuple[str, ...] = ()
+    resume_ids: tuple[str, ...] = ()
+
+    def is_empty(self) -> bool:
+        """Return whether the filter restricts nothing."""
+
+        return not (self.skills or self.sections or self.resume_ids) and self.min_years is None
+
+
+@dataclass(frozen=True)
+class SearchResumesRequest:
+    """A hiring query over resumes that were already indexed."""
+
+    request_id: str
+    user_id: str
+    query: str
+    filters: ChunkFilter = field(default_factory=ChunkFilter)
+    limit: int = 10
+    answer: bool = False
+    tenant_id: str = DEFAULT_TENANT_ID
+
+
+@dataclass(frozen=True)
+class ResumeMatch:
+    """A resume retrieved for a query, with its best matching chunks."""
+
+    resume_id: str
+    filename: str
+    score: float
+    skills: list[str]
+    years_of_experience: float | None
+    snippets: list[str]
+
+
+@dataclass(frozen=True)
+class SearchResumesResponse:
+    """Resumes ranked by relevance and an optional LLM answer."""
+
+    request_id: str
+    matches: list[ResumeMatch]
+    query_answer: QueryAnswerResponse | None = None
@@ -1,7 +1,8 @@
 """Audit repository interface."""
 
-from typing import Protocol, Sequence
+from typing import Protocol
 
+from resume_ai.application.dto.audit_query import AuditLogPage, AuditLogQuery
 from resume_ai.domain.models.audit import AuditLog
 
 
@@ -11,6 +12,5 @@ class AuditRepository(Protocol):
     async def save(self, log: AuditLog) -> None:
         """Persist an audit log."""
 
-    async def list_logs(self, limit: int = 50) -> Sequence[AuditLog]:
-        """Return the latest audit logs."""
-
+    async def list_logs(self, query: AuditLogQuery | None = None) -> AuditLogPage:
+        """Return a page of audit logs matching the query, newest first."""
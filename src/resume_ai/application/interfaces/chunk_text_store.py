@@ -0,0 +1,32 @@
+"""Chunk text store interface used to keep chunk text out of the vector index."""
+
+from typing import Mapping, Protocol, Sequence
+
+
+class ChunkTextStore(Protocol):
+    """Stores the text of indexed chunks by chunk id."""
+
+    async def put_many(self, texts: Mapping[str, str]) -> None:
+        """Store or replace the text of each chunk id."""
+
+    async def get_many(self, chunk_ids: Sequence[str]) -> dict[str, str]:
+        """Return the stored texts of ``chunk_ids``; unknown ids are left out."""
+
+
+class InMemoryChunkTextStore:
+    """Chunk text store that only lasts for the current process."""
+
+    def __init__(self) -> None:
+        self._texts: dict[str, str] = {}
+
+    async def put_many(self, texts: Mapping[str, str]) -> None:
+        """Remember the texts for the rest of the process."""
+
+        self._texts.update(texts)
+
+    async def get_many(self, chunk_ids: Sequence[str]) -> dict[str, str]:
+        """Return the known texts of ``chunk_ids``."""
+
+        return {
+            chunk_id: self._texts[chunk_id] for chunk_id in chunk_ids if chunk_id in self._texts
+        }
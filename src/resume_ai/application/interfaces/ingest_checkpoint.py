@@ -0,0 +1,30 @@
+"""Checkpoint interface used to resume interrupted bulk ingestions."""
+
+from typing import Iterable, Protocol
+
+
+class IngestCheckpoint(Protocol):
+    """Remembers which resumes a bulk ingestion has fully indexed."""
+
+    def contains(self, resume_id: str) -> bool:
+        """Return whether the resume was already completed."""
+
+    def mark_done(self, resume_ids: Iterable[str]) -> None:
+        """Durably record the resumes as completed."""
+
+
+class InMemoryIngestCheckpoint:
+    """Checkpoint that only lasts for the current run."""
+
+    def __init__(self) -> None:
+        self._done: set[str] = set()
+
+    def contains(self, resume_id: str) -> bool:
+        """Return whether the resume was completed during this run."""
+
+        return resume_id in self._done
+
+    def mark_done(self, resume_ids: Iterable[str]) -> None:
+        """Remember the resumes for the rest of the run."""
+
+        self._done.update(resume_ids)
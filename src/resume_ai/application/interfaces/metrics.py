@@ -0,0 +1,26 @@
+"""Metrics recorder interface used to instrument pipeline stages."""
+
+from contextlib import AbstractContextManager, nullcontext
+from typing import Protocol
+
+
+class MetricsRecorder(Protocol):
+    """Records stage durations and pipeline counters."""
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager timing the named stage."""
+
+    def count(self, name: str, amount: float = 1.0) -> None:
+        """Increment the named pipeline counter."""
+
+
+class NullMetricsRecorder:
+    """Recorder that discards every measurement."""
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """Return a no-op context manager."""
+
+        return nullcontext()
+
+    def count(self, name: str, amount: float = 1.0) -> None:
+        """Ignore the increment."""
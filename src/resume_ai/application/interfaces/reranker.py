@@ -0,0 +1,15 @@
+"""Reranker interface."""
+
+from typing import Protocol, Sequence
+
+from resume_ai.domain.models.resume import ResumeChunk
+
+
+class Reranker(Protocol):
+    """Contract for models reordering retrieved chunks by relevance to a query."""
+
+    async def rerank(self, query: str, chunks: Sequence[ResumeChunk]) -> list[ResumeChunk]:
+        """Return the relevant chunks, best first, dropping those below the cut-off.
+
+        Each returned chunk carries its ``rerank_score`` in its metadata.
+        """
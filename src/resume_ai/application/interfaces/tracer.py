@@ -0,0 +1,22 @@
+"""Tracer interface used to record spans around pipeline stages."""
+
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Protocol
+
+_NOOP_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class Tracer(Protocol):
+    """Opens nested, timed spans correlated with the current request."""
+
+    def span(self, name: str, **attributes: Any) -> AbstractContextManager[None]:
+        """Return a context manager recording the named span."""
+
+
+class NullTracer:
+    """Tracer used when tracing is disabled; records nothing."""
+
+    def span(self, name: str, **attributes: Any) -> AbstractContextManager[None]:
+        """Return a shared no-op context manager."""
+
+        return _NOOP_SPAN
@@ -2,15 +2,43 @@
 
 from typing import Iterable, Protocol
 
+from resume_ai.application.dto.resume_search import ChunkFilter
 from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
 
 
 class VectorStore(Protocol):
-    """Contract for vector storage adapters."""
+    """Contract for vector storage adapters.
+
+    Every chunk belongs to the tenant named by its ``tenant_id`` metadata, and reads
+    only ever see the chunks of the tenant they are given.
+    """
 
     async def upsert_chunks(self, chunks: Iterable[ResumeChunk]) -> None:
-        """Persist resume chunks for retrieval."""
+        """Persist resume chunks for retrieval.
+
+        ``chunks`` holds every chunk of each resume it covers; stored chunks of those
+        resumes that are not among them are removed.
+        """
+
+    async def fetch_resume_chunks(
+        self, resume_id: str, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> list[ResumeChunk]:
+        """Return the stored chunks of a resume ordered by position, if any."""
+
+    async def link_resume(
+        self, resume_id: str, request_id: str, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> None:
+        """Record that an already indexed resume was submitted by another request."""
 
-    async def query(self, text: str, limit: int = 5) -> list[ResumeChunk]:
-        """Return the most relevant chunks for the supplied query."""
+    async def query(
+        self,
+        text: str,
+        limit: int = 5,
+        filters: ChunkFilter | None = None,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> list[ResumeChunk]:
+        """Return the most relevant chunks, best first, restricted by ``filters``.
 
+        Each chunk carries its ``rank`` and similarity ``score`` in its metadata.
+        """
@@ -0,0 +1,229 @@
+"""Admission control with per-user weighted fair queuing over page and token budgets."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Callable
+
+from resume_ai.application.interfaces.metrics import MetricsRecorder, NullMetricsRecorder
+
+# Estimated LLM output per summary, plus the per-resume context sent to answer a query.
+SUMMARY_OUTPUT_TOKENS = 400
+ANSWER_CONTEXT_TOKENS = 500
+# Retry hints are clamped so clients neither hammer the API nor give up entirely.
+MIN_RETRY_AFTER_SECONDS = 1
+MAX_RETRY_AFTER_SECONDS = 120
+# Smoothing factor of the observed seconds per unit of work, used for retry hints.
+SERVICE_TIME_SMOOTHING = 0.2
+
+
+@dataclass(frozen=True)
+class WorkCost:
+    """Resources a request is expected to hold while it runs."""
+
+    pages: int
+    tokens: int
+
+    @classmethod
+    def estimate(
+        cls, pages: int, files: int, has_query: bool, tokens_per_page: int
+    ) -> WorkCost:
+        """Estimate OCR pages and LLM tokens for a processing request."""
+
+        tokens = pages * tokens_per_page + files * SUMMARY_OUTPUT_TOKENS
+        if has_query:
+            tokens += files * ANSWER_CONTEXT_TOKENS
+        return cls(pages=max(pages, 1), tokens=tokens)
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a request is refused instead of queued."""
+
+    def __init__(self, reason: str, retry_after: int) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(order=True)
+class _Ticket:
+    finish: float
+    sequence: int
+    start: float = field(compare=False)
+    user_id: str = field(compare=False)
+    cost: WorkCost = field(compare=False)
+    units: float = field(compare=False)
+    granted: asyncio.Future[None] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class AdmissionController:
+    """Grants processing capacity in pages and tokens, fairly across users.
+
+    Waiting requests are ordered by start-time fair queuing: each user's virtual clock
+    advances by a request's dominant share of the page or token budget divided by the
+    user's weight, so a user submitting 200 resumes queues behind everyone else's next
+    request instead of in front of it. Requests are refused up front with a retry hint
+    once the global or per-user queue is too deep.
+    """
+
+    def __init__(
+        self,
+        max_pages: int,
+        max_tokens: int,
+        max_queue_depth: int = 100,
+        max_queued_per_user: int = 10,
+        weights: Mapping[str, float] | None = None,
+        default_weight: float = 1.0,
+        initial_seconds_per_unit: float = 30.0,
+        metrics: MetricsRecorder | None = None,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_pages = max_pages
+        self._max_tokens = max_tokens
+        self._max_queue_depth = max_queue_depth
+        self._max_queued_per_user = max_queued_per_user
+        self._weights = dict(weights or {})
+        self._default_weight = default_weight
+        self._seconds_per_unit = initial_seconds_per_unit
+        self._metrics = metrics or NullMetricsRecorder()
+        self._monotonic = monotonic
+        self._pages_in_use = 0
+        self._tokens_in_use = 0
+        self._virtual_time = 0.0
+        self._user_finish: dict[str, float] = {}
+        self._queue: list[_Ticket] = []
+        self._queued_per_user: dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(self._queued_per_user.values())
+
+    def check(self, user_id: str) -> None:
+        """Refuse early, before any upload is read, when the queues are already full."""
+
+        if self.queue_depth >= self._max_queue_depth:
+            self._metrics.count("admission_rejected")
+            raise AdmissionRejectedError("Server is at capacity.", self._retry_after(self._queue))
+        if self._queued_per_user.get(user_id, 0) >= self._max_queued_per_user:
+            self._metrics.count("admission_rejected")
+            own = [ticket for ticket in self._queue if ticket.user_id == user_id]
+            raise AdmissionRejectedError(
+                "Too many queued requests for this user.", self._retry_after(own)
+            )
+
+    @asynccontextmanager
+    async def admit(
+        self, user_id: str, cost: WorkCost, timeout: float | None = None
+    ) -> AsyncIterator[None]:
+        """Hold capacity for ``cost`` while the block runs, waiting for a fair turn first."""
+
+        self.check(user_id)
+        ticket = self._enqueue(user_id, self._clamp(cost))
+        self._dispatch()
+        try:
+            with self._metrics.stage("admission_wait"):
+                await asyncio.wait_for(asyncio.shield(ticket.granted), timeout)
+        except asyncio.TimeoutError:
+            self._withdraw(ticket)
+            self._metrics.count("admission_rejected")
+            raise AdmissionRejectedError(
+                "Timed out waiting for capacity.", self._retry_after(self._queue)
+            ) from None
+        except BaseException:
+            self._withdraw(ticket)
+            raise
+        started = self._monotonic()
+        try:
+            yield
+        finally:
+            self._release(ticket, self._monotonic() - started)
+
+    def _clamp(self, cost: WorkCost) -> WorkCost:
+        # A request larger than the whole budget would never fit; it runs alone instead.
+        return WorkCost(
+            pages=min(cost.pages, self._max_pages), tokens=min(cost.tokens, self._max_tokens)
+        )
+
+    def _enqueue(self, user_id: str, cost: WorkCost) -> _Ticket:
+        units = max(cost.pages / self._max_pages, cost.tokens / self._max_tokens)
+        weight = self._weights.get(user_id, self._default_weight)
+        start = max(self._virtual_time, self._user_finish.get(user_id, 0.0))
+        finish = start + units / weight
+        self._user_finish[user_id] = finish
+        ticket = _Ticket(
+            finish=finish,
+            sequence=next(self._sequence),
+            start=start,
+            user_id=user_id,
+            cost=cost,
+            units=units,
+            granted=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, ticket)
+        self._queued_per_user[user_id] = self._queued_per_user.get(user_id, 0) + 1
+        return ticket
+
+    def _dispatch(self) -> None:
+        if not self._queue:
+            # Users whose virtual clock fell behind are indistinguishable from new ones.
+            self._user_finish = {
+                user_id: finish
+                for user_id, finish in self._user_finish.items()
+                if finish > self._virtual_time
+            }
+        while self._queue:
+            head = self._queue[0]
+            if head.cancelled:
+                heapq.heappop(self._queue)
+                continue
+            if (
+                self._pages_in_use + head.cost.pages > self._max_pages
+                or self._tokens_in_use + head.cost.tokens > self._max_tokens
+            ):
+                # Strict order keeps large requests from being starved by small ones.
+                return
+            heapq.heappop(self._queue)
+            self._dequeued(head)
+            self._pages_in_use += head.cost.pages
+            self._tokens_in_use += head.cost.tokens
+            self._virtual_time = max(self._virtual_time, head.start)
+            head.granted.set_result(None)
+
+    def _withdraw(self, ticket: _Ticket) -> None:
+        if ticket.granted.done() and not ticket.granted.cancelled():
+            # Capacity was granted just as the waiter gave up; hand it back.
+            self._release(ticket, None)
+            return
+        ticket.cancelled = True
+        ticket.granted.cancel()
+        self._dequeued(ticket)
+        self._dispatch()
+
+    def _dequeued(self, ticket: _Ticket) -> None:
+        remaining = self._queued_per_user.get(ticket.user_id, 0) - 1
+        if remaining > 0:
+            self._queued_per_user[ticket.user_id] = remaining
+        else:
+            self._queued_per_user.pop(ticket.user_id, None)
+
+    def _release(self, ticket: _Ticket, held_seconds: float | None) -> None:
+        self._pages_in_use -= ticket.cost.pages
+        self._tokens_in_use -= ticket.cost.tokens
+        if held_seconds is not None and ticket.units > 0:
+            observed = held_seconds / ticket.units
+            self._seconds_per_unit += SERVICE_TIME_SMOOTHING * (observed - self._seconds_per_unit)
+        self._dispatch()
+
+    def _retry_after(self, waiting: list[_Ticket]) -> int:
+        units = sum(ticket.units for ticket in waiting if not ticket.cancelled)
+        seconds = math.ceil(units * self._seconds_per_unit)
+        return min(max(seconds, MIN_RETRY_AFTER_SECONDS), MAX_RETRY_AFTER_SECONDS)
@@ -0,0 +1,277 @@
+"""Query planning and inverted-index filtering of candidates without the LLM."""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterable
+
+from resume_ai.domain.models.resume import ResumeChunk, ResumeProfile
+from resume_ai.domain.services.resume_parser import find_skills
+
+_TOKEN_PATTERN = re.compile(r"[\w+#]+(?:[./][\w+#]+)*")
+_QUOTED_PATTERN = re.compile(r"\"([^\"]+)\"|“([^”]+)”")
+_MIN_YEARS_PATTERN = re.compile(
+    r"(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years?|yrs?|anos|años)", re.IGNORECASE
+)
+# An upper bound on experience cannot be answered by the minimum-years filter.
+_MAX_YEARS_PATTERN = re.compile(
+    r"\b(?:(?:less|fewer)\s+than|under|below|at\s+most|up\s+to|(?:no|not)\s+more\s+than"
+    r"|menos\s+(?:de|que)|até|no\s+máximo|hasta|como\s+máximo|a\s+lo\s+sumo)"
+    r"\s+\d{1,2}(?:\.\d)?\s*\+?\s*(?:years?|yrs?|anos|años)",
+    re.IGNORECASE,
+)
+_ANY_OF_PATTERN = re.compile(r"\b(?:or|ou)\b", re.IGNORECASE)
+# "o" is also the Portuguese and Spanish article, so it only means "or" between two skills.
+_SHORT_OR_PATTERN = re.compile(r"\bo\b", re.IGNORECASE)
+# A negation covers the rest of its clause: "Java developers not using Spring". A bare
+# "no" is the Portuguese "in the", so it only negates in English phrases.
+_NEGATION_PATTERN = re.compile(
+    r"\b(?:not|without|except|excluding|sem|sin|exceto|excepto"
+    r"|no\s+(?:prior\s+)?(?:experience|knowledge|background)\s+(?:with|in|of))\b"
+    r"(?P<clause>.*?)(?=[,;.!?]|\b(?:but|and|mas|pero|e|y)\b|$)",
+    re.IGNORECASE,
+)
+
+# Words that only express "filter me some candidates" and carry no ranking intent.
+FILTER_FILLER_WORDS = frozenset(
+    {
+        "a",
+        "all",
+        "an",
+        "and",
+        "any",
+        "anyone",
+        "at",
+        "candidate",
+        "candidates",
+        "developer",
+        "developers",
+        "engineer",
+        "engineers",
+        "experience",
+        "experienced",
+        "familiar",
+        "find",
+        "for",
+        "has",
+        "have",
+        "having",
+        "in",
+        "is",
+        "know",
+        "knowing",
+        "knows",
+        "least",
+        "list",
+        "me",
+        "more",
+        "of",
+        "on",
+        "or",
+        "over",
+        "people",
+        "plus",
+        "proficient",
+        "resume",
+        "resumes",
+        "show",
+        "skilled",
+        "skills",
+        "someone",
+        "than",
+        "that",
+        "the",
+        "using",
+        "which",
+        "who",
+        "whom",
+        "with",
+        "worked",
+        "year",
+        "years",
+        "yrs",
+    }
+)
+
+
+class QueryMode(str, Enum):
+    """How a hiring query should be answered."""
+
+    FILTER = "filter"
+    SHORTLIST = "shortlist"
+    LLM = "llm"
+
+
+@dataclass(frozen=True)
+class FilterCriteria:
+    """Structured constraints extracted from a hiring query."""
+
+    skills: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
+    min_years: float | None = None
+    match_any_skill: bool = False
+    excluded_skills: tuple[str, ...] = ()
+
+    def is_empty(self) -> bool:
+        """Return whether the query carried no structured constraint."""
+
+        return (
+            not self.skills
+            and not self.keywords
+            and self.min_years is None
+            and not self.excluded_skills
+        )
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Execution plan for a hiring query."""
+
+    mode: QueryMode
+    criteria: FilterCriteria
+
+
+@dataclass(frozen=True)
+class CandidateMatch:
+    """A resume satisfying the filter criteria, with the evidence found."""
+
+    resume_id: str
+    matched_skills: list[str]
+    matched_keywords: list[str]
+    years_of_experience: float | None
+
+
+@dataclass
+class CandidateIndex:
+    """Inverted index of skills and keywords built from resume chunks."""
+
+    skills: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    tokens: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    years: dict[str, float | None] = field(default_factory=dict)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[ResumeChunk]) -> "CandidateIndex":
+        """Index the profile metadata and text tokens carried by the chunks."""
+
+        index = cls()
+        for chunk in chunks:
+            resume_id = chunk.metadata.get("resume_id", "")
+            if not resume_id:
+                continue
+            profile = ResumeProfile.from_metadata(chunk.metadata)
+            index.years.setdefault(resume_id, profile.years_of_experience)
+            for skill in [*profile.skills, *find_skills(chunk.text)]:
+                index.skills[skill.lower()].add(resume_id)
+            for token in _tokenize(chunk.text):
+                index.tokens[token].add(resume_id)
+        return index
+
+    @property
+    def resume_ids(self) -> set[str]:
+        """Return every resume present in the index."""
+
+        return set(self.years)
+
+    def match(self, criteria: FilterCriteria) -> list[CandidateMatch]:
+        """Return resumes satisfying the criteria, best coverage first."""
+
+        matches: list[CandidateMatch] = []
+        for resume_id in sorted(self.resume_ids):
+            matched_skills = [
+                skill for skill in criteria.skills if resume_id in self.skills.get(skill.lower(), ())
+            ]
+            if criteria.skills:
+                required = 1 if criteria.match_any_skill else len(criteria.skills)
+                if len(matched_skills) < required:
+                    continue
+            if any(
+                resume_id in self.skills.get(skill.lower(), ()) for skill in criteria.excluded_skills
+            ):
+                continue
+            matched_keywords = [
+                keyword
+                for keyword in criteria.keywords
+                if all(resume_id in self.tokens.get(token, ()) for token in _tokenize(keyword))
+            ]
+            if len(matched_keywords) < len(criteria.keywords):
+                continue
+            years = self.years.get(resume_id)
+            if criteria.min_years is not None and (years is None or years < criteria.min_years):
+                continue
+            matches.append(
+                CandidateMatch(
+                    resume_id=resume_id,
+                    matched_skills=matched_skills,
+                    matched_keywords=matched_keywords,
+                    years_of_experience=years,
+                )
+            )
+        matches.sort(
+            key=lambda item: (-len(item.matched_skills), -(item.years_of_experience or 0.0))
+        )
+        return matches
+
+
+class QueryPlanner:
+    """Detects filter-style hiring queries and extracts their criteria.
+
+    Only canonical known skills become filters, and skills named in a negated clause
+    exclude candidates instead of being required. Queries bounding experience from above
+    ("less than 2 years") are left to the LLM.
+    """
+
+    def plan(self, query: str) -> QueryPlan:
+        """Decide whether a query can be answered by filtering alone."""
+
+        keywords = tuple(
+            (double or curly).strip() for double, curly in _QUOTED_PATTERN.findall(query)
+        )
+        unquoted = _QUOTED_PATTERN.sub(" ", query)
+        if _MAX_YEARS_PATTERN.search(unquoted):
+            return QueryPlan(mode=QueryMode.LLM, criteria=FilterCriteria())
+        negated = " ".join(match.group("clause") for match in _NEGATION_PATTERN.finditer(unquoted))
+        remainder = _NEGATION_PATTERN.sub(" ", unquoted)
+        skills = find_skills(remainder)
+        years_match = _MIN_YEARS_PATTERN.search(remainder)
+        criteria = FilterCriteria(
+            skills=tuple(skills),
+            keywords=keywords,
+            min_years=float(years_match.group(1)) if years_match else None,
+            match_any_skill=len(skills) > 1 and _asks_for_any(remainder, skills),
+            excluded_skills=tuple(skill for skill in find_skills(negated) if skill not in skills),
+        )
+        if criteria.is_empty():
+            return QueryPlan(mode=QueryMode.LLM, criteria=criteria)
+
+        consumed = {token for skill in skills for token in _tokenize(skill)}
+        residual = [
+            token
+            for token in _tokenize(_MIN_YEARS_PATTERN.sub(" ", remainder))
+            if token not in consumed and token not in FILTER_FILLER_WORDS and not token.isdigit()
+        ]
+        mode = QueryMode.SHORTLIST if residual else QueryMode.FILTER
+        return QueryPlan(mode=mode, criteria=criteria)
+
+
+def _asks_for_any(text: str, skills: list[str]) -> bool:
+    if _ANY_OF_PATTERN.search(text):
+        return True
+    for match in _SHORT_OR_PATTERN.finditer(text):
+        before = text[: match.start()].rstrip(" ,")
+        after = text[match.end() :].lstrip()
+        ends_with_skill = any(
+            re.search(rf"(?<!\w){re.escape(skill)}$", before, re.IGNORECASE) for skill in skills
+        )
+        starts_with_skill = any(
+            re.match(rf"{re.escape(skill)}(?!\w)", after, re.IGNORECASE) for skill in skills
+        )
+        if ends_with_skill and starts_with_skill:
+            return True
+    return False
+
+
+def _tokenize(text: str) -> list[str]:
+    return [token.lower() for token in _TOKEN_PATTERN.findall(text)]
@@ -0,0 +1,87 @@
+"""Readiness checks probing external dependencies concurrently with a short-lived cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Mapping
+
+# A probe returns normally when its dependency is usable and raises otherwise.
+HealthProbe = Callable[[], Awaitable[object]]
+
+
+@dataclass(frozen=True)
+class DependencyHealth:
+    """Result of probing one dependency."""
+
+    ok: bool
+    latency_ms: float
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ReadinessReport:
+    """Aggregated probe results."""
+
+    dependencies: dict[str, DependencyHealth] = field(default_factory=dict)
+    age_seconds: float = 0.0
+
+    @property
+    def ready(self) -> bool:
+        """Return whether every dependency is healthy."""
+
+        return all(health.ok for health in self.dependencies.values())
+
+
+class ReadinessService:
+    """Runs every probe concurrently, each bounded by ``timeout`` seconds.
+
+    Results are cached for ``ttl`` seconds and concurrent callers share a single probe
+    run, so frequent load-balancer checks do not add load to the dependencies.
+    """
+
+    def __init__(
+        self,
+        probes: Mapping[str, HealthProbe],
+        timeout: float = 2.0,
+        ttl: float = 5.0,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._probes = dict(probes)
+        self._timeout = timeout
+        self._ttl = ttl
+        self._monotonic = monotonic
+        self._lock = asyncio.Lock()
+        self._cached: ReadinessReport | None = None
+        self._cached_at = 0.0
+
+    async def check(self) -> ReadinessReport:
+        """Return the cached report, probing again once it is older than the TTL."""
+
+        async with self._lock:
+            now = self._monotonic()
+            if self._cached is None or now - self._cached_at >= self._ttl:
+                results = await asyncio.gather(
+                    *(self._probe(probe) for probe in self._probes.values())
+                )
+                self._cached = ReadinessReport(dependencies=dict(zip(self._probes, results, strict=True)))
+                self._cached_at = self._monotonic()
+                now = self._cached_at
+            return ReadinessReport(
+                dependencies=self._cached.dependencies,
+                age_seconds=round(now - self._cached_at, 3),
+            )
+
+    async def _probe(self, probe: HealthProbe) -> DependencyHealth:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe(), timeout=self._timeout)
+        except Exception as exc:  # noqa: BLE001 - any probe failure marks the dependency down
+            error = "timed out" if isinstance(exc, asyncio.TimeoutError) else str(exc) or repr(exc)
+            return DependencyHealth(ok=False, latency_ms=_elapsed_ms(start), error=error)
+        return DependencyHealth(ok=True, latency_ms=_elapsed_ms(start))
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
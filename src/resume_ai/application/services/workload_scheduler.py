@@ -0,0 +1,197 @@
+"""Priority scheduling of OCR pages and LLM calls between interactive and bulk work."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from resume_ai.application.interfaces.metrics import MetricsRecorder, NullMetricsRecorder
+
+T = TypeVar("T")
+
+
+class Priority(str, Enum):
+    """Workload classes, most urgent first."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+    BACKGROUND = "background"
+
+
+# Requests name their class once at the entry point; adapters read it from here, including
+# in executor threads running a copy of the caller's context.
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "workload_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    """Return the workload class of the running request."""
+
+    return _current_priority.get()
+
+
+@contextmanager
+def priority_scope(priority: Priority) -> Iterator[None]:
+    """Run the block, and the tasks it starts, in the given workload class."""
+
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def parse_priority(value: str | None, default: Priority = Priority.INTERACTIVE) -> Priority:
+    """Return ``value`` as a workload class, ``default`` when it is empty.
+
+    Raises ``ValueError`` for names other than interactive, batch and background.
+    """
+
+    if value is None or not value.strip():
+        return default
+    try:
+        return Priority(value.strip().lower())
+    except ValueError:
+        raise ValueError(f"Invalid priority '{value}'.") from None
+
+
+@dataclass(eq=False)
+class _Waiter:
+    priority: Priority
+    wake: Callable[[], None]
+    granted: bool = False
+
+
+class WorkloadScheduler:
+    """Grants the slots of one resource, interactive work first.
+
+    ``reserved_interactive`` of the ``slots`` are only granted to interactive work, so a
+    backfill never occupies the whole resource. A freed slot goes to waiting interactive
+    work before batch work, and to batch before background work. Callers take a slot per
+    OCR page or LLM call, so a long batch job yields to interactive requests between
+    pages instead of holding the resource until it finishes.
+
+    Slots are only ever waited for on the event loop, with ``acquire``, or with ``run`` for
+    blocking work; queued work therefore never holds an executor thread that the slot
+    holders, or unrelated ``to_thread`` callers, need.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slots: int,
+        reserved_interactive: int = 0,
+        metrics: MetricsRecorder | None = None,
+    ) -> None:
+        if slots < 1:
+            raise ValueError("A scheduler needs at least one slot.")
+        self._name = name
+        self._slots = slots
+        # Batch work always keeps one slot, or it would never run on a one-slot resource.
+        self._shared_slots = max(slots - reserved_interactive, 1)
+        self._metrics = metrics or NullMetricsRecorder()
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._queues: dict[Priority, deque[_Waiter]] = {
+            priority: deque() for priority in Priority
+        }
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of waiters of each workload class."""
+
+        with self._lock:
+            return {priority.value: len(queue) for priority, queue in self._queues.items()}
+
+    @asynccontextmanager
+    async def acquire(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Hold a slot while the block runs, waiting on the event loop for one."""
+
+        priority = priority or current_priority()
+        loop = asyncio.get_running_loop()
+        granted: asyncio.Future[None] = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(_resolve, granted)
+
+        waiter = self._request(priority, wake)
+        try:
+            with self._metrics.stage(f"{self._name}_wait_{priority.value}"):
+                await granted
+        except BaseException:
+            self._withdraw(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def run(self, func: Callable[..., T], *args: Any, priority: Priority | None = None) -> T:
+        """Call ``func(*args)`` on the default executor once a slot is granted.
+
+        ``func`` runs in a copy of the caller's context. A cancelled caller keeps the slot
+        until the thread finishes, since the call itself cannot be interrupted.
+        """
+
+        loop = asyncio.get_running_loop()
+        async with self.acquire(priority):
+            context = contextvars.copy_context()
+            call = loop.run_in_executor(None, partial(context.run, func, *args))
+            try:
+                return await asyncio.shield(call)
+            except asyncio.CancelledError:
+                await asyncio.wait([call])
+                raise
+
+    def _request(self, priority: Priority, wake: Callable[[], None]) -> _Waiter:
+        waiter = _Waiter(priority=priority, wake=wake)
+        with self._lock:
+            self._queues[priority].append(waiter)
+            self._dispatch()
+        if not waiter.granted:
+            self._metrics.count(f"{self._name}_queued_{priority.value}")
+        return waiter
+
+    def _withdraw(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter.granted:
+                # The slot was granted just as the waiter gave up; hand it on.
+                self._in_use -= 1
+            else:
+                self._queues[waiter.priority].remove(waiter)
+            self._dispatch()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_use -= 1
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        for priority, queue in self._queues.items():
+            limit = self._slots if priority is Priority.INTERACTIVE else self._shared_slots
+            while queue and self._in_use < limit:
+                waiter = queue.popleft()
+                waiter.granted = True
+                self._in_use += 1
+                self._metrics.count(f"{self._name}_granted_{priority.value}")
+                waiter.wake()
+            if queue:
+                # Lower classes wait behind a class that cannot run yet.
+                return
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,164 @@
+"""Use case running the ingestion stages as a parallel pipeline for bulk backfills."""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import Callable
+
+from resume_ai.application.dto.bulk_ingest import BulkIngestRequest, BulkIngestStats
+from resume_ai.application.interfaces.audit_repository import AuditRepository
+from resume_ai.application.interfaces.clock import Clock
+from resume_ai.application.interfaces.ingest_checkpoint import (
+    IngestCheckpoint,
+    InMemoryIngestCheckpoint,
+)
+from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.domain.models.resume import ResumeDocument, ResumeSummary
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+
+ProgressCallback = Callable[[BulkIngestStats], None]
+
+
+class BulkIngestUseCase:
+    """Indexes a stream of resumes with concurrent OCR and batched indexing.
+
+    Files flow through three stages connected by bounded queues: discovery, a pool of
+    ``ocr_concurrency`` extraction workers, and an indexer that embeds and upserts the
+    chunks of several resumes at once (at least ``index_batch_size`` chunks per call).
+    A resume is checkpointed only after its batch was upserted, summarized and audited.
+    Discovery reads archive members and hashes files in a worker thread, so a large file
+    does not stall the other stages.
+    """
+
+    def __init__(
+        self,
+        process_use_case: ProcessResumesUseCase,
+        audit_repository: AuditRepository,
+        clock: Clock,
+        checkpoint: IngestCheckpoint | None = None,
+        ocr_concurrency: int = 4,
+        index_batch_size: int = 256,
+        summary_concurrency: int = 4,
+    ) -> None:
+        self._process = process_use_case
+        self._audit_repository = audit_repository
+        self._clock = clock
+        self._checkpoint = checkpoint or InMemoryIngestCheckpoint()
+        self._ocr_concurrency = ocr_concurrency
+        self._index_batch_size = index_batch_size
+        self._summary_slots = asyncio.Semaphore(summary_concurrency)
+
+    async def execute(
+        self, request: BulkIngestRequest, on_progress: ProgressCallback | None = None
+    ) -> BulkIngestStats:
+        """Ingest every file of the request and return the final counters."""
+
+        stats = BulkIngestStats()
+        started = perf_counter()
+        # Files travel with their id so each one is hashed once.
+        files: asyncio.Queue[tuple[str, UploadedFile] | None] = asyncio.Queue(
+            self._ocr_concurrency * 2
+        )
+        resumes: asyncio.Queue[ResumeDocument | None] = asyncio.Queue(self._ocr_concurrency * 4)
+
+        def report() -> None:
+            stats.elapsed_seconds = perf_counter() - started
+            if on_progress is not None:
+                on_progress(stats)
+
+        async def discover() -> None:
+            seen: set[str] = set()
+            pending = iter(request.files)
+            while (file := await asyncio.to_thread(next, pending, None)) is not None:
+                stats.discovered += 1
+                resume_id = await asyncio.to_thread(self._process.resume_id_for, file)
+                if resume_id in seen or self._checkpoint.contains(resume_id):
+                    stats.skipped += 1
+                    continue
+                seen.add(resume_id)
+                await files.put((resume_id, file))
+            for _ in range(self._ocr_concurrency):
+                await files.put(None)
+
+        async def extract() -> None:
+            while (item := await files.get()) is not None:
+                resume_id, file = item
+                try:
+                    existing = await self._process.reuse_indexed_resume(
+                        resume_id, request.request_id, file, request.tenant_id
+                    )
+                    if existing is not None:
+                        self._checkpoint.mark_done([resume_id])
+                        stats.reused += 1
+                        continue
+                    resume = await self._process.extract_resume(
+                        resume_id, request.request_id, file, request.tenant_id
+                    )
+                except Exception as exc:  # noqa: BLE001 - one bad file must not stop the run
+                    stats.failed += 1
+                    stats.failures[file.filename] = str(exc) or repr(exc)
+                    continue
+                await resumes.put(resume)
+
+        async def extract_all() -> None:
+            await asyncio.gather(*(extract() for _ in range(self._ocr_concurrency)))
+            await resumes.put(None)
+
+        async def index() -> None:
+            batch: list[ResumeDocument] = []
+            while (resume := await resumes.get()) is not None:
+                batch.append(resume)
+                if sum(len(item.chunks) for item in batch) >= self._index_batch_size:
+                    await self._flush(request, batch, stats)
+                    batch = []
+                    report()
+            if batch:
+                await self._flush(request, batch, stats)
+            report()
+
+        tasks = [asyncio.create_task(stage()) for stage in (discover, extract_all, index)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return stats
+
+    async def _flush(
+        self, request: BulkIngestRequest, batch: list[ResumeDocument], stats: BulkIngestStats
+    ) -> None:
+        chunks = [chunk for resume in batch for chunk in resume.chunks]
+        await self._process.index_chunks(chunks)
+        summaries: list[ResumeSummary] = []
+        if not request.skip_summaries:
+            summaries = list(await asyncio.gather(*(self._summarize(resume) for resume in batch)))
+        await self._audit_repository.save(
+            AuditLog(
+                request_id=request.request_id,
+                user_id=request.user_id,
+                timestamp=self._clock.now(),
+                query=None,
+                result={
+                    "indexed": [
+                        {"resume_id": resume.resume_id, "filename": resume.filename}
+                        for resume in batch
+                    ],
+                    "summaries": [
+                        {"resume_id": summary.resume_id, "highlights": summary.highlights}
+                        for summary in summaries
+                    ],
+                },
+                tenant_id=request.tenant_id,
+            )
+        )
+        self._checkpoint.mark_done(resume.resume_id for resume in batch)
+        stats.processed += len(batch)
+        stats.chunks += len(chunks)
+        stats.summaries += len(summaries)
+
+    async def _summarize(self, resume: ResumeDocument) -> ResumeSummary:
+        async with self._summary_slots:
+            (summary,) = await self._process.generate_summaries([resume])
+        return summary
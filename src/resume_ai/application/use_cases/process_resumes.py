@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+from collections.abc import Awaitable, Iterable
+from dataclasses import replace
 from datetime import datetime
-from typing import List
-from uuid import uuid4
-
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from ulid import ULID
+from typing import TypeVar
+from uuid import NAMESPACE_URL, uuid5
 
 from resume_ai.application.dto.resume_request import (
     ProcessResumesRequest,
@@ -19,12 +18,74 @@ from resume_ai.application.dto.resume_request import (
 from resume_ai.application.interfaces.audit_repository import AuditRepository
 from resume_ai.application.interfaces.clock import Clock
 from resume_ai.application.interfaces.llm_service import LLMService
+from resume_ai.application.interfaces.metrics import MetricsRecorder, NullMetricsRecorder
 from resume_ai.application.interfaces.ocr_service import OCRService
+from resume_ai.application.interfaces.reranker import Reranker
+from resume_ai.application.interfaces.tracer import NullTracer, Tracer
 from resume_ai.application.interfaces.vector_store import VectorStore
+from resume_ai.application.services.candidate_filter import (
+    CandidateIndex,
+    CandidateMatch,
+    QueryMode,
+    QueryPlanner,
+)
 from resume_ai.domain.models.audit import AuditLog
-from resume_ai.domain.models.resume import ResumeChunk, ResumeDocument, ResumeSummary
+from resume_ai.domain.models.resume import (
+    ResumeChunk,
+    ResumeDocument,
+    ResumeProfile,
+    ResumeSummary,
+)
+from resume_ai.domain.services.resume_parser import ResumeParser
+from resume_ai.domain.value_objects.deadline import Deadline
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
 from resume_ai.domain.value_objects.uploaded_file import UploadedFile
 
+RESUME_ID_LENGTH = 32
+CHUNK_ID_NAMESPACE = uuid5(NAMESPACE_URL, "resume-ai/chunks")
+
+T = TypeVar("T")
+
+
+async def _within(deadline: Deadline, awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable``, cancelling it and raising ``TimeoutError`` past the deadline."""
+
+    if deadline.expired():
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise asyncio.TimeoutError
+    return await asyncio.wait_for(awaitable, timeout=deadline.remaining())
+
+
+def join_chunks(texts: list[str], max_overlap: int) -> str:
+    """Rejoin consecutive chunks of one section, dropping the text they overlap on."""
+
+    joined = ""
+    for text in texts:
+        if not joined:
+            joined = text
+            continue
+        overlap = next(
+            (
+                size
+                for size in range(min(max_overlap, len(text), len(joined)), 0, -1)
+                # Chunks are cut at separators, so a real overlap ends at one in ``text``.
+                if (size == len(text) or text[size] in " \n.") and joined.endswith(text[:size])
+            ),
+            0,
+        )
+        joined = joined + text[overlap:] if overlap else f"{joined}\n{text}"
+    return joined
+
+
+def chunk_id_for(tenant_id: str, resume_id: str, position: str) -> str:
+    """Return the point id of a chunk, distinct per tenant for the same resume."""
+
+    # Chunks indexed before tenancy keep their ids, so they are still found and reused.
+    if tenant_id == DEFAULT_TENANT_ID:
+        return str(uuid5(CHUNK_ID_NAMESPACE, f"{resume_id}:{position}"))
+    return str(uuid5(CHUNK_ID_NAMESPACE, f"{tenant_id}:{resume_id}:{position}"))
+
 
 class ProcessResumesUseCase:
     """Coordinates OCR, embedding, LLM reasoning, and auditing."""
@@ -38,12 +99,26 @@ class ProcessResumesUseCase:
         clock: Clock,
         chunk_size: int = 800,
         chunk_overlap: int = 80,
+        parser: ResumeParser | None = None,
+        query_planner: QueryPlanner | None = None,
+        metrics: MetricsRecorder | None = None,
+        tracer: Tracer | None = None,
+        reranker: Reranker | None = None,
     ) -> None:
         self._ocr_service = ocr_service
         self._llm_service = llm_service
         self._vector_store = vector_store
         self._audit_repository = audit_repository
         self._clock = clock
+        self._parser = parser or ResumeParser()
+        self._query_planner = query_planner or QueryPlanner()
+        self._metrics = metrics or NullMetricsRecorder()
+        self._tracer = tracer or NullTracer()
+        self._reranker = reranker
+        self._chunk_overlap = chunk_overlap
+        # LangChain is slow to import, so it is loaded on first construction, not module import.
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
         self._splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
@@ -56,74 +131,338 @@ class ProcessResumesUseCase:
         if not request.files:
             raise ValueError("At least one resume file is required.")
 
-        resumes = await self._process_files(request.files)
+        with self._tracer.span(
+            "process_resumes.execute",
+            request_id=request.request_id,
+            user_id=request.user_id,
+            file_count=len(request.files),
+            has_query=bool(request.query),
+        ):
+            return await self._execute(request)
 
-        all_chunks = [chunk for resume in resumes for chunk in resume.chunks]
-        await self._vector_store.upsert_chunks(all_chunks)
+    async def _execute(self, request: ProcessResumesRequest) -> ProcessResumesResponse:
+        deadline = request.deadline
+        with self._metrics.stage("ingest"):
+            resumes, new_chunks, unprocessed = await self._process_files(
+                request.request_id, request.files, deadline, request.tenant_id
+            )
+        # Indexing is not cut short: OCR output that was paid for is kept for reuse.
+        await self.index_chunks(new_chunks)
 
-        summaries = await self._generate_summaries(resumes)
+        with self._metrics.stage("summarize"):
+            summaries = await self._summarize_within(resumes, deadline)
 
         query_answer = None
         if request.query:
-            answer_payload = await self._llm_service.answer_query(request.query, resumes)
+            with self._metrics.stage("answer"):
+                answer_payload = await self._answer_within(request.query, resumes, deadline)
             query_answer = QueryAnswerResponse(
                 request_id=request.request_id,
-                answer=answer_payload.get("answer", ""),
-                justifications=answer_payload.get("justifications", []),
-                referenced_resumes=answer_payload.get("referenced_resumes", []),
+                answer=(answer_payload or {}).get("answer", ""),
+                justifications=(answer_payload or {}).get("justifications", []),
+                referenced_resumes=(answer_payload or {}).get("referenced_resumes", []),
+                complete=answer_payload is not None and not unprocessed,
             )
 
         response = ProcessResumesResponse(
             request_id=request.request_id,
             summaries=[
-                ResumeSummaryResponse(
-                    resume_id=summary.resume_id,
-                    filename=self._find_filename(resumes, summary.resume_id),
-                    summary=summary.summary,
-                    highlights=summary.highlights,
-                )
-                for summary in summaries
+                *(
+                    self._summary_response(resume, summaries.get(resume.resume_id))
+                    for resume in resumes
+                ),
+                *(
+                    ResumeSummaryResponse(
+                        resume_id=resume_id,
+                        filename=file.filename,
+                        summary="",
+                        highlights=[],
+                        complete=False,
+                    )
+                    for resume_id, file in unprocessed
+                ),
             ],
             query_answer=query_answer,
         )
+        if not response.complete:
+            self._metrics.count("deadline_exceeded")
 
-        await self._persist_audit_log(request, response, resumes)
+        with self._metrics.stage("audit"):
+            await self._persist_audit_log(request, response, resumes)
         return response
 
-    async def _process_files(self, files: Iterable[UploadedFile]) -> List[ResumeDocument]:
-        resumes: list[ResumeDocument] = []
+    async def _process_files(
+        self,
+        request_id: str,
+        files: Iterable[UploadedFile],
+        deadline: Deadline,
+        tenant_id: str,
+    ) -> tuple[list[ResumeDocument], list[ResumeChunk], list[tuple[str, UploadedFile]]]:
+        with self._tracer.span("process_resumes.process_files"):
+            return await self._process_each_file(request_id, files, deadline, tenant_id)
+
+    async def _process_each_file(
+        self,
+        request_id: str,
+        files: Iterable[UploadedFile],
+        deadline: Deadline,
+        tenant_id: str,
+    ) -> tuple[list[ResumeDocument], list[ResumeChunk], list[tuple[str, UploadedFile]]]:
+        resumes: dict[str, ResumeDocument] = {}
+        new_chunks: list[ResumeChunk] = []
+        unprocessed: dict[str, UploadedFile] = {}
         for file in files:
-            resume_id = str(ULID())
+            resume_id = self.resume_id_for(file)
+            if resume_id in resumes or resume_id in unprocessed:
+                continue
+            try:
+                existing = await _within(
+                    deadline, self.reuse_indexed_resume(resume_id, request_id, file, tenant_id)
+                )
+                if existing is not None:
+                    resumes[resume_id] = existing
+                    continue
+                resume = await _within(
+                    deadline, self.extract_resume(resume_id, request_id, file, tenant_id)
+                )
+            except asyncio.TimeoutError:
+                unprocessed[resume_id] = file
+                continue
+            resumes[resume_id] = resume
+            new_chunks.extend(resume.chunks)
+        return list(resumes.values()), new_chunks, list(unprocessed.items())
+
+    async def _summarize_within(
+        self, resumes: list[ResumeDocument], deadline: Deadline
+    ) -> dict[str, ResumeSummary]:
+        summaries: dict[str, ResumeSummary] = {}
+        for resume in resumes:
+            try:
+                summaries[resume.resume_id] = await _within(
+                    deadline, self._llm_service.summarize_resume(resume)
+                )
+            except asyncio.TimeoutError:
+                break
+        return summaries
+
+    async def _answer_within(
+        self, query: str, resumes: list[ResumeDocument], deadline: Deadline
+    ) -> dict | None:
+        try:
+            return await _within(deadline, self._answer_query(query, resumes))
+        except asyncio.TimeoutError:
+            return None
+
+    @staticmethod
+    def _summary_response(
+        resume: ResumeDocument, summary: ResumeSummary | None
+    ) -> ResumeSummaryResponse:
+        if summary is None:
+            return ResumeSummaryResponse(
+                resume_id=resume.resume_id,
+                filename=resume.filename,
+                summary="",
+                highlights=[],
+                complete=False,
+            )
+        return ResumeSummaryResponse(
+            resume_id=summary.resume_id,
+            filename=resume.filename,
+            summary=summary.summary,
+            highlights=summary.highlights,
+        )
+
+    @staticmethod
+    def resume_id_for(file: UploadedFile) -> str:
+        """Return the content-derived identifier of a resume file."""
+
+        return file.content_hash()[:RESUME_ID_LENGTH]
+
+    async def reuse_indexed_resume(
+        self,
+        resume_id: str,
+        request_id: str,
+        file: UploadedFile,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> ResumeDocument | None:
+        """Return the tenant's already indexed resume linked to ``request_id``, if any."""
+
+        with self._metrics.stage("dedup_lookup"):
+            stored_chunks = await self._vector_store.fetch_resume_chunks(resume_id, tenant_id)
+        if not stored_chunks:
+            return None
+        await self._vector_store.link_resume(resume_id, request_id, tenant_id)
+        self._metrics.count("resumes_reused")
+        return self._restore_resume(resume_id, file, stored_chunks)
+
+    async def extract_resume(
+        self,
+        resume_id: str,
+        request_id: str,
+        file: UploadedFile,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> ResumeDocument:
+        """Run OCR, parsing and chunking for one resume file."""
+
+        with self._tracer.span(
+            "process_resumes.extract_resume", resume_id=resume_id, filename=file.filename
+        ):
+            resume = await self._extract_resume(resume_id, request_id, file, tenant_id)
+        self._metrics.count("resumes_processed")
+        return resume
+
+    async def index_chunks(self, chunks: list[ResumeChunk]) -> None:
+        """Embed and store chunks in the vector store."""
+
+        with self._metrics.stage("index"):
+            await self._vector_store.upsert_chunks(chunks)
+        self._metrics.count("chunks", len(chunks))
+
+    async def _extract_resume(
+        self, resume_id: str, request_id: str, file: UploadedFile, tenant_id: str
+    ) -> ResumeDocument:
+        with self._metrics.stage("ocr"):
             text = await self._ocr_service.extract_text(file)
-            normalized_text = text.strip()
-            chunks = self._create_chunks(resume_id, normalized_text)
-            resume = ResumeDocument(
-                resume_id=resume_id,
-                filename=file.filename,
-                content_type=file.content_type,
-                language="auto",
-                extracted_text=normalized_text,
-                chunks=chunks,
-                created_at=self._clock.now(),
+        normalized_text = text.strip()
+        with self._metrics.stage("parse"):
+            profile = self._parser.parse(normalized_text, reference_date=self._clock.now())
+        with self._metrics.stage("chunk"):
+            chunks = self._create_chunks(
+                resume_id, request_id, profile, filename=file.filename, tenant_id=tenant_id
             )
-            resumes.append(resume)
-        return resumes
+        return ResumeDocument(
+            resume_id=resume_id,
+            filename=file.filename,
+            content_type=file.content_type,
+            language="auto",
+            extracted_text=normalized_text,
+            chunks=chunks,
+            created_at=self._clock.now(),
+            profile=profile,
+        )
 
-    def _create_chunks(self, resume_id: str, text: str) -> list[ResumeChunk]:
-        if not text:
-            return []
-        parts = self._splitter.split_text(text)
+    def _restore_resume(
+        self, resume_id: str, file: UploadedFile, chunks: list[ResumeChunk]
+    ) -> ResumeDocument:
+        grouped: dict[str, list[str]] = {}
+        for chunk in chunks:
+            grouped.setdefault(chunk.metadata.get("section", ""), []).append(chunk.text)
+        sections = {
+            section: join_chunks(texts, self._chunk_overlap) for section, texts in grouped.items()
+        }
+        profile = replace(ResumeProfile.from_metadata(chunks[0].metadata), sections=sections)
+        return ResumeDocument(
+            resume_id=resume_id,
+            filename=file.filename,
+            content_type=file.content_type,
+            language="auto",
+            extracted_text="\n".join(sections.values()),
+            chunks=chunks,
+            created_at=self._clock.now(),
+            profile=profile,
+        )
+
+    def _create_chunks(
+        self,
+        resume_id: str,
+        request_id: str,
+        profile: ResumeProfile,
+        filename: str = "",
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> list[ResumeChunk]:
+        profile_metadata = profile.to_metadata()
         chunks: list[ResumeChunk] = []
-        for index, chunk_text in enumerate(parts):
-            chunk = ResumeChunk(
-                chunk_id=str(uuid4()),
-                text=chunk_text,
-                metadata={"resume_id": resume_id, "position": str(index)},
-            )
-            chunks.append(chunk)
+        for section, section_text in profile.sections.items():
+            for chunk_text in self._splitter.split_text(section_text):
+                position = str(len(chunks))
+                chunk = ResumeChunk(
+                    chunk_id=chunk_id_for(tenant_id, resume_id, position),
+                    text=chunk_text,
+                    metadata={
+                        "tenant_id": tenant_id,
+                        "resume_id": resume_id,
+                        "request_id": request_id,
+                        "position": position,
+                        "section": section,
+                        "filename": filename,
+                        **profile_metadata,
+                    },
+                )
+                chunks.append(chunk)
         return chunks
 
-    async def _generate_summaries(self, resumes: Iterable[ResumeDocument]) -> list[ResumeSummary]:
+    async def _answer_query(self, query: str, resumes: list[ResumeDocument]) -> dict:
+        index = CandidateIndex.from_chunks(chunk for resume in resumes for chunk in resume.chunks)
+        plan = self._query_planner.plan(query)
+        if plan.mode is QueryMode.LLM:
+            return await self._llm_answer(query, resumes)
+
+        matches = index.match(plan.criteria)
+        if plan.mode is QueryMode.FILTER or not matches:
+            return self._filter_answer(matches, resumes)
+
+        shortlisted_ids = {match.resume_id for match in matches}
+        shortlisted = [resume for resume in resumes if resume.resume_id in shortlisted_ids]
+        return await self._llm_answer(query, shortlisted)
+
+    async def _llm_answer(self, query: str, resumes: list[ResumeDocument]) -> dict:
+        focused = await self._focus(query, resumes)
+        if resumes and not focused:
+            return {
+                "answer": "No resume content is relevant to the query.",
+                "justifications": [],
+                "referenced_resumes": [],
+            }
+        return await self._llm_service.answer_query(query, focused)
+
+    async def _focus(self, query: str, resumes: list[ResumeDocument]) -> list[ResumeDocument]:
+        """Narrow each resume to its reranked chunks, dropping resumes with none left.
+
+        Each resume is reranked on its own, so the reranker's ``top_k`` applies per resume
+        and one resume's chunks cannot crowd another out of the context.
+        """
+
+        if self._reranker is None:
+            return resumes
+        with self._tracer.span("process_resumes.rerank", resume_count=len(resumes)):
+            ranked = await asyncio.gather(
+                *(self._reranker.rerank(query, resume.chunks) for resume in resumes)
+            )
+        return [
+            replace(
+                resume,
+                extracted_text="\n\n".join(chunk.text for chunk in chunks),
+                chunks=chunks,
+            )
+            for resume, chunks in zip(resumes, ranked, strict=True)
+            if chunks
+        ]
+
+    def _filter_answer(
+        self, matches: list[CandidateMatch], resumes: list[ResumeDocument]
+    ) -> dict:
+        if not matches:
+            return {
+                "answer": "No candidate matches the requested criteria.",
+                "justifications": [],
+                "referenced_resumes": [],
+            }
+        filenames = [self._find_filename(resumes, match.resume_id) for match in matches]
+        justifications = []
+        for filename, match in zip(filenames, matches, strict=True):
+            evidence = [*match.matched_skills, *match.matched_keywords]
+            if match.years_of_experience is not None:
+                evidence.append(f"{match.years_of_experience:g} years of experience")
+            justifications.append(f"{filename}: {', '.join(evidence)}")
+        return {
+            "answer": f"{len(matches)} candidate(s) match the criteria: {', '.join(filenames)}.",
+            "justifications": justifications,
+            "referenced_resumes": [match.resume_id for match in matches],
+        }
+
+    async def generate_summaries(self, resumes: Iterable[ResumeDocument]) -> list[ResumeSummary]:
+        """Summarize each resume with the LLM."""
+
         summaries: list[ResumeSummary] = []
         for resume in resumes:
             summary = await self._llm_service.summarize_resume(resume)
@@ -143,15 +482,18 @@ class ProcessResumesUseCase:
                     "resume_id": summary.resume_id,
                     "filename": summary.filename,
                     "highlights": summary.highlights,
+                    "complete": summary.complete,
                 }
                 for summary in response.summaries
-            ]
+            ],
+            "complete": response.complete,
         }
         if response.query_answer:
             result_payload["query_answer"] = {
                 "answer": response.query_answer.answer,
                 "justifications": response.query_answer.justifications,
                 "referenced_resumes": response.query_answer.referenced_resumes,
+                "complete": response.query_answer.complete,
             }
 
         log = AuditLog(
@@ -160,6 +502,7 @@ class ProcessResumesUseCase:
             timestamp=timestamp,
             query=request.query,
             result=result_payload,
+            tenant_id=request.tenant_id,
         )
         await self._audit_repository.save(log)
 
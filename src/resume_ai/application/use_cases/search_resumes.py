@@ -0,0 +1,193 @@
+"""Use case answering hiring queries over the already indexed resume corpus."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, replace
+
+from resume_ai.application.dto.resume_request import QueryAnswerResponse
+from resume_ai.application.dto.resume_search import (
+    ChunkFilter,
+    ResumeMatch,
+    SearchResumesRequest,
+    SearchResumesResponse,
+)
+from resume_ai.application.interfaces.audit_repository import AuditRepository
+from resume_ai.application.interfaces.clock import Clock
+from resume_ai.application.interfaces.llm_service import LLMService
+from resume_ai.application.interfaces.metrics import MetricsRecorder, NullMetricsRecorder
+from resume_ai.application.interfaces.reranker import Reranker
+from resume_ai.application.interfaces.tracer import NullTracer, Tracer
+from resume_ai.application.interfaces.vector_store import VectorStore
+from resume_ai.application.services.candidate_filter import QueryPlanner
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.domain.models.resume import ResumeChunk, ResumeDocument, ResumeProfile
+from resume_ai.domain.services.resume_parser import KNOWN_SKILLS
+
+# Chunks retrieved per requested resume, so several chunks of one resume can be grouped.
+CHUNKS_PER_RESUME = 5
+MAX_SNIPPETS = 3
+
+
+class SearchResumesUseCase:
+    """Retrieves indexed chunks for a query and groups them by resume.
+
+    Skills and minimum experience stated in the query become retrieval filters unless
+    the request supplies its own. Answering costs one query embedding, one vector
+    search and, only when requested, one LLM call over the retrieved chunks. With a
+    reranker, the retrieved chunks are reordered and cut before grouping, so the matches
+    and the LLM context only keep the chunks the reranker judged relevant.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        llm_service: LLMService,
+        audit_repository: AuditRepository,
+        clock: Clock,
+        query_planner: QueryPlanner | None = None,
+        metrics: MetricsRecorder | None = None,
+        tracer: Tracer | None = None,
+        reranker: Reranker | None = None,
+    ) -> None:
+        self._vector_store = vector_store
+        self._llm_service = llm_service
+        self._audit_repository = audit_repository
+        self._clock = clock
+        self._query_planner = query_planner or QueryPlanner()
+        self._metrics = metrics or NullMetricsRecorder()
+        self._tracer = tracer or NullTracer()
+        self._reranker = reranker
+
+    async def execute(self, request: SearchResumesRequest) -> SearchResumesResponse:
+        """Search the corpus and optionally answer the query with the LLM."""
+
+        if not request.query.strip():
+            raise ValueError("A search query is required.")
+
+        with self._tracer.span(
+            "search_resumes.execute",
+            request_id=request.request_id,
+            user_id=request.user_id,
+            answer=request.answer,
+        ):
+            return await self._execute(request)
+
+    async def _execute(self, request: SearchResumesRequest) -> SearchResumesResponse:
+        filters = self._effective_filters(request)
+        with self._metrics.stage("search"):
+            chunks = await self._vector_store.query(
+                request.query,
+                limit=request.limit * CHUNKS_PER_RESUME,
+                filters=filters,
+                tenant_id=request.tenant_id,
+            )
+        if self._reranker is not None and chunks:
+            with self._tracer.span("search_resumes.rerank", candidates=len(chunks)):
+                chunks = await self._reranker.rerank(request.query, chunks)
+        grouped = self._group_by_resume(chunks, request.limit)
+
+        query_answer = None
+        if request.answer and grouped:
+            with self._metrics.stage("answer"):
+                payload = await self._llm_service.answer_query(
+                    request.query, [self._to_document(resume_chunks) for resume_chunks in grouped]
+                )
+            query_answer = QueryAnswerResponse(
+                request_id=request.request_id,
+                answer=payload.get("answer", ""),
+                justifications=payload.get("justifications", []),
+                referenced_resumes=payload.get("referenced_resumes", []),
+            )
+
+        response = SearchResumesResponse(
+            request_id=request.request_id,
+            matches=[self._to_match(resume_chunks) for resume_chunks in grouped],
+            query_answer=query_answer,
+        )
+        with self._metrics.stage("audit"):
+            await self._persist_audit_log(request, filters, response)
+        return response
+
+    def _effective_filters(self, request: SearchResumesRequest) -> ChunkFilter:
+        criteria = self._query_planner.plan(request.query).criteria
+        # Aliases such as "k8s" name the canonical skill; the store matches any case.
+        filters = replace(
+            request.filters,
+            skills=tuple(KNOWN_SKILLS.get(skill.lower(), skill) for skill in request.filters.skills),
+        )
+        if not filters.skills and criteria.skills:
+            filters = replace(
+                filters, skills=criteria.skills, match_any_skill=criteria.match_any_skill
+            )
+        if filters.min_years is None and criteria.min_years is not None:
+            filters = replace(filters, min_years=criteria.min_years)
+        return filters
+
+    @staticmethod
+    def _group_by_resume(chunks: list[ResumeChunk], limit: int) -> list[list[ResumeChunk]]:
+        grouped: dict[str, list[ResumeChunk]] = {}
+        for chunk in chunks:
+            resume_id = chunk.metadata.get("resume_id", "")
+            if resume_id not in grouped and len(grouped) >= limit:
+                continue
+            grouped.setdefault(resume_id, []).append(chunk)
+        return list(grouped.values())
+
+    @staticmethod
+    def _to_match(chunks: list[ResumeChunk]) -> ResumeMatch:
+        best = chunks[0]
+        profile = ResumeProfile.from_metadata(best.metadata)
+        return ResumeMatch(
+            resume_id=best.metadata.get("resume_id", ""),
+            filename=best.metadata.get("filename") or "unknown",
+            score=float(best.metadata.get("score") or 0.0),
+            skills=profile.skills,
+            years_of_experience=profile.years_of_experience,
+            snippets=[chunk.text for chunk in chunks[:MAX_SNIPPETS]],
+        )
+
+    def _to_document(self, chunks: list[ResumeChunk]) -> ResumeDocument:
+        best = chunks[0]
+        return ResumeDocument(
+            resume_id=best.metadata.get("resume_id", ""),
+            filename=best.metadata.get("filename") or "unknown",
+            content_type="",
+            language="auto",
+            # Only the retrieved chunks are sent, keeping the LLM context focused and small.
+            extracted_text="\n\n".join(chunk.text for chunk in chunks),
+            chunks=chunks,
+            created_at=self._clock.now(),
+            profile=ResumeProfile.from_metadata(best.metadata),
+        )
+
+    async def _persist_audit_log(
+        self,
+        request: SearchResumesRequest,
+        filters: ChunkFilter,
+        response: SearchResumesResponse,
+    ) -> None:
+        result: dict = {
+            "search": {
+                "filters": asdict(filters),
+                "matches": [
+                    {"resume_id": match.resume_id, "filename": match.filename, "score": match.score}
+                    for match in response.matches
+                ],
+            }
+        }
+        if response.query_answer:
+            result["query_answer"] = {
+                "answer": response.query_answer.answer,
+                "justifications": response.query_answer.justifications,
+                "referenced_resumes": response.query_answer.referenced_resumes,
+            }
+        await self._audit_repository.save(
+            AuditLog(
+                request_id=request.request_id,
+                user_id=request.user_id,
+                timestamp=self._clock.now(),
+                query=request.query,
+                result=result,
+                tenant_id=request.tenant_id,
+            )
+        )
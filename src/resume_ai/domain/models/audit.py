@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
+
 
 @dataclass(frozen=True)
 class AuditLog:
@@ -13,4 +15,5 @@ class AuditLog:
     timestamp: datetime
     query: str | None
     result: dict
+    tenant_id: str = DEFAULT_TENANT_ID
 
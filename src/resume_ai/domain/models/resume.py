@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List
 
+LIST_SEPARATOR = "|"
+
 
 @dataclass(frozen=True)
 class ResumeChunk:
@@ -14,6 +16,41 @@ class ResumeChunk:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class ResumeProfile:
+    """Structured fields extracted deterministically from the resume text."""
+
+    sections: dict[str, str] = field(default_factory=dict)
+    skills: list[str] = field(default_factory=list)
+    years_of_experience: float | None = None
+    titles: list[str] = field(default_factory=list)
+    dates: list[str] = field(default_factory=list)
+
+    def to_metadata(self) -> dict[str, str]:
+        """Return the filterable fields flattened into chunk metadata."""
+
+        metadata = {
+            "skills": LIST_SEPARATOR.join(self.skills),
+            "titles": LIST_SEPARATOR.join(self.titles),
+            "dates": LIST_SEPARATOR.join(self.dates),
+        }
+        if self.years_of_experience is not None:
+            metadata["years_of_experience"] = f"{self.years_of_experience:g}"
+        return metadata
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, str]) -> "ResumeProfile":
+        """Rebuild the filterable fields from chunk metadata."""
+
+        years = metadata.get("years_of_experience")
+        return cls(
+            skills=[item for item in metadata.get("skills", "").split(LIST_SEPARATOR) if item],
+            years_of_experience=float(years) if years else None,
+            titles=[item for item in metadata.get("titles", "").split(LIST_SEPARATOR) if item],
+            dates=[item for item in metadata.get("dates", "").split(LIST_SEPARATOR) if item],
+        )
+
+
 @dataclass(frozen=True)
 class ResumeDocument:
     """Normalized resume representation after OCR."""
@@ -25,6 +62,7 @@ class ResumeDocument:
     extracted_text: str
     chunks: List[ResumeChunk]
     created_at: datetime
+    profile: ResumeProfile = field(default_factory=ResumeProfile)
 
 
 @dataclass(frozen=True)
@@ -34,4 +72,3 @@ class ResumeSummary:
     resume_id: str
     summary: str
     highlights: list[str]
-
@@ -0,0 +1,354 @@
+"""Deterministic resume parser extracting sections and structured fields."""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+
+from resume_ai.domain.models.resume import ResumeProfile
+
+DEFAULT_SECTION = "contact"
+
+SECTION_HEADINGS: dict[str, tuple[str, ...]] = {
+    "contact": (
+        "contact",
+        "contact information",
+        "contact info",
+        "personal information",
+        "personal details",
+        "contato",
+        "dados pessoais",
+        "contacto",
+    ),
+    "summary": (
+        "summary",
+        "professional summary",
+        "profile",
+        "about",
+        "about me",
+        "objective",
+        "resumo",
+        "perfil",
+        "objetivo",
+        "sobre mim",
+    ),
+    "skills": (
+        "skills",
+        "technical skills",
+        "core skills",
+        "core competencies",
+        "competencies",
+        "technologies",
+        "tech stack",
+        "tools",
+        "habilidades",
+        "competências",
+        "competencias",
+        "tecnologias",
+    ),
+    "experience": (
+        "experience",
+        "work experience",
+        "professional experience",
+        "employment",
+        "employment history",
+        "work history",
+        "experiência",
+        "experiência profissional",
+        "experiencia",
+        "experiencia profesional",
+    ),
+    "education": (
+        "education",
+        "academic background",
+        "certifications",
+        "education and certifications",
+        "formação",
+        "formação acadêmica",
+        "educação",
+        "educación",
+        "formación",
+    ),
+}
+
+KNOWN_SKILLS: dict[str, str] = {
+    "python": "Python",
+    "java": "Java",
+    "javascript": "JavaScript",
+    "typescript": "TypeScript",
+    "go": "Go",
+    "golang": "Go",
+    "rust": "Rust",
+    "c++": "C++",
+    "c#": "C#",
+    "ruby": "Ruby",
+    "php": "PHP",
+    "kotlin": "Kotlin",
+    "swift": "Swift",
+    "scala": "Scala",
+    "sql": "SQL",
+    "kubernetes": "Kubernetes",
+    "k8s": "Kubernetes",
+    "docker": "Docker",
+    "terraform": "Terraform",
+    "aws": "AWS",
+    "azure": "Azure",
+    "gcp": "GCP",
+    "linux": "Linux",
+    "react": "React",
+    "angular": "Angular",
+    "vue": "Vue",
+    "node.js": "Node.js",
+    "nodejs": "Node.js",
+    "django": "Django",
+    "flask": "Flask",
+    "fastapi": "FastAPI",
+    "spring": "Spring",
+    "postgresql": "PostgreSQL",
+    "postgres": "PostgreSQL",
+    "mysql": "MySQL",
+    "mongodb": "MongoDB",
+    "redis": "Redis",
+    "kafka": "Kafka",
+    "rabbitmq": "RabbitMQ",
+    "elasticsearch": "Elasticsearch",
+    "graphql": "GraphQL",
+    "spark": "Spark",
+    "airflow": "Airflow",
+    "pandas": "Pandas",
+    "pytorch": "PyTorch",
+    "tensorflow": "TensorFlow",
+    "machine learning": "Machine Learning",
+    "git": "Git",
+    "ci/cd": "CI/CD",
+}
+
+# "go" is a common verb, so prose mentions only count in their capitalised form.
+_CASE_SENSITIVE_SKILLS = {"go": "Go"}
+
+_HEADING_LOOKUP = {
+    alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases
+}
+
+_SKILL_PATTERN = re.compile(
+    r"(?<![\w+#.])("
+    + "|".join(re.escape(alias) for alias in sorted(KNOWN_SKILLS, key=len, reverse=True))
+    + r")(?![\w+#]|\.\w)",
+    re.IGNORECASE,
+)
+
+_MONTHS = {
+    "jan": 1,
+    "ene": 1,
+    "feb": 2,
+    "fev": 2,
+    "mar": 3,
+    "apr": 4,
+    "abr": 4,
+    "may": 5,
+    "mai": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "ago": 8,
+    "sep": 9,
+    "set": 9,
+    "oct": 10,
+    "out": 10,
+    "nov": 11,
+    "dec": 12,
+    "dez": 12,
+    "dic": 12,
+}
+
+
+def _date_pattern(prefix: str) -> str:
+    return (
+        rf"(?:(?P<{prefix}_month>[A-Za-zçÇ]{{3,9}})\.?\s+|(?P<{prefix}_num>\d{{1,2}})/)?"
+        rf"(?P<{prefix}_year>(?:19|20)\d{{2}})"
+    )
+
+
+_DATE_RANGE_PATTERN = re.compile(
+    _date_pattern("start")
+    + r"\s*(?:-|–|—|to|until|até|a|hasta)\s*(?:"
+    + _date_pattern("end")
+    + r"|(?P<present>present|current|now|today|atual|presente|hoje|actualidad))",
+    re.IGNORECASE,
+)
+
+# Only stated experience counts: "8+ years of experience", "10 anos de experiência".
+_YEARS_PATTERN = re.compile(
+    r"(\d{1,2}(?:[.,]\d)?)\s*\+?\s*(?:years?|yrs?|anos|años)\s+(?:of\s+|de\s+)?"
+    r"(?:[a-zà-ÿ-]+\s+)?(?:experience|experiência|experiencia)",
+    re.IGNORECASE,
+)
+
+_TITLE_PATTERN = re.compile(
+    r"\b(engineer|developer|programmer|manager|analyst|architect|lead|designer|consultant|"
+    r"scientist|intern|director|specialist|administrator|devops|sre|cto|head|"
+    r"engenheiro|engenheira|desenvolvedor|desenvolvedora|analista|gerente|arquiteto|"
+    r"ingeniero|desarrollador|consultor)\b",
+    re.IGNORECASE,
+)
+
+_TITLE_SEPARATORS = re.compile(r"\s+(?:at|@|em|en)\s+|\s+[-–—|]\s+|,\s*")
+_SKILL_ITEM_SEPARATORS = re.compile(r"[,;|•·\n]|\s+-\s+")
+_MAX_SKILL_LENGTH = 40
+_MAX_TITLE_WORDS = 10
+
+
+def find_skills(text: str) -> list[str]:
+    """Return canonical names of known skills mentioned in the text."""
+
+    found: dict[str, None] = {}
+    for match in _SKILL_PATTERN.finditer(text):
+        alias = match.group(1)
+        canonical_case = _CASE_SENSITIVE_SKILLS.get(alias.lower())
+        if canonical_case is not None and alias != canonical_case:
+            continue
+        found.setdefault(KNOWN_SKILLS[alias.lower()], None)
+    return list(found)
+
+
+class ResumeParser:
+    """Splits resume text into sections and extracts filterable fields."""
+
+    def parse(self, text: str, reference_date: datetime) -> ResumeProfile:
+        """Return the structured profile for the supplied resume text."""
+
+        sections = self.split_sections(text)
+        # Without an experience heading, date ranges may well be degrees, not jobs.
+        experience = sections.get("experience", "")
+        intervals, dates = self._extract_date_ranges(experience, reference_date)
+        return ResumeProfile(
+            sections=sections,
+            skills=self._extract_skills(sections.get("skills", ""), text),
+            years_of_experience=self._extract_years(text, intervals),
+            titles=self._extract_titles(experience),
+            dates=dates,
+        )
+
+    @staticmethod
+    def split_sections(text: str) -> dict[str, str]:
+        """Group lines under the closest preceding recognised heading."""
+
+        buckets: dict[str, list[str]] = {}
+        current = DEFAULT_SECTION
+        for line in text.splitlines():
+            heading = _match_heading(line)
+            if heading is not None:
+                current, inline = heading
+                buckets.setdefault(current, [])
+                if inline:
+                    buckets[current].append(inline)
+                continue
+            buckets.setdefault(current, []).append(line)
+        return {
+            section: "\n".join(lines).strip()
+            for section, lines in buckets.items()
+            if "\n".join(lines).strip()
+        }
+
+    @staticmethod
+    def _extract_skills(skills_section: str, text: str) -> list[str]:
+        found: dict[str, str] = {}
+        for item in _SKILL_ITEM_SEPARATORS.split(skills_section):
+            cleaned = item.strip(" \t*-:.")
+            if not cleaned or len(cleaned) > _MAX_SKILL_LENGTH:
+                continue
+            canonical = KNOWN_SKILLS.get(cleaned.lower(), cleaned)
+            found.setdefault(canonical.lower(), canonical)
+        for skill in find_skills(text):
+            found.setdefault(skill.lower(), skill)
+        return list(found.values())
+
+    @staticmethod
+    def _extract_years(text: str, intervals: list[tuple[int, int]]) -> float | None:
+        stated = [
+            float(match.group(1).replace(",", "."))
+            for match in _YEARS_PATTERN.finditer(text)
+            if float(match.group(1).replace(",", ".")) <= 50
+        ]
+        computed = _merged_months(intervals) / 12 if intervals else None
+        candidates = [value for value in (*stated, computed) if value is not None]
+        if not candidates:
+            return None
+        return round(max(candidates), 1)
+
+    @staticmethod
+    def _extract_date_ranges(
+        text: str, reference_date: datetime
+    ) -> tuple[list[tuple[int, int]], list[str]]:
+        intervals: list[tuple[int, int]] = []
+        dates: list[str] = []
+        reference_month = reference_date.year * 12 + reference_date.month - 1
+        for match in _DATE_RANGE_PATTERN.finditer(text):
+            start = _month_index(match, "start", default_month=1)
+            if match.group("present"):
+                end = reference_month
+                end_label = "present"
+            else:
+                end = _month_index(match, "end", default_month=12)
+                end_label = _format_month(end)
+            if end < start or end > reference_month + 12:
+                continue
+            intervals.append((start, end))
+            dates.append(f"{_format_month(start)}/{end_label}")
+        return intervals, dates
+
+    @staticmethod
+    def _extract_titles(experience: str) -> list[str]:
+        titles: dict[str, str] = {}
+        for line in experience.splitlines():
+            without_dates = _DATE_RANGE_PATTERN.sub("", line).strip(" \t*-•:|()")
+            if not without_dates or len(without_dates.split()) > _MAX_TITLE_WORDS:
+                continue
+            for segment in _TITLE_SEPARATORS.split(without_dates):
+                segment = segment.strip(" \t*-•:|()")
+                if segment and _TITLE_PATTERN.search(segment):
+                    titles.setdefault(segment.lower(), segment)
+                    break
+        return list(titles.values())
+
+
+def _match_heading(line: str) -> tuple[str, str] | None:
+    stripped = line.strip().strip("#*•=_ ")
+    if not stripped:
+        return None
+    head, _, inline = stripped.partition(":")
+    section = _HEADING_LOOKUP.get(head.strip().lower())
+    if section is None:
+        return None
+    return section, inline.strip()
+
+
+def _month_index(match: re.Match[str], prefix: str, default_month: int) -> int:
+    year = int(match.group(f"{prefix}_year"))
+    month = default_month
+    number = match.group(f"{prefix}_num")
+    name = match.group(f"{prefix}_month")
+    if number and 1 <= int(number) <= 12:
+        month = int(number)
+    elif name and name[:3].lower() in _MONTHS:
+        month = _MONTHS[name[:3].lower()]
+    return year * 12 + month - 1
+
+
+def _format_month(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _merged_months(intervals: list[tuple[int, int]]) -> int:
+    total = 0
+    current_start, current_end = None, None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end + 1:
+            if current_end is not None and current_start is not None:
+                total += current_end - current_start + 1
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None and current_start is not None:
+        total += current_end - current_start + 1
+    return total
@@ -0,0 +1,30 @@
+"""Value object representing the time budget of a request."""
+
+import math
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point on the monotonic clock after which a request's results are no longer wanted."""
+
+    expires_at: float = math.inf
+
+    @classmethod
+    def after(cls, seconds: float | None) -> "Deadline":
+        """Return a deadline ``seconds`` from now, or one that never expires for ``None``."""
+
+        if seconds is None:
+            return cls()
+        return cls(expires_at=time.monotonic() + seconds)
+
+    def remaining(self) -> float | None:
+        """Return the seconds left, ``None`` when unbounded and ``0`` once expired."""
+
+        if math.isinf(self.expires_at):
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
@@ -0,0 +1,22 @@
+"""Identifier of the tenant owning resumes and audit entries."""
+
+import re
+
+# Data written before tenancy belongs to this tenant, as do requests naming none.
+DEFAULT_TENANT_ID = "default"
+
+_TENANT_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,63}")
+
+
+def parse_tenant_id(value: str | None) -> str:
+    """Return ``value`` as a tenant id, the default one when it is empty.
+
+    Raises ``ValueError`` unless it is 1-64 letters, digits, ``_``, ``.`` or ``-``.
+    """
+
+    if value is None or not value.strip():
+        return DEFAULT_TENANT_ID
+    tenant_id = value.strip()
+    if not _TENANT_ID_PATTERN.fullmatch(tenant_id):
+        raise ValueError("Invalid tenant id.")
+    return tenant_id
@@ -1,18 +1,49 @@
 """Value object representing an uploaded resume file."""
 
+import hashlib
 from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO
+
+HASH_READ_SIZE = 1024 * 1024
 
 
 @dataclass(frozen=True)
 class UploadedFile:
-    """Immutable representation of a user-supplied resume file."""
+    """Immutable representation of a user-supplied resume file.
+
+    The content is either held in memory (``data``) or referenced on disk (``path``)
+    so large uploads do not have to be materialised as bytes.
+    """
 
     filename: str
     content_type: str
-    data: bytes
+    data: bytes = b""
+    path: str | None = None
+    size: int | None = None
+    sha256: str | None = None
 
     def extension(self) -> str:
         """Return file extension in lower case."""
 
         return self.filename.split(".")[-1].lower()
 
+    def open(self) -> BinaryIO:
+        """Return a binary stream over the file content."""
+
+        if self.path is not None:
+            return open(self.path, "rb")
+        return BytesIO(self.data)
+
+    def content_hash(self) -> str:
+        """Return the SHA-256 hex digest of the file content."""
+
+        if self.sha256 is not None:
+            return self.sha256
+        if self.path is None:
+            return hashlib.sha256(self.data).hexdigest()
+        digest = hashlib.sha256()
+        with self.open() as stream:
+            while block := stream.read(HASH_READ_SIZE):
+                digest.update(block)
+        return digest.hexdigest()
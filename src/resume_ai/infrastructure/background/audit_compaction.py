@@ -0,0 +1,70 @@
+"""Periodic compaction of aged audit logs into the archive tier."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Protocol
+
+from resume_ai.application.interfaces.clock import Clock
+from resume_ai.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CompactableAuditStore(Protocol):
+    """Audit store able to archive entries older than its hot window."""
+
+    async def compact(self, now: datetime, batch_size: int = 500) -> int:
+        """Archive aged entries and return how many were moved."""
+
+
+class AuditCompactionWorker:
+    """Runs audit compaction on a fixed interval for the lifetime of the app."""
+
+    def __init__(
+        self,
+        store: CompactableAuditStore,
+        clock: Clock,
+        interval_seconds: float = 3600.0,
+        batch_size: int = 500,
+    ) -> None:
+        self._store = store
+        self._clock = clock
+        self._interval = interval_seconds
+        self._batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Schedule the compaction loop on the running event loop."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="audit-compaction")
+
+    async def stop(self) -> None:
+        """Cancel the compaction loop."""
+
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Compact once and return the number of archived entries."""
+
+        compacted = await self._store.compact(self._clock.now(), batch_size=self._batch_size)
+        if compacted:
+            logger.info("audit_logs_compacted", count=compacted)
+        return compacted
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.run_once()
+            except Exception as exc:  # noqa: BLE001 - retried on the next interval
+                logger.warning("audit_compaction_failed", error=str(exc))
@@ -1,7 +1,9 @@
 """Application settings management."""
 
+import os
+import tempfile
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 
 from pydantic import Field, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +19,21 @@ class AppSettings(BaseSettings):
     allow_origins_raw: str = Field(default="*", alias="ALLOW_ORIGINS")
 
     mongodb_uri: str = Field(default="mongodb://localhost:27017/resume_ai", alias="MONGODB_URI")
+    audit_batch_size: int = Field(default=100, alias="AUDIT_BATCH_SIZE")
+    audit_flush_interval_seconds: float = Field(default=1.0, alias="AUDIT_FLUSH_INTERVAL_SECONDS")
+    audit_queue_size: int = Field(default=10_000, alias="AUDIT_QUEUE_SIZE")
+    audit_spill_path: str | None = Field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "resume-ai-audit-spill.jsonl"),
+        alias="AUDIT_SPILL_PATH",
+    )
+    audit_spill_max_bytes: int = Field(default=16 * 1024 * 1024, alias="AUDIT_SPILL_MAX_BYTES")
+    audit_hot_retention_days: int = Field(default=30, alias="AUDIT_HOT_RETENTION_DAYS")
+    audit_archive_retention_days: int = Field(default=0, alias="AUDIT_ARCHIVE_RETENTION_DAYS")
+    audit_compaction_interval_seconds: float = Field(
+        default=3600.0, alias="AUDIT_COMPACTION_INTERVAL_SECONDS"
+    )
+    audit_compaction_batch_size: int = Field(default=500, alias="AUDIT_COMPACTION_BATCH_SIZE")
+
     qdrant_url: HttpUrl = Field(default="http://localhost:6333", alias="QDRANT_URL")
 
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
@@ -25,13 +42,68 @@ class AppSettings(BaseSettings):
         default="text-embedding-3-large", alias="OPENAI_EMBEDDING_MODEL"
     )
 
+    rerank_model: str = Field(default="", alias="RERANK_MODEL")
+    rerank_top_k: int = Field(default=10, alias="RERANK_TOP_K")
+    rerank_min_score: float | None = Field(default=None, alias="RERANK_MIN_SCORE")
+    rerank_batch_size: int = Field(default=32, alias="RERANK_BATCH_SIZE")
+    rerank_cache_size: int = Field(default=10_000, alias="RERANK_CACHE_SIZE")
+
     ocr_language: str = Field(default="en", alias="OCR_LANGUAGE")
     ocr_use_gpu: bool = Field(default=False, alias="OCR_USE_GPU")
     ocr_model_dir: str | None = Field(default=None, alias="OCR_MODEL_DIR")
+    ocr_languages_raw: str = Field(default="", alias="OCR_LANGUAGES")
+    ocr_model_memory_budget_mb: int = Field(default=1024, alias="OCR_MODEL_MEMORY_BUDGET_MB")
+
+    max_upload_bytes: int = Field(default=20 * 1024 * 1024, alias="MAX_UPLOAD_BYTES")
+    max_request_bytes: int = Field(default=200 * 1024 * 1024, alias="MAX_REQUEST_BYTES")
+    upload_spool_dir: str | None = Field(default=None, alias="UPLOAD_SPOOL_DIR")
+    request_timeout_seconds: float | None = Field(default=None, alias="REQUEST_TIMEOUT_SECONDS")
+
+    admission_max_pages: int = Field(default=64, alias="ADMISSION_MAX_PAGES")
+    admission_max_tokens: int = Field(default=200_000, alias="ADMISSION_MAX_TOKENS")
+    admission_max_queue_depth: int = Field(default=100, alias="ADMISSION_MAX_QUEUE_DEPTH")
+    admission_max_queued_per_user: int = Field(default=10, alias="ADMISSION_MAX_QUEUED_PER_USER")
+    admission_tokens_per_page: int = Field(default=800, alias="ADMISSION_TOKENS_PER_PAGE")
+    admission_user_weights_raw: str = Field(default="", alias="ADMISSION_USER_WEIGHTS")
+
+    scheduler_ocr_slots: int = Field(default=4, alias="SCHEDULER_OCR_SLOTS")
+    scheduler_ocr_reserved_slots: int = Field(default=1, alias="SCHEDULER_OCR_RESERVED_SLOTS")
+    scheduler_llm_slots: int = Field(default=16, alias="SCHEDULER_LLM_SLOTS")
+    scheduler_llm_reserved_slots: int = Field(default=4, alias="SCHEDULER_LLM_RESERVED_SLOTS")
+    interactive_priority_token: str = Field(default="", alias="INTERACTIVE_PRIORITY_TOKEN")
+
+    warmup_on_startup: bool = Field(default=True, alias="WARMUP_ON_STARTUP")
+    warmup_timeout_seconds: float = Field(default=120.0, alias="WARMUP_TIMEOUT_SECONDS")
+    shutdown_drain_timeout_seconds: float = Field(
+        default=30.0, alias="SHUTDOWN_DRAIN_TIMEOUT_SECONDS"
+    )
+    readiness_timeout_seconds: float = Field(default=2.0, alias="READINESS_TIMEOUT_SECONDS")
+    readiness_cache_ttl_seconds: float = Field(default=5.0, alias="READINESS_CACHE_TTL_SECONDS")
+
+    tracing_enabled: bool = Field(default=False, alias="TRACING_ENABLED")
+    tracing_exporter: str = Field(default="file", alias="TRACING_EXPORTER")
+    tracing_file_path: str = Field(default="traces.jsonl", alias="TRACING_FILE_PATH")
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318/v1/traces", alias="TRACING_OTLP_ENDPOINT"
+    )
+    tracing_service_name: str = Field(default="resume-ai", alias="TRACING_SERVICE_NAME")
+
+    chunk_text_store: str = Field(default="mongo", alias="CHUNK_TEXT_STORE")
+    chunk_text_dir: str = Field(default="data/chunk_texts", alias="CHUNK_TEXT_DIR")
 
     vector_collection: str = Field(default="resumes", alias="VECTOR_COLLECTION")
     vector_similarity: str = Field(default="cosine", alias="VECTOR_SIMILARITY")
     vector_size: int = Field(default=3072, alias="VECTOR_SIZE")
+    vector_migration_target_model: str | None = Field(
+        default=None, alias="VECTOR_MIGRATION_TARGET_MODEL"
+    )
+    vector_migration_target_size: int | None = Field(
+        default=None, alias="VECTOR_MIGRATION_TARGET_SIZE"
+    )
+    vector_migration_batch_size: int = Field(default=128, alias="VECTOR_MIGRATION_BATCH_SIZE")
+    vector_migration_max_chunks_per_second: float = Field(
+        default=200.0, alias="VECTOR_MIGRATION_MAX_CHUNKS_PER_SECOND"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False
@@ -45,6 +117,28 @@ class AppSettings(BaseSettings):
             return ["*"]
         return [item.strip() for item in self.allow_origins_raw.split(",") if item.strip()]
 
+    @property
+    def ocr_languages(self) -> List[str]:
+        """Return the languages uploads may be written in, the default one first."""
+
+        languages = [self.ocr_language]
+        for item in self.ocr_languages_raw.split(","):
+            language = item.strip().lower()
+            if language and language not in languages:
+                languages.append(language)
+        return languages
+
+    @property
+    def admission_user_weights(self) -> Dict[str, float]:
+        """Return fair-queuing weights parsed from ``user=weight`` pairs."""
+
+        weights: Dict[str, float] = {}
+        for item in self.admission_user_weights_raw.split(","):
+            user_id, separator, weight = item.partition("=")
+            if separator and user_id.strip():
+                weights[user_id.strip()] = float(weight)
+        return weights
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
@@ -0,0 +1,107 @@
+"""Local cross-encoder reranker built on sentence-transformers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections import OrderedDict
+from dataclasses import replace
+from functools import partial
+from typing import Any, Sequence
+
+from resume_ai.application.interfaces.reranker import Reranker
+from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.observability.tracing import get_tracer
+
+metrics = get_metrics()
+
+DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+
+class CrossEncoderReranker(Reranker):
+    """Scores (query, chunk) pairs jointly with a small cross-encoder on the CPU.
+
+    Pairs not in the cache are scored in batches on the default executor, so the event
+    loop keeps serving while a request is reranked. Scores are cached per query and
+    chunk id, which makes repeated or paginated searches free. At most ``top_k`` chunks
+    scoring at least ``min_score`` are kept.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        top_k: int = 10,
+        min_score: float | None = None,
+        batch_size: int = 32,
+        cache_size: int = 10_000,
+        device: str = "cpu",
+        model: Any | None = None,
+    ) -> None:
+        if model is None:
+            try:
+                from sentence_transformers import CrossEncoder  # type: ignore[import-not-found]
+            except ImportError as exc:
+                raise RuntimeError(
+                    "sentence-transformers is not installed. Install the 'rerank' extra."
+                ) from exc
+            model = CrossEncoder(model_name, device=device)
+        self._model = model
+        self._top_k = top_k
+        self._min_score = min_score
+        self._batch_size = batch_size
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    async def rerank(self, query: str, chunks: Sequence[ResumeChunk]) -> list[ResumeChunk]:
+        scores = await self._scores(query, chunks)
+        ranked = sorted(
+            zip(scores, range(len(chunks)), chunks, strict=True),
+            key=lambda item: (-item[0], item[1]),
+        )
+        # Chunk metadata holds strings, as the vector store payloads do.
+        kept = [
+            replace(chunk, metadata={**chunk.metadata, "rerank_score": f"{score:.6f}"})
+            for score, _, chunk in ranked
+            if self._min_score is None or score >= self._min_score
+        ]
+        metrics.count("rerank_dropped", len(chunks) - min(len(kept), self._top_k))
+        return kept[: self._top_k]
+
+    async def _scores(self, query: str, chunks: Sequence[ResumeChunk]) -> list[float]:
+        scores: dict[str, float] = {}
+        missing: dict[str, str] = {}
+        for chunk in chunks:
+            cached = self._cache.get((query, chunk.chunk_id))
+            if cached is None:
+                missing[chunk.chunk_id] = chunk.text
+            else:
+                self._cache.move_to_end((query, chunk.chunk_id))
+                scores[chunk.chunk_id] = cached
+        metrics.count("rerank_cache_hits", len(scores))
+        if missing:
+            pairs = [(query, text) for text in missing.values()]
+            loop = asyncio.get_running_loop()
+            # Run in a copy of the caller's context so request-scoped timings reach the thread.
+            context = contextvars.copy_context()
+            with get_tracer().span("rerank.score", pairs=len(pairs)), metrics.stage("rerank"):
+                predicted = await loop.run_in_executor(
+                    None, partial(context.run, self._predict, pairs)
+                )
+            metrics.count("rerank_pairs_scored", len(pairs))
+            for chunk_id, score in zip(missing, predicted, strict=True):
+                scores[chunk_id] = score
+                self._remember((query, chunk_id), score)
+        return [scores[chunk.chunk_id] for chunk in chunks]
+
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        predicted = self._model.predict(
+            pairs, batch_size=self._batch_size, show_progress_bar=False
+        )
+        return [float(score) for score in predicted]
+
+    def _remember(self, key: tuple[str, str], score: float) -> None:
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
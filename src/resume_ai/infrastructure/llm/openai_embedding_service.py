@@ -5,17 +5,41 @@ from typing import Iterable, Sequence
 from langchain_openai import OpenAIEmbeddings
 
 from resume_ai.application.interfaces.embedding_service import EmbeddingService
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.observability.tracing import get_tracer
+
+metrics = get_metrics()
+
+# OpenAI tokenizers average roughly four characters per token for English text.
+CHARS_PER_TOKEN = 4
 
 
 class OpenAIEmbeddingService(EmbeddingService):
     """Uses OpenAI embedding models through LangChain."""
 
-    def __init__(self, api_key: str, model: str) -> None:
-        self._client = OpenAIEmbeddings(api_key=api_key, model=model)
+    def __init__(self, api_key: str, model: str, dimensions: int | None = None) -> None:
+        self._client = OpenAIEmbeddings(api_key=api_key, model=model, dimensions=dimensions)
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pools of the underlying OpenAI clients."""
+
+        # LangChain keeps the resource objects; their ``_client`` is the OpenAI client.
+        await self._client.async_client._client.close()
+        self._client.client._client.close()
 
     async def embed_documents(self, texts: Iterable[str]) -> Sequence[list[float]]:
-        return await self._client.aembed_documents(list(texts))
+        text_list = list(texts)
+        with get_tracer().span(
+            "embedding.embed_documents", text_count=len(text_list)
+        ), metrics.stage("embed_documents"):
+            embeddings = await self._client.aembed_documents(text_list)
+        metrics.count("embedding_texts", len(text_list))
+        metrics.count("embedding_tokens", sum(len(text) for text in text_list) / CHARS_PER_TOKEN)
+        return embeddings
 
     async def embed_query(self, text: str) -> list[float]:
-        return await self._client.aembed_query(text)
+        with metrics.stage("embed_query"):
+            embedding = await self._client.aembed_query(text)
+        metrics.count("embedding_tokens", len(text) / CHARS_PER_TOKEN)
+        return embedding
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Sequence
 
 from langchain_core.prompts import ChatPromptTemplate
@@ -10,13 +11,24 @@ from langchain_core.output_parsers import StrOutputParser
 from langchain_openai import ChatOpenAI
 
 from resume_ai.application.interfaces.llm_service import LLMService
+from resume_ai.application.services.workload_scheduler import WorkloadScheduler
 from resume_ai.domain.models.resume import ResumeDocument, ResumeSummary
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.observability.tracing import get_tracer
+
+metrics = get_metrics()
 
 
 class OpenAILLMService(LLMService):
-    """LangChain-based OpenAI integration."""
+    """LangChain-based OpenAI integration.
+
+    With a ``scheduler``, every call waits for a slot in the workload class of the request.
+    """
 
-    def __init__(self, api_key: str, model: str) -> None:
+    def __init__(
+        self, api_key: str, model: str, scheduler: WorkloadScheduler | None = None
+    ) -> None:
+        self._scheduler = scheduler
         self._model = ChatOpenAI(
             api_key=api_key,
             model=model,
@@ -67,11 +79,27 @@ class OpenAILLMService(LLMService):
             ]
         )
 
+    async def ping(self) -> None:
+        """Look up the configured model, which checks reachability and credentials."""
+
+        await self._model.root_async_client.models.retrieve(self._model.model_name)
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pools of the underlying OpenAI clients."""
+
+        await self._model.root_async_client.close()
+        self._model.root_client.close()
+
     async def summarize_resume(self, resume: ResumeDocument) -> ResumeSummary:
         messages = self._summary_prompt.format_messages(
             filename=resume.filename, content=resume.extracted_text
         )
-        raw = await self._model.ainvoke(messages)
+        async with self._call_slot():
+            with get_tracer().span(
+                "llm.summarize_resume", resume_id=resume.resume_id, model=self._model.model_name
+            ), metrics.stage("llm_summarize"):
+                raw = await self._model.ainvoke(messages)
+        self._record_usage(raw)
         content = await self._parser.ainvoke(raw)
         payload = self._safe_json(content)
         return ResumeSummary(
@@ -89,10 +117,25 @@ class OpenAILLMService(LLMService):
             context_lines.append(resume.extracted_text[:2000])
         joined_context = "\n---\n".join(context_lines)
         messages = self._qa_prompt.format_messages(query=query, context=joined_context)
-        raw = await self._model.ainvoke(messages)
+        async with self._call_slot():
+            with get_tracer().span(
+                "llm.answer_query", resume_count=len(resumes), model=self._model.model_name
+            ), metrics.stage("llm_answer"):
+                raw = await self._model.ainvoke(messages)
+        self._record_usage(raw)
         content = await self._parser.ainvoke(raw)
         return self._safe_json(content)
 
+    def _call_slot(self) -> AbstractAsyncContextManager[None]:
+        return self._scheduler.acquire() if self._scheduler is not None else nullcontext()
+
+    @staticmethod
+    def _record_usage(message: object) -> None:
+        usage = getattr(message, "usage_metadata", None) or {}
+        metrics.count("llm_calls")
+        metrics.count("llm_prompt_tokens", usage.get("input_tokens", 0))
+        metrics.count("llm_completion_tokens", usage.get("output_tokens", 0))
+
     @staticmethod
     def _safe_json(content: str) -> dict:
         try:
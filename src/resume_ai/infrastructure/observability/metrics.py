@@ -0,0 +1,91 @@
+"""Prometheus metrics and per-request stage timings."""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from time import perf_counter
+
+import structlog
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+
+from resume_ai.application.interfaces.metrics import MetricsRecorder
+
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+STAGE_SECONDS = Histogram(
+    "resume_ai_stage_seconds",
+    "Duration of pipeline and adapter stages.",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+PIPELINE_ITEMS = Counter(
+    "resume_ai_pipeline_items_total",
+    "Items processed by the pipeline (pages, chunks, tokens, ...).",
+    ["kind"],
+)
+REQUEST_SECONDS = Histogram(
+    "resume_ai_http_request_seconds",
+    "HTTP request latency.",
+    ["method", "route", "status"],
+    buckets=STAGE_BUCKETS,
+)
+
+_request_timings: contextvars.ContextVar[dict[str, float] | None] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+class PrometheusMetricsRecorder(MetricsRecorder):
+    """Feeds Prometheus histograms and the structlog context of the current request."""
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            STAGE_SECONDS.labels(stage=name).observe(elapsed)
+            timings = _request_timings.get()
+            if timings is not None:
+                key = f"{name}_ms"
+                timings[key] = round(timings.get(key, 0.0) + elapsed * 1000, 3)
+
+    def count(self, name: str, amount: float = 1.0) -> None:
+        PIPELINE_ITEMS.labels(kind=name).inc(amount)
+
+    @contextmanager
+    def request_scope(self) -> Iterator[dict[str, float]]:
+        """Collect stage timings of one request and expose them to structlog."""
+
+        # The dict is shared by reference, so stages running in executor threads with a
+        # copied context still add to it, and every log line of the request carries it.
+        timings: dict[str, float] = {}
+        token = _request_timings.set(timings)
+        structlog.contextvars.bind_contextvars(timings_ms=timings)
+        try:
+            yield timings
+        finally:
+            _request_timings.reset(token)
+
+    @staticmethod
+    def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+        """Record the latency of a completed HTTP request."""
+
+        REQUEST_SECONDS.labels(method=method, route=route, status=str(status)).observe(seconds)
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Return the Prometheus exposition payload and its content type."""
+
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+@lru_cache(maxsize=1)
+def get_metrics() -> PrometheusMetricsRecorder:
+    """Return the process-wide metrics recorder."""
+
+    return PrometheusMetricsRecorder()
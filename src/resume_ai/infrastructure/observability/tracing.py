@@ -0,0 +1,261 @@
+"""Lightweight OpenTelemetry-style tracing with file and OTLP/HTTP exporters."""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import queue
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+
+from resume_ai.application.interfaces.tracer import NullTracer, Tracer
+from resume_ai.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """A finished or in-flight unit of work."""
+
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    start_ns: int
+    end_ns: int = 0
+    status: str = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class SpanExporter(Protocol):
+    """Destination for batches of finished spans."""
+
+    def export(self, spans: list[Span]) -> None:
+        """Deliver the spans; called from the export thread."""
+
+    def shutdown(self) -> None:
+        """Release exporter resources."""
+
+
+class JsonLinesSpanExporter:
+    """Appends spans as JSON lines to a local file."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def export(self, spans: list[Span]) -> None:
+        with open(self._path, "a", encoding="utf-8") as target:
+            target.writelines(json.dumps(asdict(span), default=str) + "\n" for span in spans)
+
+    def shutdown(self) -> None:
+        return None
+
+
+class OTLPHttpSpanExporter:
+    """Posts spans to an OpenTelemetry collector using OTLP/HTTP JSON."""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0) -> None:
+        import httpx
+
+        self._endpoint = endpoint
+        self._service_name = service_name
+        self._client = httpx.Client(timeout=timeout)
+
+    def export(self, spans: list[Span]) -> None:
+        response = self._client.post(self._endpoint, json=self._encode(spans))
+        response.raise_for_status()
+
+    def shutdown(self) -> None:
+        self._client.close()
+
+    def _encode(self, spans: list[Span]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", self._service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "resume_ai"},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    "parentSpanId": span.parent_id or "",
+                                    "name": span.name,
+                                    "kind": 1,
+                                    "startTimeUnixNano": str(span.start_ns),
+                                    "endTimeUnixNano": str(span.end_ns),
+                                    "attributes": [
+                                        _otlp_attribute(key, value)
+                                        for key, value in span.attributes.items()
+                                    ],
+                                    "status": {"code": 2 if span.status == "error" else 1},
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+class BatchSpanProcessor:
+    """Queues finished spans and exports them in batches from a daemon thread."""
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_batch_size: int = 256,
+        flush_interval: float = 2.0,
+        max_queue_size: int = 10_000,
+    ) -> None:
+        self._exporter = exporter
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue[Span | None] = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        """Enqueue a finished span, dropping it if the queue is full."""
+
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            logger.warning("span_dropped", name=span.name)
+
+    def shutdown(self) -> None:
+        """Export pending spans and stop the thread."""
+
+        self._queue.put(None)
+        self._thread.join(timeout=self._flush_interval * 2)
+        self._exporter.shutdown()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: list[Span] = []
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            if batch:
+                try:
+                    self._exporter.export(batch)
+                except Exception as exc:  # noqa: BLE001 - tracing must never break requests
+                    logger.warning("span_export_failed", count=len(batch), error=str(exc))
+
+
+class RecordingTracer(Tracer):
+    """Records spans and hands them to a batch processor.
+
+    Every root span starts a random trace id, since client-supplied request ids may repeat
+    across requests. Children inherit ``request_id``, so a request's spans are found by
+    that attribute.
+    """
+
+    def __init__(self, processor: BatchSpanProcessor) -> None:
+        self._processor = processor
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[None]:
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id = parent.trace_id
+            if "request_id" in parent.attributes:
+                attributes.setdefault("request_id", parent.attributes["request_id"])
+        else:
+            trace_id = secrets.token_hex(16)
+        current = Span(
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            name=name,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(current)
+        try:
+            yield
+        except BaseException as exc:
+            current.status = "error"
+            current.attributes["exception"] = repr(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            current.end_ns = time.time_ns()
+            self._processor.on_end(current)
+
+    def shutdown(self) -> None:
+        """Flush and stop exporting."""
+
+        self._processor.shutdown()
+
+
+_tracer: Tracer = NullTracer()
+
+
+def configure_tracing(
+    enabled: bool,
+    exporter: str = "file",
+    file_path: str = "traces.jsonl",
+    otlp_endpoint: str = "http://localhost:4318/v1/traces",
+    service_name: str = "resume-ai",
+) -> Tracer:
+    """Install the process-wide tracer; a no-op tracer when disabled."""
+
+    global _tracer
+    if not enabled:
+        _tracer = NullTracer()
+        return _tracer
+    if exporter == "otlp":
+        span_exporter: SpanExporter = OTLPHttpSpanExporter(otlp_endpoint, service_name)
+    else:
+        span_exporter = JsonLinesSpanExporter(file_path)
+    _tracer = RecordingTracer(BatchSpanProcessor(span_exporter))
+    logger.info("tracing_enabled", exporter=exporter)
+    return _tracer
+
+
+def shutdown_tracing() -> None:
+    """Flush the process-wide tracer if it records spans."""
+
+    if isinstance(_tracer, RecordingTracer):
+        _tracer.shutdown()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+
+    return _tracer
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        typed: dict[str, Any] = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
@@ -0,0 +1,66 @@
+"""Cheap language identification of OCR output and PaddleOCR model selection."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+# PaddleOCR ships one recognition model per script family; these languages share one.
+RECOGNITION_GROUPS: dict[str, str] = {
+    **dict.fromkeys(("pt", "es", "fr", "it", "de", "nl", "ca", "gl", "ro"), "latin"),
+    **dict.fromkeys(("ru", "uk", "be", "bg", "sr"), "cyrillic"),
+    **dict.fromkeys(("ar", "fa", "ur"), "arabic"),
+    **dict.fromkeys(("hi", "mr", "ne"), "devanagari"),
+}
+
+# Frequent function words and resume vocabulary. They survive recognition by an English
+# model, which drops diacritics, so they still identify the language.
+STOPWORDS: dict[str, frozenset[str]] = {
+    "en": frozenset(
+        "the and with of for in to at experience skills education years work".split()
+    ),
+    "pt": frozenset(
+        "de da do das dos em com para uma um nao experiencia formacao anos trabalho".split()
+    ),
+    "es": frozenset(
+        "de del la el los las en con para una un y experiencia formacion anos trabajo".split()
+    ),
+    "fr": frozenset(
+        "de la le les des du et avec pour une un experience formation ans travail".split()
+    ),
+    "de": frozenset(
+        "der die das und mit fur von zu im eine ein erfahrung ausbildung jahre arbeit".split()
+    ),
+    "it": frozenset(
+        "di del della il la le e con per una un esperienza formazione anni lavoro".split()
+    ),
+}
+
+_WORD_PATTERN = re.compile(r"[a-zà-ÿ]+")
+_ACCENTS = str.maketrans("àáâãäçèéêëìíîïñòóôõöùúûü", "aaaaaceeeeiiiinooooouuuu")
+# Below this many stopword hits the text is too short or noisy to decide.
+MIN_STOPWORD_HITS = 3
+
+
+def recognition_group(language: str) -> str:
+    """Return the PaddleOCR recognition model that serves ``language``."""
+
+    return RECOGNITION_GROUPS.get(language, language)
+
+
+def detect_language(text: str, candidates: Iterable[str]) -> str | None:
+    """Return the candidate language whose stopwords dominate ``text``, if any does."""
+
+    words = _WORD_PATTERN.findall(text.lower().translate(_ACCENTS))
+    scores = {
+        language: sum(word in STOPWORDS[language] for word in words)
+        for language in candidates
+        if language in STOPWORDS
+    }
+    if not scores:
+        return None
+    best = max(scores, key=scores.__getitem__)
+    ranked = sorted(scores.values(), reverse=True)
+    if ranked[0] < MIN_STOPWORD_HITS or (len(ranked) > 1 and ranked[0] == ranked[1]):
+        return None
+    return best
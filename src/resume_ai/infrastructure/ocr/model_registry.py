@@ -0,0 +1,113 @@
+"""Lazily loaded OCR models kept within a memory budget."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from resume_ai.infrastructure.logging.logger import get_logger
+from resume_ai.infrastructure.observability.metrics import get_metrics
+
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+M = TypeVar("M")
+
+
+@dataclass
+class _Entry(Generic[M]):
+    model: M
+    size_bytes: int
+    users: int = 0
+
+
+class OCRModelRegistry(Generic[M]):
+    """Loads models by key on first use and evicts the least recently used ones.
+
+    ``loader`` returns a model with its estimated resident size. After each load, idle
+    unpinned models are evicted, least recently used first, until the total fits
+    ``memory_budget_bytes``. Models in use are never evicted, so the budget can be
+    exceeded briefly while several languages are being processed at once. Loads of
+    different keys run in parallel, and concurrent requests for one key share one load.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], tuple[M, int]],
+        memory_budget_bytes: int,
+        pinned: Collection[str] = (),
+    ) -> None:
+        self._loader = loader
+        self._budget = memory_budget_bytes
+        self._pinned = set(pinned)
+        self._entries: OrderedDict[str, _Entry[M]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    @property
+    def loaded(self) -> list[str]:
+        """Return the loaded keys, least recently used first."""
+
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    @contextmanager
+    def use(self, key: str) -> Iterator[M]:
+        """Yield the model for ``key``, loading it if needed, and protect it from eviction."""
+
+        entry = self._acquire(key)
+        try:
+            yield entry.model
+        finally:
+            with self._lock:
+                entry.users -= 1
+                self._evict_over_budget()
+
+    def _acquire(self, key: str) -> _Entry[M]:
+        with self._lock:
+            entry = self._checkout(key)
+            if entry is not None:
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            with self._lock:
+                entry = self._checkout(key)
+                if entry is not None:
+                    return entry
+            model, size_bytes = self._loader(key)
+            metrics.count("ocr_model_loads")
+            logger.info("ocr_model_loaded", model=key, size_mb=round(size_bytes / 2**20, 1))
+            with self._lock:
+                entry = _Entry(model=model, size_bytes=size_bytes, users=1)
+                self._entries[key] = entry
+                self._evict_over_budget()
+                return entry
+
+    def _checkout(self, key: str) -> _Entry[M] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.users += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def _evict_over_budget(self) -> None:
+        total = sum(entry.size_bytes for entry in self._entries.values())
+        for key in list(self._entries):
+            if total <= self._budget:
+                return
+            entry = self._entries[key]
+            if entry.users or key in self._pinned:
+                continue
+            del self._entries[key]
+            total -= entry.size_bytes
+            metrics.count("ocr_model_evictions")
+            logger.info("ocr_model_evicted", model=key, resident_mb=round(total / 2**20, 1))
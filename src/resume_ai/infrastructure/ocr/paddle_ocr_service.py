@@ -3,21 +3,58 @@
 from __future__ import annotations
 
 import asyncio
-from io import BytesIO
-from typing import Iterable
+import contextvars
+import os
+from functools import partial
+from typing import Any, Callable, Iterable, Sequence, Tuple, TypeVar
 
 import numpy as np
 
+from resume_ai.application.services.workload_scheduler import WorkloadScheduler
 from resume_ai.domain.value_objects.uploaded_file import UploadedFile
 from resume_ai.infrastructure.logging.logger import get_logger
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.observability.tracing import get_tracer
+from resume_ai.infrastructure.ocr.language import detect_language, recognition_group
+from resume_ai.infrastructure.ocr.model_registry import OCRModelRegistry
 
 logger = get_logger(__name__)
+metrics = get_metrics()
 
 
-class PaddleOCRService:
-    """Performs OCR using PaddleOCR."""
+# Used when a loaded model does not report the directory of its weights.
+DEFAULT_MODEL_BYTES = 150 * 2**20
+# Below this mean confidence the first page is retried with the other configured scripts.
+LOW_CONFIDENCE = 0.6
+
+Line = Tuple[str, float]
+T = TypeVar("T")
 
-    def __init__(self, language: str = "en", use_gpu: bool = False, model_dir: str | None = None):
+
+class PaddleOCRService:
+    """Performs OCR using PaddleOCR.
+
+    The first page of each file is read with the default model and its language is
+    identified from the text; the rest of the file is read with the recognizer for that
+    language. Recognizers are loaded on first use and evicted least recently used first
+    to stay within ``memory_budget_bytes``, while the text detector and angle classifier
+    of the default model serve every language. A model counts against the budget with
+    the size of its weight files on disk.
+
+    With a ``scheduler``, every page waits on the event loop for a slot in the workload
+    class of the request before it is handed to a thread, so interactive uploads overtake
+    bulk ingestion between two of its pages and waiting pages hold no executor thread.
+    """
+
+    def __init__(
+        self,
+        language: str = "en",
+        use_gpu: bool = False,
+        model_dir: str | None = None,
+        languages: Sequence[str] = (),
+        memory_budget_bytes: int = 1024 * 2**20,
+        scheduler: WorkloadScheduler | None = None,
+    ):
         try:
             from paddleocr import PaddleOCR
         except ImportError as exc:
@@ -25,70 +62,186 @@ class PaddleOCRService:
                 "PaddleOCR is not installed. Ensure paddleocr dependency is available."
             ) from exc
 
-        self._ocr = PaddleOCR(
-            use_angle_cls=True,
-            lang=language,
-            use_gpu=use_gpu,
-            det_db_box_thresh=0.3,
-            det_db_unclip_ratio=1.6,
-            show_log=False,
-            ocr_version="PP-OCRv4",
-            rec=True,
-            rec_char_type="en",
-            rec_model_dir=model_dir,
+        self._paddle = PaddleOCR
+        self._use_gpu = use_gpu
+        self._model_dir = model_dir
+        self._scheduler = scheduler
+        self._languages = list(dict.fromkeys([language, *languages]))
+        self._default_group = recognition_group(language)
+        self._groups = list(dict.fromkeys(map(recognition_group, self._languages)))
+        self._registry: OCRModelRegistry[Any] = OCRModelRegistry(
+            self._load_model, memory_budget_bytes, pinned={self._default_group}
         )
+        # Loaded eagerly so that warmup pays for it; it stays resident.
+        self._default: Any = None
+        with self._registry.use(self._default_group) as model:
+            self._default = model
 
     async def extract_text(self, file: UploadedFile) -> str:
-        """Extract text asynchronously."""
+        """Extract text asynchronously, one page per executor call."""
 
+        pages = iter(self._load_images(file))
+        lines: list[Line] = []
+        group = self._default_group
+        page_number = 0
+        try:
+            # Pages are rendered outside a slot and recognized inside one; a cancelled
+            # extraction stops after the running page instead of starting the next.
+            while (image := await self._in_thread(None, next, pages, None)) is not None:
+                page_number += 1
+                if page_number == 1:
+                    group, lines = await self._in_thread(
+                        self._scheduler, self._read_first_page, file.filename, image
+                    )
+                else:
+                    page_lines = await self._in_thread(
+                        self._scheduler, self._read_page, group, image, file.filename, page_number
+                    )
+                    lines.extend(page_lines)
+        except asyncio.CancelledError:
+            logger.info("ocr_cancelled", filename=file.filename, page=page_number)
+            metrics.count("ocr_cancelled")
+            raise
+        combined = "\n".join(text for text, _ in lines)
+        logger.info("extracted_text", filename=file.filename, length=len(combined), model=group)
+        return combined
+
+    @staticmethod
+    async def _in_thread(
+        scheduler: WorkloadScheduler | None, func: Callable[..., T], *args: Any
+    ) -> T:
+        if scheduler is not None:
+            return await scheduler.run(func, *args)
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._extract_sync, file)
-
-    def _extract_sync(self, file: UploadedFile) -> str:
-        images = list(self._load_images(file))
-        results: list[str] = []
-        for image in images:
-            ocr_result = self._ocr.ocr(image, cls=True)
-            if not ocr_result:
+        # Run in a copy of the caller's context so request-scoped timings reach the thread.
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, partial(context.run, func, *args))
+
+    def _read_page(self, group: str, image: np.ndarray, filename: str, page: int) -> list[Line]:
+        with self._registry.use(group) as model:
+            return self._recognize(model, image, filename, page)
+
+    def _read_first_page(self, filename: str, image: np.ndarray) -> tuple[str, list[Line]]:
+        """Return the recognition model for the file and the lines of its first page."""
+
+        lines = self._recognize(self._default, image, filename, 1)
+        if len(self._groups) == 1:
+            return self._default_group, lines
+        language = detect_language(" ".join(text for text, _ in lines), self._languages)
+        if language is not None:
+            group = recognition_group(language)
+            if group != self._default_group:
+                with self._registry.use(group) as model:
+                    lines = self._recognize(model, image, filename, 1)
+            logger.info("ocr_language_detected", filename=filename, language=language)
+            return group, lines
+        best = (self._default_group, lines)
+        if _mean_confidence(lines) >= LOW_CONFIDENCE:
+            return best
+        # Text in another script reads as low-confidence noise; keep the best reader.
+        for group in self._groups:
+            if group == self._default_group:
+                continue
+            with self._registry.use(group) as model:
+                candidate = self._recognize(model, image, filename, 1)
+            if _mean_confidence(candidate) > _mean_confidence(best[1]):
+                best = (group, candidate)
+        logger.info("ocr_script_detected", filename=filename, model=best[0])
+        return best
+
+    def _recognize(self, model: Any, image: np.ndarray, filename: str, page: int) -> list[Line]:
+        with get_tracer().span("ocr.page", filename=filename, page=page), metrics.stage(
+            "ocr_page"
+        ):
+            ocr_result = model.ocr(image, cls=True)
+        metrics.count("ocr_pages")
+        lines: list[Line] = []
+        for line in ocr_result or ():
+            if not line:
                 continue
-            for line in ocr_result:
-                if not line:
+            for entry in line:
+                if not entry or len(entry) < 2:
                     continue
-                for entry in line:
-                    if not entry or len(entry) < 2:
-                        continue
-                    content = entry[1]
-                    if isinstance(content, (list, tuple)) and content:
-                        text = content[0]
-                    else:
-                        text = str(content)
-                    if text:
-                        results.append(text)
-        combined = "\n".join(results)
-        logger.info("extracted_text", filename=file.filename, length=len(combined))
-        return combined
+                content = entry[1]
+                if isinstance(content, (list, tuple)) and content:
+                    text = content[0]
+                    confidence = float(content[1]) if len(content) > 1 else 0.0
+                else:
+                    text, confidence = str(content), 0.0
+                if text:
+                    lines.append((text, confidence))
+        return lines
+
+    def _load_model(self, group: str) -> tuple[Any, int]:
+        model = self._paddle(
+            use_angle_cls=True,
+            lang=group,
+            use_gpu=self._use_gpu,
+            det_db_box_thresh=0.3,
+            det_db_unclip_ratio=1.6,
+            show_log=False,
+            ocr_version="PP-OCRv4",
+            rec=True,
+            rec_model_dir=self._model_dir if group == self._default_group else None,
+        )
+        resident: tuple[str, ...]
+        if self._default is not None:
+            # PaddleOCR always builds a detector and classifier; dropping them keeps only
+            # the recognizer resident for each extra language.
+            model.text_detector = self._default.text_detector
+            model.text_classifier = self._default.text_classifier
+            resident = ("rec_model_dir",)
+        else:
+            resident = ("det_model_dir", "rec_model_dir", "cls_model_dir")
+        # PaddleOCR resolves (and downloads) the model directories into its arguments.
+        args = getattr(model, "args", None)
+        size = sum(_directory_bytes(getattr(args, name, None)) for name in resident)
+        return model, size or DEFAULT_MODEL_BYTES
 
     def _load_images(self, file: UploadedFile) -> Iterable[np.ndarray]:
         if file.content_type == "application/pdf" or file.extension() == "pdf":
-            yield from self._load_pdf(file.data)
+            yield from self._load_pdf(file)
         else:
-            yield self._load_image(file.data)
+            yield self._load_image(file)
 
     @staticmethod
-    def _load_pdf(data: bytes) -> Iterable[np.ndarray]:
+    def _load_pdf(file: UploadedFile) -> Iterable[np.ndarray]:
         import fitz  # PyMuPDF
 
-        doc = fitz.open(stream=data, filetype="pdf")
-        for page in doc:
-            pix = page.get_pixmap(alpha=False)
-            arr = np.frombuffer(pix.samples, dtype=np.uint8)
-            image = arr.reshape(pix.height, pix.width, pix.n)
-            yield image
+        # Opening by path lets PyMuPDF read pages lazily instead of copying the whole file.
+        if file.path is not None:
+            doc = fitz.open(file.path, filetype="pdf")
+        else:
+            doc = fitz.open(stream=file.data, filetype="pdf")
+        with doc:
+            for page in doc:
+                pix = page.get_pixmap(alpha=False)
+                arr = np.frombuffer(pix.samples, dtype=np.uint8)
+                image = arr.reshape(pix.height, pix.width, pix.n)
+                yield image
 
     @staticmethod
-    def _load_image(data: bytes) -> np.ndarray:
+    def _load_image(file: UploadedFile) -> np.ndarray:
         from PIL import Image
 
-        image = Image.open(BytesIO(data))
-        rgb_image = image.convert("RGB")
-        return np.array(rgb_image)
+        with file.open() as stream, Image.open(stream) as image:
+            rgb_image = image.convert("RGB")
+        return np.asarray(rgb_image)
+
+
+def _mean_confidence(lines: list[Line]) -> float:
+    if not lines:
+        return 0.0
+    return sum(confidence for _, confidence in lines) / len(lines)
+
+
+def _directory_bytes(path: str | None) -> int:
+    """Return the total size of the files under ``path``, or 0 if it is not a directory."""
+
+    if not path or not os.path.isdir(path):
+        return 0
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
@@ -0,0 +1,31 @@
+"""Cheap page counting used to size work before OCR runs."""
+
+from __future__ import annotations
+
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+from resume_ai.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def count_pages(file: UploadedFile) -> int:
+    """Return the number of pages OCR will process for ``file``.
+
+    Only the PDF cross-reference table is read, not the page content. Images count as
+    one page, and an unreadable PDF counts as one so the OCR stage reports the error.
+    """
+
+    if file.content_type != "application/pdf" and file.extension() != "pdf":
+        return 1
+    import fitz  # type: ignore[import-untyped]  # PyMuPDF
+
+    try:
+        if file.path is not None:
+            doc = fitz.open(file.path, filetype="pdf")
+        else:
+            doc = fitz.open(stream=file.data, filetype="pdf")
+        with doc:
+            return max(int(doc.page_count), 1)
+    except Exception as exc:  # noqa: BLE001 - any parsing failure falls back to one page
+        logger.warning("page_count_failed", filename=file.filename, error=str(exc))
+        return 1
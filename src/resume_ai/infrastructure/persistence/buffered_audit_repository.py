@@ -0,0 +1,234 @@
+"""Buffered audit writer batching inserts off the request path."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime
+from typing import Protocol, Sequence
+
+from resume_ai.application.dto.audit_query import AuditLogPage, AuditLogQuery
+from resume_ai.application.interfaces.audit_repository import AuditRepository
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+_STOP = object()
+REJECTED_SUFFIX = ".rejected"
+
+
+class BatchAuditSink(Protocol):
+    """Audit store able to persist several logs in one round trip."""
+
+    async def save_many(self, logs: Sequence[AuditLog]) -> None:
+        """Persist a batch of audit logs, skipping any that are already stored."""
+
+    async def list_logs(self, query: AuditLogQuery | None = None) -> AuditLogPage:
+        """Return a page of audit logs matching the query."""
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes backing audit queries."""
+
+    async def ping(self) -> None:
+        """Raise if the store is unreachable."""
+
+
+class BufferedAuditRepository(AuditRepository):
+    """Queues audit logs in process and flushes them with batched inserts.
+
+    Batches are written when ``batch_size`` logs are queued or ``flush_interval`` seconds
+    have passed. A full queue makes ``save`` wait (backpressure), and batches the sink
+    rejects are spilled to a bounded JSON-lines file and replayed on the next write. A
+    replay may repeat logs the sink accepted before failing, so the sink must skip logs it
+    already holds. Spill file I/O runs in a worker thread, off the event loop.
+
+    Spilled lines that no longer decode, and logs the sink rejects while it answers
+    pings, are moved to a ``.rejected`` file next to the spill instead of being retried
+    on every write.
+    """
+
+    def __init__(
+        self,
+        sink: BatchAuditSink,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10_000,
+        spill_path: str | None = None,
+        spill_max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self._sink = sink
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        self._spill_path = spill_path
+        self._spill_max_bytes = spill_max_bytes
+        self._queue: asyncio.Queue[object] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._task = asyncio.create_task(self._run(), name="audit-flusher")
+
+    async def stop(self) -> None:
+        """Flush queued logs and stop the background flusher."""
+
+        if self._task is None or self._queue is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def save(self, log: AuditLog) -> None:
+        if self._queue is None:
+            await self._write([log])
+            return
+        await self._queue.put(log)
+
+    async def list_logs(self, query: AuditLogQuery | None = None) -> AuditLogPage:
+        return await self._sink.list_logs(query)
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes of the underlying store."""
+
+        await self._sink.ensure_indexes()
+
+    async def ping(self) -> None:
+        """Check that the underlying store is reachable."""
+
+        await self._sink.ping()
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch: list[AuditLog] = [item]  # type: ignore[list-item]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)  # type: ignore[arg-type]
+            try:
+                await self._write(batch)
+            except Exception as exc:  # noqa: BLE001 - the flusher must outlive a failed batch
+                logger.error("audit_logs_dropped", count=len(batch), reason=str(exc))
+
+    async def _write(self, batch: list[AuditLog]) -> None:
+        try:
+            await self._replay_spill()
+            await self._sink.save_many(batch)
+        except Exception as exc:  # noqa: BLE001 - any sink failure must not lose the batch
+            logger.warning("audit_flush_failed", count=len(batch), error=str(exc))
+            await self._spill(batch)
+
+    async def _replay_spill(self) -> None:
+        if not self._spill_path:
+            return
+        spilled = await asyncio.to_thread(_read_spill, self._spill_path)
+        if spilled is None:
+            return
+        logs, rejected = spilled
+        if logs:
+            try:
+                await self._sink.save_many(logs)
+            except Exception:  # noqa: BLE001 - told apart from an outage below
+                # A sink that still answers pings rejected the batch rather than failed.
+                await self._sink.ping()
+                rejected.extend(await self._save_each(logs))
+            logger.info("audit_spill_replayed", count=len(logs))
+        if rejected:
+            await self._quarantine(rejected)
+        await asyncio.to_thread(os.remove, self._spill_path)
+
+    async def _save_each(self, logs: list[AuditLog]) -> list[str]:
+        """Save logs one by one and return the serialized logs the sink rejects."""
+
+        rejected: list[str] = []
+        for log in logs:
+            try:
+                await self._sink.save_many([log])
+            except Exception:  # noqa: BLE001 - an outage is re-raised by ping
+                await self._sink.ping()
+                rejected.append(_serialize(log))
+        return rejected
+
+    async def _quarantine(self, lines: list[str]) -> None:
+        assert self._spill_path is not None
+        path = self._spill_path + REJECTED_SUFFIX
+        written = await asyncio.to_thread(
+            _append_spill, path, "".join(line + "\n" for line in lines), self._spill_max_bytes
+        )
+        if written:
+            logger.error("audit_spill_quarantined", count=len(lines), path=path)
+        else:
+            logger.error("audit_logs_dropped", count=len(lines), reason="quarantine_full")
+
+    async def _spill(self, batch: list[AuditLog]) -> None:
+        if not self._spill_path:
+            logger.error("audit_logs_dropped", count=len(batch), reason="no_spill_path")
+            return
+        lines = "".join(_serialize(log) + "\n" for log in batch)
+        written = await asyncio.to_thread(
+            _append_spill, self._spill_path, lines, self._spill_max_bytes
+        )
+        if not written:
+            logger.error("audit_logs_dropped", count=len(batch), reason="spill_full")
+
+
+def _read_spill(path: str) -> tuple[list[AuditLog], list[str]] | None:
+    """Return the decoded logs and the lines that no longer decode, such as a torn write."""
+
+    if not os.path.exists(path):
+        return None
+    logs: list[AuditLog] = []
+    undecodable: list[str] = []
+    with open(path, encoding="utf-8", errors="replace") as spill:
+        for line in spill:
+            if not line.strip():
+                continue
+            try:
+                logs.append(_deserialize(line))
+            except (ValueError, KeyError, TypeError):
+                undecodable.append(line.rstrip("\n"))
+    return logs, undecodable
+
+
+def _append_spill(path: str, lines: str, max_bytes: int) -> bool:
+    current_size = os.path.getsize(path) if os.path.exists(path) else 0
+    if current_size + len(lines.encode("utf-8")) > max_bytes:
+        return False
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as spill:
+        spill.write(lines)
+    return True
+
+
+def _serialize(log: AuditLog) -> str:
+    payload = asdict(log)
+    payload["timestamp"] = log.timestamp.isoformat()
+    return json.dumps(payload, default=str)
+
+
+def _deserialize(line: str) -> AuditLog:
+    payload = json.loads(line)
+    payload["timestamp"] = datetime.fromisoformat(payload["timestamp"])
+    return AuditLog(**payload)
@@ -2,52 +2,407 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
+import zlib
+from datetime import datetime, timedelta, timezone
 from typing import Any, Sequence
 
 try:
-    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+    from bson import ObjectId
+    from bson.errors import InvalidId
+    from motor.motor_asyncio import (
+        AsyncIOMotorClient,
+        AsyncIOMotorCollection,
+        AsyncIOMotorDatabase,
+    )
+    from pymongo import ASCENDING, DESCENDING, IndexModel
+    from pymongo.errors import BulkWriteError, DuplicateKeyError
 except ImportError:  # pragma: no cover - fallback for test environments
     AsyncIOMotorClient = None  # type: ignore
     AsyncIOMotorCollection = Any  # type: ignore
+    AsyncIOMotorDatabase = Any  # type: ignore
 
+from resume_ai.application.dto.audit_query import AuditLogPage, AuditLogQuery
 from resume_ai.application.interfaces.audit_repository import AuditRepository
 from resume_ai.domain.models.audit import AuditLog
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
+from resume_ai.infrastructure.observability.metrics import get_metrics
+
+metrics = get_metrics()
+
+SORT_ORDER = [("timestamp", -1), ("_id", -1)]
+ARCHIVE_CODEC = "zlib"
+DUPLICATE_KEY = 11000
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
 
 
 class MongoAuditRepository(AuditRepository):
-    """Persists audit logs in MongoDB."""
+    """Persists audit logs in MongoDB.
 
-    def __init__(self, mongo_uri: str, collection_name: str = "audit_logs") -> None:
+    Recent entries live in the hot collection. ``compact`` moves entries older than
+    ``hot_retention_days`` into zlib-compressed per-day documents in the archive
+    collection, deleting them from the hot collection only once they are copied.
+
+    Every query is scoped to one tenant, and every index starts with ``tenant_id``, so a
+    tenant's reads only scan its own entries. Archive documents hold a single tenant.
+    Entries written before tenancy have no ``tenant_id`` and belong to the default tenant.
+
+    An entry's ``_id`` is derived from its content, so writing the same log twice (a
+    replayed batch the server partly accepted) stores it once.
+    """
+
+    def __init__(
+        self,
+        mongo_uri: str,
+        collection_name: str = "audit_logs",
+        archive_collection_name: str = "audit_archive",
+        hot_retention_days: int = 30,
+        archive_retention_days: int = 0,
+    ) -> None:
         if AsyncIOMotorClient is None:
             raise RuntimeError(
                 "motor is not installed or incompatible. Install motor to use MongoAuditRepository."
             )
         self._client = AsyncIOMotorClient(mongo_uri)
-        self._collection: AsyncIOMotorCollection = self._client.get_default_database()[
-            collection_name
+        self._database: AsyncIOMotorDatabase = self._client.get_default_database()
+        self._collection: AsyncIOMotorCollection = self._database[collection_name]
+        self._archive: AsyncIOMotorCollection = self._database[archive_collection_name]
+        self._hot_retention = timedelta(days=hot_retention_days)
+        self._archive_retention = timedelta(days=archive_retention_days)
+
+    @property
+    def database(self) -> AsyncIOMotorDatabase:
+        """The default database, for other stores sharing this client's pool."""
+
+        return self._database
+
+    async def ping(self) -> None:
+        """Round-trip to the server, raising if it is unreachable."""
+
+        await self._client.admin.command("ping")
+
+    def close(self) -> None:
+        """Close the client and its connection pool."""
+
+        self._client.close()
+
+    async def ensure_indexes(self) -> None:
+        """Create the query and archive indexes."""
+
+        await self._collection.create_indexes(
+            [
+                IndexModel(
+                    [("tenant_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)],
+                    name="tenant_timestamp_id",
+                ),
+                IndexModel(
+                    [
+                        ("tenant_id", ASCENDING),
+                        ("user_id", ASCENDING),
+                        ("timestamp", DESCENDING),
+                        ("_id", DESCENDING),
+                    ],
+                    name="tenant_user_timestamp_id",
+                ),
+                IndexModel(
+                    [("tenant_id", ASCENDING), ("request_id", ASCENDING)],
+                    name="tenant_request_id",
+                ),
+            ]
+        )
+        archive_indexes = [
+            IndexModel(
+                [("tenant_id", ASCENDING), ("bucket_end", DESCENDING)], name="tenant_bucket_end"
+            ),
+            IndexModel(
+                [("tenant_id", ASCENDING), ("user_ids", ASCENDING), ("bucket_end", DESCENDING)],
+                name="tenant_user_bucket",
+            ),
+            IndexModel(
+                [("tenant_id", ASCENDING), ("request_ids", ASCENDING)],
+                name="tenant_request_ids",
+            ),
         ]
+        if self._archive_retention:
+            archive_indexes.append(
+                IndexModel(
+                    [("archived_until", ASCENDING)],
+                    name="archived_until_ttl",
+                    expireAfterSeconds=int(self._archive_retention.total_seconds()),
+                )
+            )
+        await self._archive.create_indexes(archive_indexes)
+
+    async def compact(self, now: datetime, batch_size: int = 500) -> int:
+        """Move hot entries older than the retention window into archive documents."""
+
+        cutoff = now - self._hot_retention
+        compacted = 0
+        while True:
+            cursor = (
+                self._collection.find({"timestamp": {"$lt": cutoff}})
+                .sort([("timestamp", 1), ("_id", 1)])
+                .limit(batch_size)
+            )
+            documents = [doc async for doc in cursor]
+            if not documents:
+                return compacted
+            buckets: dict[tuple[str, str], list[dict[str, Any]]] = {}
+            for doc in documents:
+                tenant_id = doc.get("tenant_id") or DEFAULT_TENANT_ID
+                day = doc["timestamp"].strftime("%Y-%m-%d")
+                buckets.setdefault((tenant_id, day), []).append(doc)
+            for (_, day), entries in buckets.items():
+                await self._archive.replace_one(
+                    {"_id": _bucket_id(entries)}, _archive_document(day, entries), upsert=True
+                )
+            await self._collection.delete_many({"_id": {"$in": [doc["_id"] for doc in documents]}})
+            compacted += len(documents)
+            metrics.count("audit_logs_archived", len(documents))
 
     async def save(self, log: AuditLog) -> None:
-        document = {
+        with metrics.stage("mongo_insert"):
+            try:
+                await self._collection.insert_one(self._to_document(log))
+            except DuplicateKeyError:
+                metrics.count("audit_logs_duplicate")
+
+    async def save_many(self, logs: Sequence[AuditLog]) -> None:
+        """Insert the logs, skipping any that are already stored."""
+
+        if not logs:
+            return
+        duplicates = 0
+        with metrics.stage("mongo_insert"):
+            try:
+                await self._collection.insert_many(
+                    [self._to_document(log) for log in logs], ordered=False
+                )
+            except BulkWriteError as exc:
+                errors = exc.details.get("writeErrors", [])
+                if exc.details.get("writeConcernErrors") or any(
+                    error.get("code") != DUPLICATE_KEY for error in errors
+                ):
+                    raise
+                duplicates = len(errors)
+        if duplicates:
+            metrics.count("audit_logs_duplicate", duplicates)
+        metrics.count("audit_logs_written", len(logs) - duplicates)
+
+    async def list_logs(self, query: AuditLogQuery | None = None) -> AuditLogPage:
+        query = query or AuditLogQuery()
+        projection = None if query.include_result else {"result": 0}
+        cursor = (
+            self._collection.find(self._build_filter(query), projection)
+            .sort(SORT_ORDER)
+            .limit(query.limit + 1)
+        )
+        with metrics.stage("mongo_list_logs"):
+            documents = [doc async for doc in cursor]
+            if len(documents) <= query.limit:
+                archived = await self._read_archive(
+                    query, needed=query.limit + 1 - len(documents)
+                )
+                documents = _merge_newest_first(documents, archived)
+        page = documents[: query.limit]
+        next_cursor = encode_cursor(page[-1]) if len(documents) > query.limit else None
+        return AuditLogPage(items=[self._to_log(doc) for doc in page], next_cursor=next_cursor)
+
+    async def _read_archive(self, query: AuditLogQuery, needed: int) -> list[dict[str, Any]]:
+        position = decode_cursor(query.cursor) if query.cursor else None
+        bucket_filter: dict[str, Any] = {"tenant_id": _tenant_match(query.tenant_id)}
+        if query.user_id:
+            bucket_filter["user_ids"] = query.user_id
+        if query.request_id:
+            bucket_filter["request_ids"] = query.request_id
+        if query.since:
+            bucket_filter["bucket_end"] = {"$gte": query.since}
+        upper = min(
+            (bound for bound in (query.until, position[0] if position else None) if bound),
+            default=None,
+        )
+        if upper is not None:
+            bucket_filter["bucket_start"] = {"$lte": upper}
+
+        matches: list[dict[str, Any]] = []
+        async for bucket in self._archive.find(bucket_filter).sort("bucket_end", -1):
+            if len(matches) >= needed and bucket["bucket_end"] < matches[needed - 1]["timestamp"]:
+                break
+            entries = [
+                entry
+                for entry in _decode_entries(bucket)
+                if _entry_matches(entry, query, position)
+            ]
+            matches = _merge_newest_first(matches, entries)
+        if not query.include_result:
+            for entry in matches:
+                entry.pop("result", None)
+        return matches[:needed]
+
+    @staticmethod
+    def _build_filter(query: AuditLogQuery) -> dict[str, Any]:
+        clauses: list[dict[str, Any]] = [{"tenant_id": _tenant_match(query.tenant_id)}]
+        if query.user_id:
+            clauses.append({"user_id": query.user_id})
+        if query.request_id:
+            clauses.append({"request_id": query.request_id})
+        time_range: dict[str, datetime] = {}
+        if query.since:
+            time_range["$gte"] = query.since
+        if query.until:
+            time_range["$lt"] = query.until
+        if time_range:
+            clauses.append({"timestamp": time_range})
+        if query.cursor:
+            timestamp, object_id = decode_cursor(query.cursor)
+            clauses.append(
+                {
+                    "$or": [
+                        {"timestamp": {"$lt": timestamp}},
+                        {"timestamp": timestamp, "_id": {"$lt": object_id}},
+                    ]
+                }
+            )
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+    @staticmethod
+    def _to_document(log: AuditLog) -> dict[str, Any]:
+        return {
+            "_id": _entry_id(log),
+            "tenant_id": log.tenant_id,
             "request_id": log.request_id,
             "user_id": log.user_id,
             "timestamp": log.timestamp,
             "query": log.query,
             "result": log.result,
         }
-        await self._collection.insert_one(document)
-
-    async def list_logs(self, limit: int = 50) -> Sequence[AuditLog]:
-        cursor = self._collection.find().sort("timestamp", -1).limit(limit)
-        items: list[AuditLog] = []
-        async for doc in cursor:
-            items.append(
-                AuditLog(
-                    request_id=str(doc["request_id"]),
-                    user_id=str(doc["user_id"]),
-                    timestamp=doc["timestamp"],
-                    query=doc.get("query"),
-                    result=doc.get("result", {}),
-                )
-            )
-        return items
+
+    @staticmethod
+    def _to_log(doc: dict[str, Any]) -> AuditLog:
+        return AuditLog(
+            request_id=str(doc["request_id"]),
+            user_id=str(doc["user_id"]),
+            timestamp=doc["timestamp"],
+            query=doc.get("query"),
+            result=doc.get("result", {}),
+            tenant_id=str(doc.get("tenant_id") or DEFAULT_TENANT_ID),
+        )
+
+
+def _entry_id(log: AuditLog) -> ObjectId:
+    """Return an id made of the log's timestamp and a digest of its content."""
+
+    content = json.dumps(
+        [
+            log.tenant_id,
+            log.request_id,
+            log.user_id,
+            log.timestamp.isoformat(),
+            log.query,
+            log.result,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(content.encode("utf-8")).digest()
+    # The leading timestamp keeps ids in write order, as generated ObjectIds are.
+    return ObjectId(ObjectId.from_datetime(log.timestamp).binary[:4] + digest[:8])
+
+
+def _bucket_id(entries: list[dict[str, Any]]) -> str:
+    digest = hashlib.sha256("".join(str(entry["_id"]) for entry in entries).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _archive_document(day: str, entries: list[dict[str, Any]]) -> dict[str, Any]:
+    serialized = [
+        {**entry, "_id": str(entry["_id"]), "timestamp": entry["timestamp"].isoformat()}
+        for entry in entries
+    ]
+    payload = zlib.compress(json.dumps(serialized, default=str).encode("utf-8"))
+    return {
+        "tenant_id": entries[0].get("tenant_id") or DEFAULT_TENANT_ID,
+        "day": day,
+        "bucket_start": entries[0]["timestamp"],
+        "bucket_end": entries[-1]["timestamp"],
+        "archived_until": entries[-1]["timestamp"],
+        "count": len(entries),
+        "user_ids": sorted({str(entry["user_id"]) for entry in entries}),
+        "request_ids": sorted({str(entry["request_id"]) for entry in entries}),
+        "codec": ARCHIVE_CODEC,
+        "payload": payload,
+    }
+
+
+def _decode_entries(bucket: dict[str, Any]) -> list[dict[str, Any]]:
+    entries = json.loads(zlib.decompress(bucket["payload"]).decode("utf-8"))
+    return [
+        {
+            **entry,
+            "_id": ObjectId(entry["_id"]),
+            "timestamp": datetime.fromisoformat(entry["timestamp"]),
+        }
+        for entry in entries
+    ]
+
+
+def _entry_matches(
+    entry: dict[str, Any], query: AuditLogQuery, position: tuple[datetime, Any] | None
+) -> bool:
+    if (entry.get("tenant_id") or DEFAULT_TENANT_ID) != query.tenant_id:
+        return False
+    if query.user_id and entry["user_id"] != query.user_id:
+        return False
+    if query.request_id and entry["request_id"] != query.request_id:
+        return False
+    timestamp = _naive_utc(entry["timestamp"])
+    if query.since and timestamp < _naive_utc(query.since):
+        return False
+    if query.until and timestamp >= _naive_utc(query.until):
+        return False
+    if position and (timestamp, entry["_id"]) >= (_naive_utc(position[0]), position[1]):
+        return False
+    return True
+
+
+def _tenant_match(tenant_id: str) -> Any:
+    # Entries written before tenancy have no tenant_id; ``None`` also matches a missing field.
+    if tenant_id == DEFAULT_TENANT_ID:
+        return {"$in": [DEFAULT_TENANT_ID, None]}
+    return tenant_id
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Motor returns naive UTC datetimes, while API filters may carry an offset.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _merge_newest_first(
+    first: list[dict[str, Any]], second: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    unique = {str(doc["_id"]): doc for doc in [*second, *first]}
+    return sorted(unique.values(), key=lambda doc: (doc["timestamp"], doc["_id"]), reverse=True)
+
+
+def encode_cursor(doc: dict[str, Any]) -> str:
+    """Return an opaque keyset cursor pointing after ``doc``."""
+
+    raw = json.dumps({"t": doc["timestamp"].isoformat(), "id": str(doc["_id"])})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, Any]:
+    """Return the ``(timestamp, _id)`` keyset position encoded in ``cursor``."""
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(payload["t"]), ObjectId(payload["id"])
+    except (ValueError, KeyError, TypeError, InvalidId) as exc:
+        raise InvalidCursorError("Invalid pagination cursor.") from exc
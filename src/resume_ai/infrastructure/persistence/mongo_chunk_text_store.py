@@ -0,0 +1,65 @@
+"""MongoDB store of compressed chunk texts."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+    from pymongo import ReplaceOne
+except ImportError:  # pragma: no cover - fallback for test environments
+    AsyncIOMotorCollection = Any  # type: ignore
+    AsyncIOMotorDatabase = Any  # type: ignore
+    ReplaceOne = None  # type: ignore
+
+from resume_ai.application.interfaces.chunk_text_store import ChunkTextStore
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.storage.text_codec import compress, decompress, default_codec
+
+metrics = get_metrics()
+
+
+class MongoChunkTextStore(ChunkTextStore):
+    """Keeps one document per chunk, holding its compressed text and codec.
+
+    The store writes to a database of a client owned elsewhere, so it shares that
+    client's connection pool and leaves closing it to the owner.
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str = "chunk_texts",
+        codec: str | None = None,
+    ) -> None:
+        if ReplaceOne is None:
+            raise RuntimeError(
+                "motor is not installed or incompatible. Install motor to use MongoChunkTextStore."
+            )
+        self._collection: AsyncIOMotorCollection = database[collection_name]
+        self._codec = codec or default_codec()
+
+    async def put_many(self, texts: Mapping[str, str]) -> None:
+        if not texts:
+            return
+        with metrics.stage("chunk_text_write"):
+            await self._collection.bulk_write(
+                [
+                    ReplaceOne(
+                        {"_id": chunk_id},
+                        {"codec": self._codec, "data": compress(text, self._codec)},
+                        upsert=True,
+                    )
+                    for chunk_id, text in texts.items()
+                ],
+                ordered=False,
+            )
+
+    async def get_many(self, chunk_ids: Sequence[str]) -> dict[str, str]:
+        if not chunk_ids:
+            return {}
+        with metrics.stage("chunk_text_read"):
+            documents = [
+                doc async for doc in self._collection.find({"_id": {"$in": list(chunk_ids)}})
+            ]
+        return {str(doc["_id"]): decompress(doc["data"], doc["codec"]) for doc in documents}
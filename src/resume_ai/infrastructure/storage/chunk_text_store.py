@@ -0,0 +1,62 @@
+"""Compressed chunk texts stored as local files."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from typing import Mapping, Sequence
+
+from resume_ai.infrastructure.storage.text_codec import compress, decompress, default_codec
+
+
+class FileChunkTextStore:
+    """Keeps each chunk's compressed text in its own file under ``root``.
+
+    Files are sharded by the first two characters of the chunk id and replaced
+    atomically, so readers never see a partial write. Each file starts with the name of
+    its codec, so texts written before zstd was installed stay readable.
+    """
+
+    def __init__(self, root: str, codec: str | None = None) -> None:
+        self._root = root
+        self._codec = codec or default_codec()
+        os.makedirs(root, exist_ok=True)
+
+    async def put_many(self, texts: Mapping[str, str]) -> None:
+        if texts:
+            await asyncio.to_thread(self._write_all, dict(texts))
+
+    async def get_many(self, chunk_ids: Sequence[str]) -> dict[str, str]:
+        if not chunk_ids:
+            return {}
+        return await asyncio.to_thread(self._read_all, list(chunk_ids))
+
+    def _path(self, chunk_id: str) -> str:
+        return os.path.join(self._root, chunk_id[:2], chunk_id)
+
+    def _write_all(self, texts: dict[str, str]) -> None:
+        for chunk_id, text in texts.items():
+            path = self._path(chunk_id)
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+            try:
+                with os.fdopen(handle, "wb") as blob:
+                    blob.write(self._codec.encode("ascii") + b"\n")
+                    blob.write(compress(text, self._codec))
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+    def _read_all(self, chunk_ids: list[str]) -> dict[str, str]:
+        texts: dict[str, str] = {}
+        for chunk_id in chunk_ids:
+            try:
+                with open(self._path(chunk_id), "rb") as blob:
+                    codec, _, data = blob.read().partition(b"\n")
+            except FileNotFoundError:
+                continue
+            texts[chunk_id] = decompress(data, codec.decode("ascii"))
+        return texts
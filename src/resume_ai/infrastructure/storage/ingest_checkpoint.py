@@ -0,0 +1,38 @@
+"""Append-only file checkpoint for bulk ingestion runs."""
+
+from __future__ import annotations
+
+import os
+from typing import Iterable
+
+
+class FileIngestCheckpoint:
+    """Stores completed resume ids one per line, fsynced after every batch.
+
+    A crash can at worst lose the batch in flight, which is re-ingested idempotently
+    on the next run because chunk ids are derived from the resume content.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._done: set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as checkpoint:
+                self._done.update(line.strip() for line in checkpoint if line.strip())
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def contains(self, resume_id: str) -> bool:
+        return resume_id in self._done
+
+    def mark_done(self, resume_ids: Iterable[str]) -> None:
+        new_ids = [resume_id for resume_id in resume_ids if resume_id not in self._done]
+        if not new_ids:
+            return
+        with open(self._path, "a", encoding="utf-8") as checkpoint:
+            checkpoint.writelines(f"{resume_id}\n" for resume_id in new_ids)
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+        self._done.update(new_ids)
@@ -0,0 +1,88 @@
+"""Discovery of resume files in directories and archives for bulk ingestion."""
+
+from __future__ import annotations
+
+import mimetypes
+import os
+import tarfile
+import zipfile
+from typing import Iterator
+
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+
+SUPPORTED_EXTENSIONS = frozenset({"pdf", "png", "jpg", "jpeg", "tif", "tiff", "bmp"})
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+
+def iter_resume_files(source: str) -> Iterator[UploadedFile]:
+    """Yield supported resume files from a directory tree, zip or tar archive.
+
+    Directory entries are referenced by path; archive members are read one at a time
+    as the iterator advances, so async callers advance it in a worker thread.
+    Files are yielded in a stable, sorted order so interrupted runs replay identically.
+    """
+
+    if os.path.isdir(source):
+        yield from _iter_directory(source)
+    elif zipfile.is_zipfile(source):
+        yield from _iter_zip(source)
+    elif source.lower().endswith(TAR_SUFFIXES) and tarfile.is_tarfile(source):
+        yield from _iter_tar(source)
+    elif os.path.isfile(source) and _is_supported(source):
+        yield _path_upload(source)
+    else:
+        raise ValueError(f"Unsupported resume source: {source}")
+
+
+def _iter_directory(root: str) -> Iterator[UploadedFile]:
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            if _is_supported(filename):
+                yield _path_upload(os.path.join(directory, filename))
+
+
+def _iter_zip(path: str) -> Iterator[UploadedFile]:
+    with zipfile.ZipFile(path) as archive:
+        for info in sorted(archive.infolist(), key=lambda item: item.filename):
+            if info.is_dir() or not _is_supported(info.filename):
+                continue
+            yield _memory_upload(info.filename, archive.read(info))
+
+
+def _iter_tar(path: str) -> Iterator[UploadedFile]:
+    with tarfile.open(path) as archive:
+        members = sorted(archive.getmembers(), key=lambda item: item.name)
+        for member in members:
+            if not member.isfile() or not _is_supported(member.name):
+                continue
+            stream = archive.extractfile(member)
+            if stream is not None:
+                with stream:
+                    yield _memory_upload(member.name, stream.read())
+
+
+def _is_supported(filename: str) -> bool:
+    return filename.rsplit(".", 1)[-1].lower() in SUPPORTED_EXTENSIONS
+
+
+def _content_type(filename: str) -> str:
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+def _path_upload(path: str) -> UploadedFile:
+    return UploadedFile(
+        filename=os.path.basename(path),
+        content_type=_content_type(path),
+        path=path,
+        size=os.path.getsize(path),
+    )
+
+
+def _memory_upload(name: str, data: bytes) -> UploadedFile:
+    return UploadedFile(
+        filename=os.path.basename(name),
+        content_type=_content_type(name),
+        data=data,
+        size=len(data),
+    )
@@ -0,0 +1,43 @@
+"""Compression of stored chunk texts, with zstd when it is installed."""
+
+from __future__ import annotations
+
+import zlib
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - zstd is optional
+    zstandard = None  # type: ignore[assignment]
+
+ZSTD = "zstd"
+ZLIB = "zlib"
+# Short texts compress poorly at any level; a higher level costs little on ~1 KB inputs.
+ZSTD_LEVEL = 9
+ZLIB_LEVEL = 6
+
+
+def default_codec() -> str:
+    """Return the best codec available in this environment."""
+
+    return ZSTD if zstandard is not None else ZLIB
+
+
+def compress(text: str, codec: str) -> bytes:
+    raw = text.encode("utf-8")
+    if codec == ZSTD:
+        compressed: bytes = _zstd().ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+        return compressed
+    return zlib.compress(raw, ZLIB_LEVEL)
+
+
+def decompress(data: bytes, codec: str) -> str:
+    if codec == ZSTD:
+        raw_text: bytes = _zstd().ZstdDecompressor().decompress(data)
+        return raw_text.decode("utf-8")
+    return zlib.decompress(data).decode("utf-8")
+
+
+def _zstd():  # type: ignore[no-untyped-def]
+    if zstandard is None:
+        raise RuntimeError("Text was stored with zstd; install zstandard to read it.")
+    return zstandard
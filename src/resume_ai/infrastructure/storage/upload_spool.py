@@ -0,0 +1,74 @@
+"""Writes uploads to named files as they stream in, hashing them and enforcing size limits."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+
+SPOOL_PREFIX = "resume-ai-"
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, filename: str, limit: int) -> None:
+        super().__init__(f"File '{filename}' exceeds the {limit} byte upload limit.")
+        self.filename = filename
+        self.limit = limit
+
+
+class UploadSpool:
+    """One upload written to a named file in ``directory`` as its bytes arrive.
+
+    The body is written once, straight from the request stream, so OCR can open the
+    file lazily by path. Writing past ``max_bytes`` raises before the excess reaches
+    the disk. Writes block, so callers on the event loop run them in a worker thread.
+    """
+
+    def __init__(
+        self, filename: str, content_type: str, directory: str | None, max_bytes: int
+    ) -> None:
+        self.filename = filename
+        self.content_type = content_type
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.file = tempfile.NamedTemporaryFile(
+            prefix=SPOOL_PREFIX,
+            suffix=os.path.splitext(filename)[1],
+            dir=directory,
+            delete=False,
+        )
+        self.path = self.file.name
+        self._digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> None:
+        """Append ``data``, refusing it if the upload would exceed the limit."""
+
+        if self.size + len(data) > self.max_bytes:
+            raise UploadTooLargeError(self.filename, self.max_bytes)
+        self.size += len(data)
+        self._digest.update(data)
+        self.file.write(data)
+
+    def finish(self) -> UploadedFile:
+        """Flush the file and return a reference to it."""
+
+        self.file.flush()
+        return UploadedFile(
+            filename=self.filename,
+            content_type=self.content_type,
+            path=self.path,
+            size=self.size,
+            sha256=self._digest.hexdigest(),
+        )
+
+    def close(self) -> None:
+        """Close and delete the spooled file."""
+
+        self.file.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
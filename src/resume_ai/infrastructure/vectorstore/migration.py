@@ -0,0 +1,103 @@
+"""Throttled re-embedding of the resume corpus into a new embedding model's collection."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
+
+metrics = get_metrics()
+
+
+@dataclass
+class MigrationProgress:
+    """Running counters of an embedding migration."""
+
+    source: str
+    target: str
+    total: int
+    copied: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.copied + self.skipped
+
+    def chunks_per_second(self) -> float:
+        """Return re-embedded chunks per second."""
+
+        return self.copied / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def percent(self) -> float:
+        return 100.0 * self.processed / self.total if self.total else 100.0
+
+    def eta_seconds(self) -> float | None:
+        """Return the estimated remaining time, ``None`` before any throughput is known."""
+
+        if not self.processed or not self.elapsed_seconds:
+            return None
+        rate = self.processed / self.elapsed_seconds
+        return max(self.total - self.processed, 0) / rate
+
+
+class EmbeddingMigration:
+    """Copies every chunk into the store's migration target with the target's embeddings.
+
+    Batches are paced to at most ``max_chunks_per_second`` re-embedded chunks so the
+    backfill does not starve live traffic of embedding quota. The copy skips chunks the
+    target already holds, so an interrupted run can simply be started again.
+    """
+
+    def __init__(
+        self,
+        store: QdrantVectorStore,
+        batch_size: int = 128,
+        max_chunks_per_second: float = 0.0,
+        monotonic: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if store.migration_target is None:
+            raise ValueError("The vector store has no migration target configured.")
+        self._store = store
+        self._target = store.migration_target
+        self._batch_size = batch_size
+        self._max_rate = max_chunks_per_second
+        self._monotonic = monotonic
+        self._sleep = sleep
+
+    async def run(
+        self, on_progress: Callable[[MigrationProgress], None] | None = None
+    ) -> MigrationProgress:
+        """Copy the whole corpus and return the final counters."""
+
+        progress = MigrationProgress(
+            source=self._store.primary.name,
+            target=self._target.name,
+            total=await self._store.count_chunks(),
+        )
+        start = self._monotonic()
+        offset = None
+        while True:
+            copied, skipped, offset = await self._store.migrate_batch(offset, self._batch_size)
+            progress.copied += copied
+            progress.skipped += skipped
+            metrics.count("vector_migration_chunks", copied)
+            if self._max_rate > 0:
+                ahead = progress.copied / self._max_rate - (self._monotonic() - start)
+                if ahead > 0:
+                    await self._sleep(ahead)
+            progress.elapsed_seconds = self._monotonic() - start
+            if on_progress is not None:
+                on_progress(progress)
+            if offset is None:
+                return progress
+
+    def swap(self, drop_legacy: bool = False) -> None:
+        """Point reads at the migrated collection."""
+
+        self._store.promote_migration_target(drop_legacy=drop_legacy)
@@ -2,21 +2,84 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List
+import asyncio
+import re
+import time
+import weakref
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Iterable, List
 
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as rest
 
+from resume_ai.application.dto.resume_search import ChunkFilter
+from resume_ai.application.interfaces.chunk_text_store import ChunkTextStore
 from resume_ai.application.interfaces.embedding_service import EmbeddingService
 from resume_ai.application.interfaces.vector_store import VectorStore
-from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.domain.models.resume import ResumeChunk, ResumeProfile
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID
 from resume_ai.infrastructure.logging.logger import get_logger
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.observability.tracing import get_tracer
 
 logger = get_logger(__name__)
+metrics = get_metrics()
+
+SCROLL_BATCH_SIZE = 256
+# How long a resolved alias is trusted before asking Qdrant again after a swap.
+ALIAS_CACHE_SECONDS = 5.0
+# Only the most recent requests are kept linked to a resume, so re-uploads stay cheap.
+MAX_LINKED_REQUESTS = 20
+
+PAYLOAD_INDEXES: dict[str, rest.PayloadSchemaType] = {
+    "tenant_id": rest.PayloadSchemaType.KEYWORD,
+    "resume_id": rest.PayloadSchemaType.KEYWORD,
+    "request_ids": rest.PayloadSchemaType.KEYWORD,
+    "section": rest.PayloadSchemaType.KEYWORD,
+    "skills": rest.PayloadSchemaType.KEYWORD,
+    "years_of_experience": rest.PayloadSchemaType.FLOAT,
+}
+# Every search is filtered by tenant, so no global HNSW graph is built (m=0). Instead,
+# the payload index builds one graph per tenant, and searching a tenant costs the same
+# however large the other tenants are.
+TENANT_HNSW_CONFIG = rest.HnswConfigDiff(m=0, payload_m=16)
+
+
+@dataclass(frozen=True)
+class CollectionVersion:
+    """A physical collection holding the vectors of one embedding model."""
+
+    name: str
+    vector_size: int
+    embedding_service: EmbeddingService
+
+
+def versioned_collection_name(alias: str, model: str, vector_size: int) -> str:
+    """Return the physical collection name used for ``model`` behind ``alias``."""
+
+    slug = re.sub(r"[^a-z0-9]+", "_", model.lower()).strip("_")
+    return f"{alias}__{slug}__{vector_size}"
 
 
 class QdrantVectorStore(VectorStore):
-    """Persists resume chunks in Qdrant for semantic search."""
+    """Persists resume chunks in Qdrant for semantic search.
+
+    ``collection_name`` is an alias over versioned collections, one per embedding model
+    and dimension. While a migration target is configured every write is embedded and
+    stored in both collections, and reads follow the alias, so swapping it switches
+    queries to the new model without downtime. A collection created before versioning,
+    carrying the alias name itself, keeps being used until it is migrated.
+
+    Points carry a ``tenant_id`` payload, and every read is restricted to one tenant.
+    Collections created here index each tenant separately; older ones get the tenant
+    index, and points without a tenant are assigned to the default tenant.
+
+    With a ``text_store``, points hold only ids and filterable fields. Chunk text is
+    written to the store before the points, and is read back in one call for the hits
+    a query returns. Points written earlier with their text in the payload still work.
+
+    The client is synchronous, so the async methods run its calls in worker threads.
+    """
 
     def __init__(
         self,
@@ -25,59 +88,455 @@ class QdrantVectorStore(VectorStore):
         vector_size: int,
         similarity: str,
         embedding_service: EmbeddingService,
+        embedding_model: str = "",
+        migration_target: CollectionVersion | None = None,
+        monotonic: Callable[[], float] = time.monotonic,
+        client: QdrantClient | None = None,
+        text_store: ChunkTextStore | None = None,
     ) -> None:
-        self._client = QdrantClient(url=url)
-        self._collection = collection_name
-        self._embedding_service = embedding_service
-        self._vector_size = vector_size
+        self._client = client or QdrantClient(location=url)
+        self._text_store = text_store
+        self._alias = collection_name
         self._distance = rest.Distance.COSINE if similarity == "cosine" else rest.Distance.DOT
+        self._primary = CollectionVersion(
+            name=versioned_collection_name(collection_name, embedding_model, vector_size),
+            vector_size=vector_size,
+            embedding_service=embedding_service,
+        )
+        self._target = migration_target
+        self._monotonic = monotonic
+        self._read_collection: str | None = None
+        self._read_resolved_at = 0.0
+        # Qdrant cannot append to a payload list atomically, so links are serialized.
+        self._link_locks: weakref.WeakValueDictionary[tuple[str, str], asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
         self._ensure_collection()
 
+    @property
+    def primary(self) -> CollectionVersion:
+        return self._primary
+
+    @property
+    def migration_target(self) -> CollectionVersion | None:
+        return self._target
+
+    def _versions(self) -> list[CollectionVersion]:
+        return [self._primary, self._target] if self._target else [self._primary]
+
     def _ensure_collection(self) -> None:
-        collections = self._client.get_collections()
-        if any(collection.name == self._collection for collection in collections.collections):
-            return
-        logger.info("creating_qdrant_collection", collection=self._collection)
-        self._client.create_collection(
-            collection_name=self._collection,
-            vectors_config=rest.VectorParams(size=self._vector_size, distance=self._distance),
+        existing = {collection.name for collection in self._client.get_collections().collections}
+        if self._alias in existing:
+            self._primary = replace(self._primary, name=self._alias)
+        for version in self._versions():
+            if version.name not in existing:
+                logger.info("creating_qdrant_collection", collection=version.name)
+                self._client.create_collection(
+                    collection_name=version.name,
+                    vectors_config=rest.VectorParams(
+                        size=version.vector_size, distance=self._distance
+                    ),
+                    hnsw_config=TENANT_HNSW_CONFIG,
+                )
+            else:
+                self._assign_default_tenant(version.name)
+            self._ensure_payload_indexes(version.name)
+        if self._alias not in existing and self._resolve_alias() is None:
+            self._client.update_collection_aliases(
+                change_aliases_operations=[self._create_alias(self._primary.name)]
+            )
+
+    def _ensure_payload_indexes(self, collection: str) -> None:
+        info = self._client.get_collection(collection)
+        existing = set((info.payload_schema or {}).keys())
+        for field_name, schema in PAYLOAD_INDEXES.items():
+            if field_name in existing:
+                continue
+            self._client.create_payload_index(
+                collection_name=collection,
+                field_name=field_name,
+                field_schema=schema,
+            )
+
+    def _assign_default_tenant(self, collection: str) -> None:
+        self._client.set_payload(
+            collection_name=collection,
+            payload={"tenant_id": DEFAULT_TENANT_ID},
+            points=rest.Filter(
+                must=[rest.IsEmptyCondition(is_empty=rest.PayloadField(key="tenant_id"))]
+            ),
+        )
+
+    def _resolve_alias(self) -> str | None:
+        for alias in self._client.get_aliases().aliases:
+            if alias.alias_name == self._alias:
+                return alias.collection_name
+        return None
+
+    async def _read_version(self) -> CollectionVersion:
+        """Return the version the alias currently points at, re-resolving periodically."""
+
+        now = self._monotonic()
+        if self._read_collection is None or now - self._read_resolved_at >= ALIAS_CACHE_SECONDS:
+            self._read_collection = await asyncio.to_thread(self._resolve_alias) or self._alias
+            self._read_resolved_at = now
+        for version in self._versions():
+            if version.name == self._read_collection:
+                return version
+        raise RuntimeError(
+            f"Alias {self._alias!r} points at {self._read_collection!r}, which matches neither "
+            "the configured embedding model nor the migration target."
+        )
+
+    def _create_alias(self, collection: str) -> rest.CreateAliasOperation:
+        return rest.CreateAliasOperation(
+            create_alias=rest.CreateAlias(collection_name=collection, alias_name=self._alias)
         )
 
+    async def ping(self) -> None:
+        """Raise if Qdrant is unreachable or the collection is missing."""
+
+        if not await asyncio.to_thread(self._client.collection_exists, self._alias):
+            raise RuntimeError(f"Qdrant collection {self._alias!r} does not exist.")
+
+    def close(self) -> None:
+        """Close the client and its HTTP connections."""
+
+        self._client.close()
+
     async def upsert_chunks(self, chunks: Iterable[ResumeChunk]) -> None:
         chunk_list = list(chunks)
         if not chunk_list:
             return
+        with get_tracer().span("qdrant.upsert_chunks", chunk_count=len(chunk_list)):
+            # Texts go first, so a point found by a search always has its text stored.
+            await self._store_texts(chunk_list)
+            await asyncio.gather(*(self._upsert(version, chunk_list) for version in self._versions()))
+
+    async def _store_texts(self, chunk_list: list[ResumeChunk]) -> None:
+        if self._text_store is not None:
+            await self._text_store.put_many({chunk.chunk_id: chunk.text for chunk in chunk_list})
+
+    async def _with_texts(self, chunks: list[ResumeChunk]) -> list[ResumeChunk]:
+        """Fill in the text of chunks whose payload does not carry it, in one read."""
+
+        missing = [chunk.chunk_id for chunk in chunks if not chunk.text]
+        if self._text_store is None or not missing:
+            return chunks
+        with metrics.stage("chunk_text_fetch"):
+            texts = await self._text_store.get_many(missing)
+        return [
+            chunk if chunk.text else replace(chunk, text=texts.get(chunk.chunk_id, ""))
+            for chunk in chunks
+        ]
+
+    async def _upsert(self, version: CollectionVersion, chunk_list: list[ResumeChunk]) -> None:
         texts = [chunk.text for chunk in chunk_list]
-        embeddings = await self._embedding_service.embed_documents(texts)
+        embeddings = await version.embedding_service.embed_documents(texts)
         points = [
             rest.PointStruct(
                 id=chunk.chunk_id,
                 vector=embedding,
-                payload={
-                    "resume_id": chunk.metadata.get("resume_id"),
-                    "position": chunk.metadata.get("position"),
-                    "text": chunk.text,
-                },
+                payload=self._build_payload(chunk),
             )
             for chunk, embedding in zip(chunk_list, embeddings, strict=False)
         ]
-        self._client.upsert(collection_name=self._collection, points=points)
-
-    async def query(self, text: str, limit: int = 5) -> list[ResumeChunk]:
-        vector = await self._embedding_service.embed_query(text)
-        search_result = self._client.search(
-            collection_name=self._collection,
-            query_vector=vector,
-            limit=limit,
+        with metrics.stage("qdrant_upsert"):
+            await asyncio.to_thread(
+                self._client.upsert, collection_name=version.name, points=points
+            )
+            # A resume chunked differently before leaves points the new ids do not cover.
+            for stale in self._stale_filters(chunk_list):
+                await asyncio.to_thread(
+                    self._client.delete,
+                    collection_name=version.name,
+                    points_selector=rest.FilterSelector(filter=stale),
+                )
+        metrics.count("qdrant_points_upserted", len(points))
+
+    async def fetch_resume_chunks(
+        self, resume_id: str, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> list[ResumeChunk]:
+        collection = (await self._read_version()).name
+        chunks: list[ResumeChunk] = []
+        offset = None
+        while True:
+            with metrics.stage("qdrant_scroll"):
+                points, offset = await asyncio.to_thread(
+                    self._client.scroll,
+                    collection_name=collection,
+                    scroll_filter=self._resume_filter(resume_id, tenant_id),
+                    limit=SCROLL_BATCH_SIZE,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False,
+                )
+            chunks.extend(
+                self._chunk_from_payload(str(point.id), point.payload or {}) for point in points
+            )
+            if offset is None:
+                break
+        chunks = await self._with_texts(chunks)
+        return sorted(chunks, key=lambda chunk: int(chunk.metadata.get("position") or 0))
+
+    async def link_resume(
+        self, resume_id: str, request_id: str, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> None:
+        lock = self._link_locks.setdefault((tenant_id, resume_id), asyncio.Lock())
+        async with lock:
+            collection = (await self._read_version()).name
+            points, _ = await asyncio.to_thread(
+                self._client.scroll,
+                collection_name=collection,
+                scroll_filter=self._resume_filter(resume_id, tenant_id),
+                limit=1,
+                with_payload=["request_ids"],
+                with_vectors=False,
+            )
+            if not points:
+                return
+            request_ids = list((points[0].payload or {}).get("request_ids") or [])
+            if request_id in request_ids:
+                return
+            linked = [*request_ids, request_id][-MAX_LINKED_REQUESTS:]
+            with metrics.stage("qdrant_set_payload"):
+                for version in self._versions():
+                    await asyncio.to_thread(
+                        self._client.set_payload,
+                        collection_name=version.name,
+                        payload={"request_ids": linked},
+                        points=self._resume_filter(resume_id, tenant_id),
+                    )
+
+    async def count_chunks(self) -> int:
+        """Return the number of chunks in the collection being migrated from."""
+
+        result = await asyncio.to_thread(
+            self._client.count, collection_name=self._primary.name, exact=True
+        )
+        return result.count
+
+    async def migrate_batch(self, offset: Any, limit: int) -> tuple[int, int, Any]:
+        """Re-embed one page of the primary collection into the migration target.
+
+        Chunks already present in the target, because they were dual-written or copied
+        by an interrupted run, are skipped. Returns the copied and skipped counts and
+        the offset of the next page, ``None`` once the collection is exhausted.
+        """
+
+        target = self._require_target()
+        with metrics.stage("qdrant_scroll"):
+            points, next_offset = await asyncio.to_thread(
+                self._client.scroll,
+                collection_name=self._primary.name,
+                limit=limit,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+        if not points:
+            return 0, 0, None
+        retrieved = await asyncio.to_thread(
+            self._client.retrieve,
+            collection_name=target.name,
+            ids=[point.id for point in points],
+            with_payload=False,
+            with_vectors=False,
+        )
+        present = {str(point.id) for point in retrieved}
+        pending = [point for point in points if str(point.id) not in present]
+        if pending:
+            chunks = await self._with_texts(
+                [self._chunk_from_payload(str(point.id), point.payload or {}) for point in pending]
+            )
+            # Texts still held in the payload move to the text store on their way over.
+            await self._store_texts(chunks)
+            embeddings = await target.embedding_service.embed_documents(
+                [chunk.text for chunk in chunks]
+            )
+            with metrics.stage("qdrant_upsert"):
+                await asyncio.to_thread(
+                    self._client.upsert,
+                    collection_name=target.name,
+                    points=[
+                        rest.PointStruct(
+                            id=point.id, vector=embedding, payload=self._point_payload(point)
+                        )
+                        for point, embedding in zip(pending, embeddings, strict=False)
+                    ],
+                )
+        return len(pending), len(points) - len(pending), next_offset
+
+    def promote_migration_target(self, drop_legacy: bool = False) -> None:
+        """Atomically point the alias at the migration target.
+
+        A pre-versioning collection named like the alias has to be deleted before the
+        alias can be created, so that requires ``drop_legacy`` and is not atomic.
+        """
+
+        target = self._require_target()
+        if self._primary.name == self._alias:
+            if not drop_legacy:
+                raise RuntimeError(
+                    f"Collection {self._alias!r} predates versioning and must be dropped to "
+                    "create the alias; pass drop_legacy to confirm."
+                )
+            logger.warning("dropping_legacy_qdrant_collection", collection=self._alias)
+            self._client.delete_collection(self._alias)
+            operations: list[Any] = [self._create_alias(target.name)]
+        else:
+            operations = [
+                rest.DeleteAliasOperation(delete_alias=rest.DeleteAlias(alias_name=self._alias)),
+                self._create_alias(target.name),
+            ]
+        self._client.update_collection_aliases(change_aliases_operations=operations)
+        self._read_collection = None
+        logger.info("qdrant_alias_swapped", alias=self._alias, collection=target.name)
+
+    def _require_target(self) -> CollectionVersion:
+        if self._target is None:
+            raise RuntimeError("No embedding migration target is configured.")
+        return self._target
+
+    @staticmethod
+    def _tenant_condition(tenant_id: str) -> rest.FieldCondition:
+        return rest.FieldCondition(key="tenant_id", match=rest.MatchValue(value=tenant_id))
+
+    @classmethod
+    def _resume_filter(cls, resume_id: str, tenant_id: str) -> rest.Filter:
+        return rest.Filter(
+            must=[
+                cls._tenant_condition(tenant_id),
+                rest.FieldCondition(key="resume_id", match=rest.MatchValue(value=resume_id)),
+            ]
+        )
+
+    @classmethod
+    def _stale_filters(cls, chunk_list: list[ResumeChunk]) -> list[rest.Filter]:
+        """Return filters matching points of the chunks' resumes that are not in the list."""
+
+        resumes: dict[str, set[str]] = {}
+        for chunk in chunk_list:
+            resume_id = chunk.metadata.get("resume_id")
+            if resume_id:
+                tenant_id = chunk.metadata.get("tenant_id") or DEFAULT_TENANT_ID
+                resumes.setdefault(tenant_id, set()).add(resume_id)
+        kept: list[rest.ExtendedPointId] = [chunk.chunk_id for chunk in chunk_list]
+        return [
+            rest.Filter(
+                must=[
+                    cls._tenant_condition(tenant_id),
+                    rest.FieldCondition(
+                        key="resume_id", match=rest.MatchAny(any=sorted(resume_ids))
+                    ),
+                ],
+                must_not=[rest.HasIdCondition(has_id=kept)],
+            )
+            for tenant_id, resume_ids in resumes.items()
+        ]
+
+    def _point_payload(self, point: Any) -> dict:
+        payload = dict(point.payload or {})
+        if self._text_store is not None:
+            payload.pop("text", None)
+        return payload
+
+    def _build_payload(self, chunk: ResumeChunk) -> dict:
+        profile = ResumeProfile.from_metadata(chunk.metadata)
+        payload = {
+            "tenant_id": chunk.metadata.get("tenant_id") or DEFAULT_TENANT_ID,
+            "resume_id": chunk.metadata.get("resume_id"),
+            "request_ids": [chunk.metadata["request_id"]] if "request_id" in chunk.metadata else [],
+            "position": chunk.metadata.get("position"),
+            "section": chunk.metadata.get("section"),
+            "filename": chunk.metadata.get("filename"),
+            # Skills are matched lowercased; their names are kept to rebuild the profile.
+            "skills": [skill.lower() for skill in profile.skills],
+            "skill_names": profile.skills,
+            "years_of_experience": profile.years_of_experience,
+            "titles": profile.titles,
+            "dates": profile.dates,
+        }
+        if self._text_store is None:
+            payload["text"] = chunk.text
+        return payload
+
+    @staticmethod
+    def _chunk_from_payload(chunk_id: str, payload: dict) -> ResumeChunk:
+        profile = ResumeProfile(
+            skills=list(payload.get("skill_names") or payload.get("skills") or []),
+            years_of_experience=payload.get("years_of_experience"),
+            titles=list(payload.get("titles") or []),
+            dates=list(payload.get("dates") or []),
+        )
+        return ResumeChunk(
+            chunk_id=chunk_id,
+            text=str(payload.get("text", "")),
+            metadata={
+                "tenant_id": str(payload.get("tenant_id") or DEFAULT_TENANT_ID),
+                "resume_id": str(payload.get("resume_id", "")),
+                "position": str(payload.get("position") or "0"),
+                "section": str(payload.get("section") or ""),
+                "filename": str(payload.get("filename") or ""),
+                **profile.to_metadata(),
+            },
         )
+
+    @classmethod
+    def _search_filter(cls, filters: ChunkFilter | None, tenant_id: str) -> rest.Filter:
+        must: list[rest.Condition] = [cls._tenant_condition(tenant_id)]
+        if filters is None or filters.is_empty():
+            return rest.Filter(must=must)
+        # Skills are stored lowercased, whatever case the filter names them in.
+        skills = [skill.lower() for skill in filters.skills]
+        if skills and filters.match_any_skill:
+            must.append(rest.FieldCondition(key="skills", match=rest.MatchAny(any=skills)))
+        else:
+            must.extend(
+                rest.FieldCondition(key="skills", match=rest.MatchValue(value=skill))
+                for skill in skills
+            )
+        if filters.min_years is not None:
+            must.append(
+                rest.FieldCondition(
+                    key="years_of_experience", range=rest.Range(gte=filters.min_years)
+                )
+            )
+        if filters.sections:
+            must.append(
+                rest.FieldCondition(key="section", match=rest.MatchAny(any=list(filters.sections)))
+            )
+        if filters.resume_ids:
+            must.append(
+                rest.FieldCondition(
+                    key="resume_id", match=rest.MatchAny(any=list(filters.resume_ids))
+                )
+            )
+        return rest.Filter(must=must)
+
+    async def query(
+        self,
+        text: str,
+        limit: int = 5,
+        filters: ChunkFilter | None = None,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> list[ResumeChunk]:
+        version = await self._read_version()
+        vector = await version.embedding_service.embed_query(text)
+        with get_tracer().span(
+            "qdrant.search", limit=limit, tenant_id=tenant_id
+        ), metrics.stage("qdrant_search"):
+            search_result = await asyncio.to_thread(
+                self._client.search,
+                collection_name=version.name,
+                query_vector=vector,
+                query_filter=self._search_filter(filters, tenant_id),
+                limit=limit,
+                with_payload=True,
+            )
         chunks: list[ResumeChunk] = []
         for index, point in enumerate(search_result):
-            payload = point.payload or {}
-            resume_id = str(payload.get("resume_id", ""))
-            chunk = ResumeChunk(
-                chunk_id=str(point.id),
-                text=str(payload.get("text", "")),
-                metadata={"resume_id": resume_id, "rank": str(index)},
-            )
+            chunk = self._chunk_from_payload(str(point.id), point.payload or {})
+            chunk.metadata.update(rank=str(index), score=f"{point.score:.6f}")
             chunks.append(chunk)
-        return chunks
+        return await self._with_texts(chunks)
@@ -0,0 +1,65 @@
+"""Request time budgets and cancellation of work whose client has gone away."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from fastapi import HTTPException, Request, status
+
+from resume_ai.domain.value_objects.deadline import Deadline
+from resume_ai.infrastructure.logging.logger import get_logger
+from resume_ai.infrastructure.observability.metrics import get_metrics
+
+logger = get_logger(__name__)
+metrics = get_metrics()
+
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+DISCONNECT_POLL_SECONDS = 0.5
+# Nginx's status for requests abandoned by the client; nobody receives the response.
+CLIENT_CLOSED_REQUEST = 499
+
+T = TypeVar("T")
+
+
+def request_deadline(request: Request, default_seconds: float | None) -> Deadline:
+    """Return the deadline from the ``X-Request-Timeout`` header, or the default budget."""
+
+    raw = request.headers.get(REQUEST_TIMEOUT_HEADER)
+    if raw is None:
+        return Deadline.after(default_seconds)
+    try:
+        seconds = float(raw)
+    except ValueError:
+        seconds = 0.0
+    if not seconds > 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{REQUEST_TIMEOUT_HEADER} must be a positive number of seconds.",
+        )
+    return Deadline.after(seconds)
+
+
+async def run_until_disconnected(
+    request: Request, awaitable: Awaitable[T], poll_interval: float = DISCONNECT_POLL_SECONDS
+) -> T:
+    """Await ``awaitable``, cancelling it as soon as the client disconnects."""
+
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                break
+    finally:
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    logger.info("client_disconnected", path=request.url.path)
+    metrics.count("requests_cancelled")
+    raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request.")
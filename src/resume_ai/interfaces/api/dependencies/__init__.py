@@ -1,15 +1,33 @@
-"""Dependency providers for FastAPI routes."""
+"""Dependency providers for FastAPI routes.
+
+Services are owned by the :class:`ServiceContainer` created in the application lifespan;
+the providers only look them up, so routes share one instance of every client and tests
+can still replace any of them through ``app.dependency_overrides``.
+"""
+
+from __future__ import annotations
 
 from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from fastapi import Request
 
 from resume_ai.application.interfaces.clock import SystemClock
+from resume_ai.application.services.admission import AdmissionController
+from resume_ai.application.services.readiness import ReadinessService
 from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
+from resume_ai.application.use_cases.search_resumes import SearchResumesUseCase
 from resume_ai.infrastructure.config.settings import AppSettings, get_settings
-from resume_ai.infrastructure.llm.openai_embedding_service import OpenAIEmbeddingService
-from resume_ai.infrastructure.llm.openai_llm_service import OpenAILLMService
-from resume_ai.infrastructure.ocr.paddle_ocr_service import PaddleOCRService
-from resume_ai.infrastructure.persistence.mongo_audit_repository import MongoAuditRepository
-from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
+from resume_ai.infrastructure.persistence.buffered_audit_repository import (
+    BufferedAuditRepository,
+)
+from resume_ai.interfaces.api.dependencies.container import ServiceContainer
+
+if TYPE_CHECKING:
+    from resume_ai.infrastructure.llm.openai_embedding_service import OpenAIEmbeddingService
+    from resume_ai.infrastructure.llm.openai_llm_service import OpenAILLMService
+    from resume_ai.infrastructure.ocr.paddle_ocr_service import PaddleOCRService
+    from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
 
 
 @lru_cache(maxsize=1)
@@ -19,65 +37,58 @@ def provide_settings() -> AppSettings:
     return get_settings()
 
 
-@lru_cache(maxsize=1)
-def provide_ocr_service() -> PaddleOCRService:
-    settings = provide_settings()
-    return PaddleOCRService(
-        language=settings.ocr_language,
-        use_gpu=settings.ocr_use_gpu,
-        model_dir=settings.ocr_model_dir,
-    )
+def provide_container(request: Request) -> ServiceContainer:
+    """Return the container created by the application lifespan."""
 
+    container: ServiceContainer | None = getattr(request.app.state, "container", None)
+    if container is None:
+        raise RuntimeError("The service container is not initialised; is the lifespan running?")
+    return container
 
-@lru_cache(maxsize=1)
-def provide_embedding_service() -> OpenAIEmbeddingService:
-    settings = provide_settings()
-    if not settings.openai_api_key:
-        raise RuntimeError("OPENAI_API_KEY is required.")
-    return OpenAIEmbeddingService(
-        api_key=settings.openai_api_key, model=settings.openai_embedding_model
-    )
 
+def provide_ocr_service(request: Request) -> PaddleOCRService:
+    return provide_container(request).ocr_service()
 
-@lru_cache(maxsize=1)
-def provide_vector_store() -> QdrantVectorStore:
-    settings = provide_settings()
-    return QdrantVectorStore(
-        url=str(settings.qdrant_url),
-        collection_name=settings.vector_collection,
-        vector_size=settings.vector_size,
-        similarity=settings.vector_similarity,
-        embedding_service=provide_embedding_service(),
-    )
 
+def provide_embedding_service(request: Request) -> OpenAIEmbeddingService:
+    return provide_container(request).embedding_service()
 
-@lru_cache(maxsize=1)
-def provide_llm_service() -> OpenAILLMService:
-    settings = provide_settings()
-    if not settings.openai_api_key:
-        raise RuntimeError("OPENAI_API_KEY is required.")
-    return OpenAILLMService(api_key=settings.openai_api_key, model=settings.openai_model)
 
+def provide_vector_store(request: Request) -> QdrantVectorStore:
+    return provide_container(request).vector_store()
 
-@lru_cache(maxsize=1)
-def provide_audit_repository() -> MongoAuditRepository:
-    settings = provide_settings()
-    return MongoAuditRepository(mongo_uri=settings.mongodb_uri)
 
+def provide_llm_service(request: Request) -> OpenAILLMService:
+    return provide_container(request).llm_service()
 
-@lru_cache(maxsize=1)
-def provide_clock() -> SystemClock:
-    return SystemClock()
 
+def provide_audit_repository(request: Request) -> BufferedAuditRepository:
+    return provide_container(request).audit_repository()
+
+
+def provide_clock(request: Request) -> SystemClock:
+    return provide_container(request).clock()
+
+
+def provide_use_case(request: Request) -> ProcessResumesUseCase:
+    """Return the shared, fully wired use case."""
+
+    return provide_container(request).use_case()
+
+
+def provide_search_use_case(request: Request) -> SearchResumesUseCase:
+    """Return the shared use case searching the indexed corpus."""
+
+    return provide_container(request).search_use_case()
+
+
+def provide_readiness_service(request: Request) -> ReadinessService:
+    """Return the readiness checker probing every external dependency."""
+
+    return provide_container(request).readiness()
 
-def provide_use_case() -> ProcessResumesUseCase:
-    """Return fully wired use case."""
 
-    return ProcessResumesUseCase(
-        ocr_service=provide_ocr_service(),
-        llm_service=provide_llm_service(),
-        vector_store=provide_vector_store(),
-        audit_repository=provide_audit_repository(),
-        clock=provide_clock(),
-    )
+def provide_admission_controller(request: Request) -> AdmissionController:
+    """Return the controller sharing processing capacity fairly between users."""
 
+    return provide_container(request).admission()
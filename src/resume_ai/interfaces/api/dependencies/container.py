@@ -0,0 +1,413 @@
+"""Lifecycle-managed container owning the application's long-lived services."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
+
+from resume_ai.application.interfaces.chunk_text_store import ChunkTextStore
+from resume_ai.application.interfaces.clock import SystemClock
+from resume_ai.application.services.admission import AdmissionController
+from resume_ai.application.services.readiness import ReadinessService
+from resume_ai.application.services.workload_scheduler import WorkloadScheduler
+from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
+from resume_ai.application.use_cases.search_resumes import SearchResumesUseCase
+from resume_ai.infrastructure.background.audit_compaction import AuditCompactionWorker
+from resume_ai.infrastructure.config.settings import AppSettings
+from resume_ai.infrastructure.logging.logger import get_logger
+from resume_ai.infrastructure.observability.metrics import get_metrics
+from resume_ai.infrastructure.observability.tracing import get_tracer
+from resume_ai.infrastructure.persistence.buffered_audit_repository import (
+    BufferedAuditRepository,
+)
+from resume_ai.interfaces.api.warmup import WarmupState, WarmupStep, run_warmup
+
+if TYPE_CHECKING:
+    from resume_ai.infrastructure.llm.cross_encoder_reranker import CrossEncoderReranker
+    from resume_ai.infrastructure.llm.openai_embedding_service import OpenAIEmbeddingService
+    from resume_ai.infrastructure.llm.openai_llm_service import OpenAILLMService
+    from resume_ai.infrastructure.ocr.paddle_ocr_service import PaddleOCRService
+    from resume_ai.infrastructure.persistence.mongo_audit_repository import (
+        MongoAuditRepository,
+    )
+    from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ServiceContainer:
+    """Builds every service once and releases them when the application stops.
+
+    Services are constructed lazily and at most once, even when the warm-up resolves
+    several of them from worker threads at the same time. Adapters backed by heavy
+    libraries are imported inside their factories so importing the app stays fast.
+    """
+
+    def __init__(self, settings: AppSettings) -> None:
+        self.settings = settings
+        self.warmup = WarmupState(enabled=settings.warmup_on_startup)
+        self._instances: dict[str, Any] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._warmup_task: asyncio.Task[None] | None = None
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def ocr_service(self) -> PaddleOCRService:
+        return self._singleton("ocr_service", self._build_ocr_service)
+
+    def embedding_service(self) -> OpenAIEmbeddingService:
+        return self._singleton("embedding_service", self._build_embedding_service)
+
+    def vector_store(self) -> QdrantVectorStore:
+        return self._singleton("vector_store", self._build_vector_store)
+
+    def chunk_text_store(self) -> ChunkTextStore | None:
+        if self.settings.chunk_text_store == "qdrant":
+            return None
+        return self._singleton("chunk_text_store", self._build_chunk_text_store)
+
+    def migration_embedding_service(self) -> OpenAIEmbeddingService | None:
+        if not self.settings.vector_migration_target_model:
+            return None
+        return self._singleton(
+            "migration_embedding_service", self._build_migration_embedding_service
+        )
+
+    def llm_service(self) -> OpenAILLMService:
+        return self._singleton("llm_service", self._build_llm_service)
+
+    def reranker(self) -> CrossEncoderReranker | None:
+        if not self.settings.rerank_model:
+            return None
+        return self._singleton("reranker", self._build_reranker)
+
+    def ocr_scheduler(self) -> WorkloadScheduler:
+        return self._singleton("ocr_scheduler", self._build_ocr_scheduler)
+
+    def llm_scheduler(self) -> WorkloadScheduler:
+        return self._singleton("llm_scheduler", self._build_llm_scheduler)
+
+    def audit_store(self) -> MongoAuditRepository:
+        return self._singleton("audit_store", self._build_audit_store)
+
+    def audit_repository(self) -> BufferedAuditRepository:
+        return self._singleton("audit_repository", self._build_audit_repository)
+
+    def clock(self) -> SystemClock:
+        return self._singleton("clock", SystemClock)
+
+    def compaction_worker(self) -> AuditCompactionWorker:
+        return self._singleton("compaction_worker", self._build_compaction_worker)
+
+    def use_case(self) -> ProcessResumesUseCase:
+        return self._singleton("use_case", self._build_use_case)
+
+    def search_use_case(self) -> SearchResumesUseCase:
+        return self._singleton("search_use_case", self._build_search_use_case)
+
+    def readiness(self) -> ReadinessService:
+        return self._singleton("readiness", self._build_readiness)
+
+    def admission(self) -> AdmissionController:
+        return self._singleton("admission", self._build_admission)
+
+    async def start(self) -> None:
+        """Start background workers and launch the warm-up without blocking startup."""
+
+        await self.audit_repository().start()
+        await self.compaction_worker().start()
+        self._warmup_task = asyncio.create_task(self._warm_up(), name="startup-warmup")
+
+    async def aclose(self) -> None:
+        """Drain in-flight requests, flush background work and close every client."""
+
+        try:
+            await asyncio.wait_for(
+                self._idle.wait(), timeout=self.settings.shutdown_drain_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.warning("shutdown_drain_timed_out", in_flight=self._in_flight)
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+        if "compaction_worker" in self._instances:
+            await self.compaction_worker().stop()
+        if "audit_repository" in self._instances:
+            await self.audit_repository().stop()
+        for name in (
+            "llm_service",
+            "embedding_service",
+            "migration_embedding_service",
+            "vector_store",
+            "chunk_text_store",
+            "audit_store",
+        ):
+            service = self._instances.pop(name, None)
+            if service is None:
+                continue
+            try:
+                if hasattr(service, "aclose"):
+                    await service.aclose()
+                elif hasattr(service, "close"):
+                    service.close()
+            except Exception as exc:  # noqa: BLE001 - keep closing the remaining clients
+                logger.warning("service_close_failed", service=name, error=str(exc))
+        self._instances.clear()
+
+    @asynccontextmanager
+    async def track_request(self) -> AsyncIterator[None]:
+        """Count a request as in flight so shutdown can wait for it."""
+
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+    async def _warm_up(self) -> None:
+        steps: dict[str, WarmupStep] = {"audit_indexes": self.audit_repository().ensure_indexes}
+        if self.settings.warmup_on_startup:
+            steps.update(
+                ocr=self.ocr_service,
+                llm=self.llm_service,
+                vector_store=self.vector_store,
+            )
+            if self.settings.rerank_model:
+                steps["reranker"] = self.reranker
+        start = perf_counter()
+        await run_warmup(steps, timeout=self.settings.warmup_timeout_seconds, state=self.warmup)
+        logger.info(
+            "warmup_finished",
+            ready=self.warmup.ready,
+            duration_ms=round((perf_counter() - start) * 1000, 3),
+        )
+
+    def _singleton(self, name: str, factory: Callable[[], T]) -> T:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return cast(T, instance)
+        with self._locks_guard:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+            return cast(T, self._instances[name])
+
+    def _build_ocr_service(self) -> PaddleOCRService:
+        from resume_ai.infrastructure.ocr.paddle_ocr_service import PaddleOCRService
+
+        return PaddleOCRService(
+            language=self.settings.ocr_language,
+            use_gpu=self.settings.ocr_use_gpu,
+            model_dir=self.settings.ocr_model_dir,
+            languages=self.settings.ocr_languages,
+            memory_budget_bytes=self.settings.ocr_model_memory_budget_mb * 2**20,
+            scheduler=self.ocr_scheduler(),
+        )
+
+    def _build_ocr_scheduler(self) -> WorkloadScheduler:
+        return WorkloadScheduler(
+            "ocr",
+            slots=self.settings.scheduler_ocr_slots,
+            reserved_interactive=self.settings.scheduler_ocr_reserved_slots,
+            metrics=get_metrics(),
+        )
+
+    def _build_llm_scheduler(self) -> WorkloadScheduler:
+        return WorkloadScheduler(
+            "llm",
+            slots=self.settings.scheduler_llm_slots,
+            reserved_interactive=self.settings.scheduler_llm_reserved_slots,
+            metrics=get_metrics(),
+        )
+
+    def _build_embedding_service(self) -> OpenAIEmbeddingService:
+        from resume_ai.infrastructure.llm.openai_embedding_service import OpenAIEmbeddingService
+
+        if not self.settings.openai_api_key:
+            raise RuntimeError("OPENAI_API_KEY is required.")
+        return OpenAIEmbeddingService(
+            api_key=self.settings.openai_api_key, model=self.settings.openai_embedding_model
+        )
+
+    def _build_migration_embedding_service(self) -> OpenAIEmbeddingService:
+        from resume_ai.infrastructure.llm.openai_embedding_service import OpenAIEmbeddingService
+
+        if not self.settings.openai_api_key:
+            raise RuntimeError("OPENAI_API_KEY is required.")
+        if not self.settings.vector_migration_target_model:
+            raise RuntimeError("VECTOR_MIGRATION_TARGET_MODEL is required.")
+        return OpenAIEmbeddingService(
+            api_key=self.settings.openai_api_key,
+            model=self.settings.vector_migration_target_model,
+            dimensions=self.settings.vector_migration_target_size,
+        )
+
+    def _build_vector_store(self) -> QdrantVectorStore:
+        from resume_ai.infrastructure.vectorstore.qdrant_store import (
+            CollectionVersion,
+            QdrantVectorStore,
+            versioned_collection_name,
+        )
+
+        target = None
+        target_model = self.settings.vector_migration_target_model
+        target_embeddings = self.migration_embedding_service()
+        if target_model and target_embeddings is not None:
+            target_size = self.settings.vector_migration_target_size or self.settings.vector_size
+            target = CollectionVersion(
+                name=versioned_collection_name(
+                    self.settings.vector_collection, target_model, target_size
+                ),
+                vector_size=target_size,
+                embedding_service=target_embeddings,
+            )
+        return QdrantVectorStore(
+            url=str(self.settings.qdrant_url),
+            collection_name=self.settings.vector_collection,
+            vector_size=self.settings.vector_size,
+            similarity=self.settings.vector_similarity,
+            embedding_service=self.embedding_service(),
+            embedding_model=self.settings.openai_embedding_model,
+            migration_target=target,
+            text_store=self.chunk_text_store(),
+        )
+
+    def _build_chunk_text_store(self) -> ChunkTextStore:
+        if self.settings.chunk_text_store == "file":
+            from resume_ai.infrastructure.storage.chunk_text_store import FileChunkTextStore
+
+            return FileChunkTextStore(self.settings.chunk_text_dir)
+        if self.settings.chunk_text_store == "mongo":
+            from resume_ai.infrastructure.persistence.mongo_chunk_text_store import (
+                MongoChunkTextStore,
+            )
+
+            # Shares the audit store's client instead of opening a second connection pool.
+            return MongoChunkTextStore(database=self.audit_store().database)
+        raise RuntimeError(
+            f"Unsupported CHUNK_TEXT_STORE '{self.settings.chunk_text_store}'; "
+            "use 'mongo', 'file' or 'qdrant'."
+        )
+
+    def _build_llm_service(self) -> OpenAILLMService:
+        from resume_ai.infrastructure.llm.openai_llm_service import OpenAILLMService
+
+        if not self.settings.openai_api_key:
+            raise RuntimeError("OPENAI_API_KEY is required.")
+        return OpenAILLMService(
+            api_key=self.settings.openai_api_key,
+            model=self.settings.openai_model,
+            scheduler=self.llm_scheduler(),
+        )
+
+    def _build_reranker(self) -> CrossEncoderReranker:
+        from resume_ai.infrastructure.llm.cross_encoder_reranker import CrossEncoderReranker
+
+        return CrossEncoderReranker(
+            model_name=self.settings.rerank_model,
+            top_k=self.settings.rerank_top_k,
+            min_score=self.settings.rerank_min_score,
+            batch_size=self.settings.rerank_batch_size,
+            cache_size=self.settings.rerank_cache_size,
+        )
+
+    def _build_audit_store(self) -> MongoAuditRepository:
+        from resume_ai.infrastructure.persistence.mongo_audit_repository import (
+            MongoAuditRepository,
+        )
+
+        return MongoAuditRepository(
+            mongo_uri=self.settings.mongodb_uri,
+            hot_retention_days=self.settings.audit_hot_retention_days,
+            archive_retention_days=self.settings.audit_archive_retention_days,
+        )
+
+    def _build_audit_repository(self) -> BufferedAuditRepository:
+        return BufferedAuditRepository(
+            sink=self.audit_store(),
+            batch_size=self.settings.audit_batch_size,
+            flush_interval=self.settings.audit_flush_interval_seconds,
+            max_queue_size=self.settings.audit_queue_size,
+            spill_path=self.settings.audit_spill_path,
+            spill_max_bytes=self.settings.audit_spill_max_bytes,
+        )
+
+    def _build_compaction_worker(self) -> AuditCompactionWorker:
+        return AuditCompactionWorker(
+            store=self.audit_store(),
+            clock=self.clock(),
+            interval_seconds=self.settings.audit_compaction_interval_seconds,
+            batch_size=self.settings.audit_compaction_batch_size,
+        )
+
+    def _build_use_case(self) -> ProcessResumesUseCase:
+        return ProcessResumesUseCase(
+            ocr_service=self.ocr_service(),
+            llm_service=self.llm_service(),
+            vector_store=self.vector_store(),
+            audit_repository=self.audit_repository(),
+            clock=self.clock(),
+            metrics=get_metrics(),
+            tracer=get_tracer(),
+            reranker=self.reranker(),
+        )
+
+    def _build_search_use_case(self) -> SearchResumesUseCase:
+        return SearchResumesUseCase(
+            vector_store=self.vector_store(),
+            llm_service=self.llm_service(),
+            audit_repository=self.audit_repository(),
+            clock=self.clock(),
+            metrics=get_metrics(),
+            tracer=get_tracer(),
+            reranker=self.reranker(),
+        )
+
+    def _build_readiness(self) -> ReadinessService:
+        return ReadinessService(
+            probes={
+                "mongo": self._probe_mongo,
+                "qdrant": self._probe_qdrant,
+                "ocr": self._probe_ocr,
+                "llm": self._probe_llm,
+            },
+            timeout=self.settings.readiness_timeout_seconds,
+            ttl=self.settings.readiness_cache_ttl_seconds,
+        )
+
+    def _build_admission(self) -> AdmissionController:
+        return AdmissionController(
+            max_pages=self.settings.admission_max_pages,
+            max_tokens=self.settings.admission_max_tokens,
+            max_queue_depth=self.settings.admission_max_queue_depth,
+            max_queued_per_user=self.settings.admission_max_queued_per_user,
+            weights=self.settings.admission_user_weights,
+            metrics=get_metrics(),
+        )
+
+    # Factories may block while constructing clients or loading models, so probes resolve
+    # services in worker threads; once built the lookup is immediate.
+    async def _probe_mongo(self) -> None:
+        await self.audit_store().ping()
+
+    async def _probe_qdrant(self) -> None:
+        store = await asyncio.to_thread(self.vector_store)
+        await store.ping()
+
+    async def _probe_ocr(self) -> None:
+        await asyncio.to_thread(self.ocr_service)
+
+    async def _probe_llm(self) -> None:
+        service = await asyncio.to_thread(self.llm_service)
+        await service.ping()
@@ -1,20 +1,59 @@
 """FastAPI application entry point."""
 
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import asdict
+from time import perf_counter
+
+from fastapi import Depends, FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import RequestResponseEndpoint
+from structlog.contextvars import bind_contextvars, clear_contextvars
 
+from resume_ai.application.services.readiness import ReadinessService
 from resume_ai.infrastructure.config.settings import get_settings
 from resume_ai.infrastructure.logging.logger import configure_logging, get_logger
+from resume_ai.infrastructure.observability.metrics import get_metrics, render_latest
+from resume_ai.infrastructure.observability.tracing import configure_tracing, shutdown_tracing
+from resume_ai.interfaces.api.dependencies import provide_container, provide_readiness_service
+from resume_ai.interfaces.api.dependencies.container import ServiceContainer
+from resume_ai.interfaces.api.request_size import RequestSizeLimitMiddleware
 from resume_ai.interfaces.api.routers import audit_router, resume_router
 
 settings = get_settings()
 configure_logging(settings.log_level)
+configure_tracing(
+    enabled=settings.tracing_enabled,
+    exporter=settings.tracing_exporter,
+    file_path=settings.tracing_file_path,
+    otlp_endpoint=settings.tracing_otlp_endpoint,
+    service_name=settings.tracing_service_name,
+)
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the service container for the lifetime of the application."""
+
+    logger.info("application_startup", env=settings.app_env)
+    container = ServiceContainer(settings)
+    app.state.container = container
+    await container.start()
+    try:
+        yield
+    finally:
+        await container.aclose()
+        shutdown_tracing()
+        logger.info("application_shutdown", env=settings.app_env)
+
+
 app = FastAPI(
     title=settings.app_name,
     version="0.1.0",
     description="Resume intelligence backend leveraging OCR and LLM reasoning.",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -26,16 +65,75 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    logger.info("application_startup", env=settings.app_env)
+app.add_middleware(RequestSizeLimitMiddleware, max_bytes=settings.max_request_bytes)
+
+
+@app.middleware("http")
+async def observe_requests(request: Request, call_next: RequestResponseEndpoint) -> Response:
+    """Collect per-request stage timings and record request latency."""
+
+    metrics = get_metrics()
+    clear_contextvars()
+    bind_contextvars(method=request.method, path=request.url.path)
+    start = perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    container: ServiceContainer | None = getattr(request.app.state, "container", None)
+    in_flight = container.track_request() if container is not None else nullcontext()
+    with metrics.request_scope():
+        try:
+            async with in_flight:
+                response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            elapsed = perf_counter() - start
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            metrics.observe_request(request.method, route, status_code, elapsed)
+            logger.info(
+                "request_completed", status=status_code, duration_ms=round(elapsed * 1000, 3)
+            )
+    return response
 
 
 @app.get("/health", tags=["health"])
 async def health_check() -> dict[str, str]:
-    """Health check endpoint."""
+    """Liveness endpoint: the process is up and serving requests."""
     return {"status": "ok"}
 
 
+@app.get("/ready", tags=["health"])
+async def readiness_check(
+    container: ServiceContainer = Depends(provide_container),
+    readiness: ReadinessService = Depends(provide_readiness_service),
+) -> JSONResponse:
+    """Readiness endpoint: 503 until warm-up finished and every dependency probe passes."""
+
+    state = container.warmup
+    content: dict[str, object] = {
+        "warmup": {name: asdict(result) for name, result in state.steps.items()},
+    }
+    if state.enabled and not state.finished:
+        content["status"] = "starting"
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
+
+    report = await readiness.check()
+    content.update(
+        status="ready" if report.ready else "degraded",
+        dependencies={name: asdict(health) for name, health in report.dependencies.items()},
+        age_seconds=report.age_seconds,
+    )
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if report.ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=content,
+    )
+
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+async def metrics_endpoint() -> Response:
+    """Expose Prometheus metrics."""
+
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
+
+
 app.include_router(resume_router.router)
 app.include_router(audit_router.router)
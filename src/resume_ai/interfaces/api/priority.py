@@ -0,0 +1,38 @@
+"""Workload class resolution for API requests."""
+
+from __future__ import annotations
+
+import hmac
+
+from fastapi import HTTPException, Request, status
+
+from resume_ai.application.services.workload_scheduler import Priority, parse_priority
+
+PRIORITY_HEADER = "X-Priority"
+PRIORITY_TOKEN_HEADER = "X-Priority-Token"
+
+
+def request_priority(request: Request, trusted_token: str = "") -> Priority:
+    """Return the workload class named by the ``X-Priority`` header.
+
+    Callers presenting ``trusted_token`` in ``X-Priority-Token`` may pick any class and
+    default to interactive. Anyone else defaults to batch and may only lower their class
+    to background, so an unauthenticated header cannot jump the interactive queue.
+    """
+
+    trusted = bool(trusted_token) and hmac.compare_digest(
+        request.headers.get(PRIORITY_TOKEN_HEADER, "").encode(), trusted_token.encode()
+    )
+    try:
+        priority = parse_priority(
+            request.headers.get(PRIORITY_HEADER),
+            default=Priority.INTERACTIVE if trusted else Priority.BATCH,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{PRIORITY_HEADER} must be one of {', '.join(p.value for p in Priority)}.",
+        ) from exc
+    if priority is Priority.INTERACTIVE and not trusted:
+        return Priority.BATCH
+    return priority
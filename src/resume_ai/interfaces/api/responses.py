@@ -0,0 +1,23 @@
+"""JSON responses encoding application dataclasses directly."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Dataclasses, datetimes and UUIDs are encoded natively; ``Z`` matches pydantic's UTC format.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+
+class DataclassJSONResponse(JSONResponse):
+    """Serializes use-case dataclasses in one pass with orjson.
+
+    Routes return this response directly, so FastAPI neither builds nor validates the
+    ``response_model`` for it; the model still documents the payload in OpenAPI. The
+    dataclasses must therefore mirror their schema field for field.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS, default=str)
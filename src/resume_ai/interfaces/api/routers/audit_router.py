@@ -1,37 +1,60 @@
 """Audit log routes."""
 
+from datetime import datetime
 from typing import List
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
+from resume_ai.application.dto.audit_query import AuditLogQuery
 from resume_ai.application.interfaces.audit_repository import AuditRepository
 from resume_ai.interfaces.api.dependencies import provide_audit_repository
+from resume_ai.interfaces.api.responses import DataclassJSONResponse
 from resume_ai.interfaces.api.schemas.audit import AuditLogSchema
+from resume_ai.interfaces.api.tenancy import request_tenant
 
 router = APIRouter(prefix="/v1/logs", tags=["audit"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get(
     "",
     response_model=List[AuditLogSchema],
+    response_class=DataclassJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="List recent audit logs",
 )
 async def list_logs(
+    http_request: Request,
     limit: int = Query(default=20, ge=1, le=100),
+    user_id: str | None = Query(default=None),
+    request_id: str | None = Query(default=None),
+    since: datetime | None = Query(default=None, description="Inclusive lower bound."),
+    until: datetime | None = Query(default=None, description="Exclusive upper bound."),
+    cursor: str | None = Query(
+        default=None, description=f"Value of the {NEXT_CURSOR_HEADER} header of the previous page."
+    ),
+    include_result: bool = Query(default=False, description="Include the full result payload."),
     repository: AuditRepository = Depends(provide_audit_repository),
-) -> List[AuditLogSchema]:
-    """Return recent audit logs for traceability."""
-
-    logs = await repository.list_logs(limit=limit)
-    return [
-        AuditLogSchema(
-            request_id=log.request_id,
-            user_id=log.user_id,
-            timestamp=log.timestamp,
-            query=log.query,
-            result=log.result,
+) -> DataclassJSONResponse:
+    """Return the tenant's audit logs newest first; follow the next-cursor header to page."""
+
+    tenant_id = request_tenant(http_request)
+    try:
+        page = await repository.list_logs(
+            AuditLogQuery(
+                limit=limit,
+                user_id=user_id,
+                request_id=request_id,
+                since=since,
+                until=until,
+                cursor=cursor,
+                include_result=include_result,
+                tenant_id=tenant_id,
+            )
         )
-        for log in logs
-    ]
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    return DataclassJSONResponse(page.items, headers=headers)
@@ -1,71 +1,159 @@
 """Resume processing routes."""
 
+import asyncio
 from typing import List
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from structlog.contextvars import bind_contextvars
 
-from resume_ai.application.dto.resume_request import ProcessResumesRequest
+from resume_ai.application.dto.resume_request import ProcessResumesRequest, ProcessResumesResponse
+from resume_ai.application.dto.resume_search import ChunkFilter, SearchResumesRequest
+from resume_ai.application.services.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    WorkCost,
+)
+from resume_ai.application.services.workload_scheduler import priority_scope
 from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
-from resume_ai.domain.value_objects.uploaded_file import UploadedFile
-from resume_ai.interfaces.api.dependencies import provide_use_case
-from resume_ai.interfaces.api.schemas.resume import ProcessResumesResponseSchema
+from resume_ai.application.use_cases.search_resumes import SearchResumesUseCase
+from resume_ai.infrastructure.config.settings import AppSettings
+from resume_ai.infrastructure.ocr.page_count import count_pages
+from resume_ai.interfaces.api.cancellation import request_deadline, run_until_disconnected
+from resume_ai.interfaces.api.dependencies import (
+    provide_admission_controller,
+    provide_search_use_case,
+    provide_settings,
+    provide_use_case,
+)
+from resume_ai.interfaces.api.priority import request_priority
+from resume_ai.interfaces.api.responses import DataclassJSONResponse
+from resume_ai.interfaces.api.schemas.resume import (
+    ProcessResumesResponseSchema,
+    SearchResumesRequestSchema,
+    SearchResumesResponseSchema,
+)
+from resume_ai.interfaces.api.tenancy import request_tenant
+from resume_ai.interfaces.api.upload_form import SpoolingRoute, spooled_upload
 
-router = APIRouter(prefix="/v1/resumes", tags=["resumes"])
+router = APIRouter(prefix="/v1/resumes", tags=["resumes"], route_class=SpoolingRoute)
 
 
 @router.post(
     "/process",
     response_model=ProcessResumesResponseSchema,
+    response_class=DataclassJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="Process resumes and optionally answer a query",
 )
 async def process_resumes(
+    http_request: Request,
     request_id: str = Form(...),
     user_id: str = Form(...),
     query: str | None = Form(default=None),
     files: List[UploadFile] = File(...),
     use_case: ProcessResumesUseCase = Depends(provide_use_case),
-) -> ProcessResumesResponseSchema:
-    """Ingest resumes, run OCR, and optionally answer a hiring query."""
+    settings: AppSettings = Depends(provide_settings),
+    admission: AdmissionController = Depends(provide_admission_controller),
+) -> DataclassJSONResponse:
+    """Ingest resumes, run OCR, and optionally answer a hiring query.
+
+    Processing stops at the time budget from ``X-Request-Timeout`` or
+    ``REQUEST_TIMEOUT_SECONDS``; whatever finished is returned with ``complete`` flags.
+    Requests wait for a fair share of OCR and LLM capacity and are refused with 429 and
+    ``Retry-After`` when the queues are full. Resumes are indexed for the tenant named
+    by ``X-Tenant-ID``. OCR pages and LLM calls run in the workload class named by
+    ``X-Priority``; only callers holding ``INTERACTIVE_PRIORITY_TOKEN`` run interactive.
+    """
 
     if not files:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No files provided.")
+    tenant_id = request_tenant(http_request)
+    priority = request_priority(http_request, settings.interactive_priority_token)
+    deadline = request_deadline(http_request, settings.request_timeout_seconds)
+    try:
+        admission.check(user_id)
+    except AdmissionRejectedError as exc:
+        raise _too_many_requests(exc) from exc
+    bind_contextvars(
+        request_id=request_id, user_id=user_id, tenant_id=tenant_id, file_count=len(files)
+    )
 
-    uploads = [
-        UploadedFile(
-            filename=file.filename,
-            content_type=file.content_type or "application/octet-stream",
-            data=await file.read(),
-        )
-        for file in files
-    ]
-    response = await use_case.execute(
-        ProcessResumesRequest(
-            request_id=request_id,
-            user_id=user_id,
-            query=query,
-            files=uploads,
-        )
+    # The files were spooled while the form was parsed and are deleted after the response.
+    uploads = [spooled_upload(file) for file in files]
+    pages = await asyncio.to_thread(lambda: sum(count_pages(upload) for upload in uploads))
+    cost = WorkCost.estimate(
+        pages=pages,
+        files=len(uploads),
+        has_query=bool(query),
+        tokens_per_page=settings.admission_tokens_per_page,
     )
-    return ProcessResumesResponseSchema(
-        request_id=response.request_id,
-        summaries=[
-            {
-                "resume_id": summary.resume_id,
-                "filename": summary.filename,
-                "summary": summary.summary,
-                "highlights": summary.highlights,
-            }
-            for summary in response.summaries
-        ],
-        query_answer=(
-            {
-                "request_id": response.query_answer.request_id,
-                "answer": response.query_answer.answer,
-                "justifications": response.query_answer.justifications,
-                "referenced_resumes": response.query_answer.referenced_resumes,
-            }
-            if response.query_answer
-            else None
-        ),
+
+    async def execute_when_admitted() -> ProcessResumesResponse:
+        async with admission.admit(user_id, cost, timeout=deadline.remaining()):
+            return await use_case.execute(
+                ProcessResumesRequest(
+                    request_id=request_id,
+                    user_id=user_id,
+                    query=query,
+                    files=uploads,
+                    deadline=deadline,
+                    tenant_id=tenant_id,
+                )
+            )
+
+    try:
+        with priority_scope(priority):
+            response = await run_until_disconnected(http_request, execute_when_admitted())
+    except AdmissionRejectedError as exc:
+        raise _too_many_requests(exc) from exc
+    return DataclassJSONResponse(response)
+
+
+def _too_many_requests(exc: AdmissionRejectedError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=exc.reason,
+        headers={"Retry-After": str(exc.retry_after)},
     )
+
+
+@router.post(
+    "/search",
+    response_model=SearchResumesResponseSchema,
+    response_class=DataclassJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search previously processed resumes",
+)
+async def search_resumes(
+    http_request: Request,
+    payload: SearchResumesRequestSchema,
+    use_case: SearchResumesUseCase = Depends(provide_search_use_case),
+    settings: AppSettings = Depends(provide_settings),
+) -> DataclassJSONResponse:
+    """Retrieve the tenant's indexed resumes matching a query, without uploading them again."""
+
+    tenant_id = request_tenant(http_request)
+    priority = request_priority(http_request, settings.interactive_priority_token)
+    bind_contextvars(request_id=payload.request_id, user_id=payload.user_id, tenant_id=tenant_id)
+    try:
+        with priority_scope(priority):
+            response = await use_case.execute(
+                SearchResumesRequest(
+                    request_id=payload.request_id,
+                    user_id=payload.user_id,
+                    query=payload.query,
+                    filters=ChunkFilter(
+                        skills=tuple(payload.filters.skills),
+                        match_any_skill=payload.filters.match_any_skill,
+                        min_years=payload.filters.min_years,
+                        sections=tuple(payload.filters.sections),
+                        resume_ids=tuple(payload.filters.resume_ids),
+                    ),
+                    limit=payload.limit,
+                    answer=payload.answer,
+                    tenant_id=tenant_id,
+                )
+            )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return DataclassJSONResponse(response)
@@ -14,4 +14,5 @@ class AuditLogSchema(BaseModel):
     timestamp: datetime
     query: Optional[str]
     result: Dict[str, Any]
+    tenant_id: str = Field(..., examples=["techmatch"])
 
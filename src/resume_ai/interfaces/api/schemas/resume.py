@@ -15,6 +15,7 @@ class ResumeSummarySchema(BaseModel):
         default_factory=list,
         example=["Python", "AWS", "Team leadership"],
     )
+    complete: bool = Field(default=True, description="False when the time budget ran out first.")
 
 
 class QueryAnswerSchema(BaseModel):
@@ -24,6 +25,7 @@ class QueryAnswerSchema(BaseModel):
     answer: str
     justifications: List[str]
     referenced_resumes: List[str]
+    complete: bool = True
 
 
 class ProcessResumesResponseSchema(BaseModel):
@@ -32,4 +34,44 @@ class ProcessResumesResponseSchema(BaseModel):
     request_id: str
     summaries: List[ResumeSummarySchema]
     query_answer: Optional[QueryAnswerSchema] = None
+    complete: bool = True
 
+
+class SearchFiltersSchema(BaseModel):
+    """Optional structured restrictions for a corpus search."""
+
+    skills: List[str] = Field(default_factory=list, examples=[["Python", "Kubernetes"]])
+    match_any_skill: bool = False
+    min_years: Optional[float] = Field(default=None, ge=0, examples=[5])
+    sections: List[str] = Field(default_factory=list, examples=[["experience"]])
+    resume_ids: List[str] = Field(default_factory=list)
+
+
+class SearchResumesRequestSchema(BaseModel):
+    """Query over resumes that were already processed."""
+
+    request_id: str
+    user_id: str
+    query: str = Field(..., min_length=1, examples=["Backend engineers with 5+ years of Python"])
+    filters: SearchFiltersSchema = Field(default_factory=SearchFiltersSchema)
+    limit: int = Field(default=10, ge=1, le=50)
+    answer: bool = False
+
+
+class ResumeMatchSchema(BaseModel):
+    """A retrieved resume and its best matching snippets."""
+
+    resume_id: str
+    filename: str
+    score: float
+    skills: List[str]
+    years_of_experience: Optional[float] = None
+    snippets: List[str]
+
+
+class SearchResumesResponseSchema(BaseModel):
+    """Response returned by the search endpoint."""
+
+    request_id: str
+    matches: List[ResumeMatchSchema]
+    query_answer: Optional[QueryAnswerSchema] = None
@@ -0,0 +1,21 @@
+"""Tenant resolution for API requests."""
+
+from __future__ import annotations
+
+from fastapi import HTTPException, Request, status
+
+from resume_ai.domain.value_objects.tenant import parse_tenant_id
+
+TENANT_HEADER = "X-Tenant-ID"
+
+
+def request_tenant(request: Request) -> str:
+    """Return the tenant named by the ``X-Tenant-ID`` header, or the default tenant."""
+
+    try:
+        return parse_tenant_id(request.headers.get(TENANT_HEADER))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{TENANT_HEADER} must be 1-64 letters, digits, '_', '.' or '-'.",
+        ) from exc
@@ -0,0 +1,180 @@
+"""Multipart form parsing that streams uploaded files straight into spool files."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import Any
+
+import multipart  # type: ignore[import-untyped]
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from multipart.multipart import parse_options_header  # type: ignore[import-untyped]
+from starlette.datastructures import FormData, Headers, UploadFile
+
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+from resume_ai.infrastructure.config.settings import get_settings
+from resume_ai.infrastructure.storage.upload_spool import UploadSpool, UploadTooLargeError
+
+
+class SpooledUploadFile(UploadFile):
+    """An upload whose content was written to a named spool file while it was received."""
+
+    def __init__(self, spool: UploadSpool, headers: Headers) -> None:
+        super().__init__(
+            file=spool.file,  # type: ignore[arg-type]
+            filename=spool.filename,
+            headers=headers,
+        )
+        self.spool = spool
+        self.uploaded: UploadedFile | None = None
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.spool.close)
+
+
+def spooled_upload(file: UploadFile) -> UploadedFile:
+    """Return the spool file reference of an upload parsed by :class:`SpoolingRequest`."""
+
+    if not isinstance(file, SpooledUploadFile) or file.uploaded is None:
+        raise TypeError("Upload was not received through a SpoolingRoute.")
+    return file.uploaded
+
+
+class _SpoolingParser:
+    """Feeds the body to python-multipart, writing file parts as their bytes arrive."""
+
+    def __init__(self, headers: Headers, directory: str | None, max_file_bytes: int) -> None:
+        self._directory = directory
+        self._max_file_bytes = max_file_bytes
+        _, params = parse_options_header(headers.get("content-type", ""))
+        charset = params.get(b"charset", b"utf-8")
+        self._charset = charset.decode("latin-1") if isinstance(charset, bytes) else charset
+        if b"boundary" not in params:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Missing boundary in multipart."
+            )
+        self._parser = multipart.MultipartParser(
+            params[b"boundary"],
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+        self.items: list[tuple[str, str | UploadFile]] = []
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: list[tuple[bytes, bytes]] = []
+        self._name = ""
+        self._data = b""
+        self._file: SpooledUploadFile | None = None
+        self._files: list[SpooledUploadFile] = []
+        self._pending: list[tuple[SpooledUploadFile, bytes]] = []
+
+    async def parse(self, stream: AsyncIterator[bytes]) -> FormData:
+        try:
+            async for chunk in stream:
+                self._parser.write(chunk)
+                if self._pending:
+                    pending, self._pending = self._pending, []
+                    await asyncio.to_thread(_write_parts, pending)
+            self._parser.finalize()
+            for file in self._files:
+                file.uploaded = file.spool.finish()
+                file.size = file.spool.size
+        except BaseException as exc:
+            for file in self._files:
+                file.spool.close()
+            if isinstance(exc, UploadTooLargeError):
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)
+                ) from exc
+            if isinstance(exc, multipart.exceptions.FormParserError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Malformed multipart body."
+                ) from exc
+            raise
+        return FormData(self.items)
+
+    def _on_part_begin(self) -> None:
+        self._headers, self._name, self._data, self._file = [], "", b"", None
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers.append((self._header_field.lower(), self._header_value))
+        self._header_field, self._header_value = b"", b""
+
+    def _on_headers_finished(self) -> None:
+        headers = Headers(raw=self._headers)
+        _, options = parse_options_header(headers.get("content-disposition", ""))
+        self._name = options.get(b"name", b"").decode(self._charset, errors="replace")
+        if b"filename" in options:
+            spool = UploadSpool(
+                filename=options[b"filename"].decode(self._charset, errors="replace"),
+                content_type=headers.get("content-type", "application/octet-stream"),
+                directory=self._directory,
+                max_bytes=self._max_file_bytes,
+            )
+            self._file = SpooledUploadFile(spool, headers)
+            self._files.append(self._file)
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._file is None:
+            self._data += data[start:end]
+        else:
+            self._pending.append((self._file, data[start:end]))
+
+    def _on_part_end(self) -> None:
+        if self._file is None:
+            self.items.append((self._name, self._data.decode(self._charset, errors="replace")))
+        else:
+            self.items.append((self._name, self._file))
+
+
+def _write_parts(pending: list[tuple[SpooledUploadFile, bytes]]) -> None:
+    for file, data in pending:
+        file.spool.write(data)
+
+
+class SpoolingRequest(Request):
+    """Request whose multipart files are spooled to ``UPLOAD_SPOOL_DIR`` as they arrive.
+
+    Starlette buffers file parts in anonymous temporary files, which would have to be
+    copied again to give OCR a path. Here each part is written once to a named file,
+    hashed on the way, and refused with 413 as soon as it passes ``MAX_UPLOAD_BYTES``.
+    The files are deleted when FastAPI closes the form after the endpoint returns.
+    """
+
+    async def _get_form(
+        self, *, max_files: int | float = 1000, max_fields: int | float = 1000
+    ) -> FormData:
+        content_type, _ = parse_options_header(self.headers.get("content-type", ""))
+        if self._form is None and content_type == b"multipart/form-data":
+            settings = get_settings()
+            parser = _SpoolingParser(
+                self.headers, settings.upload_spool_dir, settings.max_upload_bytes
+            )
+            self._form = await parser.parse(self.stream())
+        return await super()._get_form(max_files=max_files, max_fields=max_fields)
+
+
+class SpoolingRoute(APIRoute):
+    """Route class that hands its endpoint a :class:`SpoolingRequest`."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def spooling_handler(request: Request) -> Response:
+            return await handler(SpoolingRequest(request.scope, request.receive))
+
+        return spooling_handler
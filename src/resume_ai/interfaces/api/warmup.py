@@ -0,0 +1,77 @@
+"""Startup warm-up running expensive initialisation steps concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Mapping
+
+from resume_ai.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+WarmupStep = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class StepResult:
+    """Outcome of a single warm-up step."""
+
+    ok: bool
+    duration_ms: float
+    error: str | None = None
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up, read by the readiness endpoint."""
+
+    enabled: bool = True
+    finished: bool = False
+    steps: dict[str, StepResult] = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        """Return whether warm-up is disabled or finished without failures."""
+
+        if not self.enabled:
+            return True
+        return self.finished and all(result.ok for result in self.steps.values())
+
+
+async def run_warmup(
+    steps: Mapping[str, WarmupStep], timeout: float, state: WarmupState | None = None
+) -> WarmupState:
+    """Run every step concurrently, each bounded by ``timeout`` seconds.
+
+    Coroutine functions are awaited on the event loop; plain callables, such as model
+    loaders and blocking client constructors, run in worker threads.
+    """
+
+    state = state or WarmupState()
+
+    async def _run(name: str, step: WarmupStep) -> None:
+        start = perf_counter()
+        try:
+            if inspect.iscoroutinefunction(step):
+                await asyncio.wait_for(step(), timeout=timeout)
+            else:
+                await asyncio.wait_for(asyncio.to_thread(step), timeout=timeout)
+        except Exception as exc:  # noqa: BLE001 - a failed step must not abort the others
+            error = "timed out" if isinstance(exc, asyncio.TimeoutError) else str(exc)
+            result = StepResult(ok=False, duration_ms=_elapsed_ms(start), error=error)
+            logger.warning("warmup_step_failed", step=name, error=error)
+        else:
+            result = StepResult(ok=True, duration_ms=_elapsed_ms(start))
+            logger.info("warmup_step_completed", step=name, duration_ms=result.duration_ms)
+        state.steps[name] = result
+
+    await asyncio.gather(*(_run(name, step) for name, step in steps.items()))
+    state.finished = True
+    return state
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((perf_counter() - start) * 1000, 3)
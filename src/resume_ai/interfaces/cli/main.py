@@ -0,0 +1,208 @@
+"""Command line interface for operational tasks such as bulk ingestion."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from resume_ai.application.dto.bulk_ingest import BulkIngestRequest, BulkIngestStats
+from resume_ai.application.interfaces.ingest_checkpoint import (
+    IngestCheckpoint,
+    InMemoryIngestCheckpoint,
+)
+from resume_ai.application.services.workload_scheduler import (
+    Priority,
+    parse_priority,
+    priority_scope,
+)
+from resume_ai.application.use_cases.bulk_ingest import BulkIngestUseCase
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID, parse_tenant_id
+from resume_ai.infrastructure.config.settings import get_settings
+from resume_ai.infrastructure.logging.logger import configure_logging, get_logger
+from resume_ai.infrastructure.storage.ingest_checkpoint import FileIngestCheckpoint
+from resume_ai.infrastructure.storage.resume_sources import iter_resume_files
+from resume_ai.infrastructure.vectorstore.migration import EmbeddingMigration, MigrationProgress
+from resume_ai.interfaces.api.dependencies.container import ServiceContainer
+
+logger = get_logger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="resume-ai-cli", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser(
+        "ingest", help="index every resume in a directory, zip or tar archive"
+    )
+    ingest.add_argument("source", help="directory, .zip or .tar[.gz] archive of resumes")
+    ingest.add_argument(
+        "--checkpoint",
+        help="file recording completed resumes; rerun with the same file to resume",
+    )
+    ingest.add_argument("--ocr-workers", type=int, default=4, help="concurrent OCR extractions")
+    ingest.add_argument(
+        "--batch-size", type=int, default=256, help="minimum chunks per embedding/upsert call"
+    )
+    ingest.add_argument("--summary-workers", type=int, default=4, help="concurrent LLM summaries")
+    ingest.add_argument(
+        "--skip-summaries", action="store_true", help="index only, without LLM summaries"
+    )
+    ingest.add_argument("--request-id", help="run identifier recorded in chunks and audit logs")
+    ingest.add_argument("--user-id", default="cli", help="user recorded in the audit logs")
+    ingest.add_argument(
+        "--tenant-id",
+        type=parse_tenant_id,
+        default=DEFAULT_TENANT_ID,
+        help="tenant owning the resumes",
+    )
+    ingest.add_argument(
+        "--priority",
+        type=parse_priority,
+        default=Priority.BATCH,
+        help="workload class of OCR pages and LLM calls: batch (default), background or "
+        "interactive",
+    )
+
+    migrate = commands.add_parser(
+        "migrate-embeddings",
+        help="re-embed indexed chunks into VECTOR_MIGRATION_TARGET_MODEL's collection",
+    )
+    migrate.add_argument("--batch-size", type=int, help="chunks re-embedded per call")
+    migrate.add_argument(
+        "--max-rate", type=float, help="maximum re-embedded chunks per second, 0 to disable"
+    )
+    migrate.add_argument(
+        "--swap", action="store_true", help="point the collection alias at the target when done"
+    )
+    migrate.add_argument(
+        "--drop-legacy-collection",
+        action="store_true",
+        help="allow --swap to delete a collection created before versioning",
+    )
+    return parser
+
+
+async def ingest(args: argparse.Namespace) -> BulkIngestStats:
+    """Run a bulk ingestion with the production adapters."""
+
+    settings = get_settings()
+    container = ServiceContainer(settings)
+    checkpoint: IngestCheckpoint
+    if args.checkpoint:
+        checkpoint = FileIngestCheckpoint(args.checkpoint)
+    else:
+        checkpoint = InMemoryIngestCheckpoint()
+    request_id = args.request_id or datetime.now(tz=timezone.utc).strftime("bulk-%Y%m%d%H%M%S")
+    audit_repository = container.audit_repository()
+    await audit_repository.start()
+    try:
+        use_case = BulkIngestUseCase(
+            process_use_case=container.use_case(),
+            audit_repository=audit_repository,
+            clock=container.clock(),
+            checkpoint=checkpoint,
+            ocr_concurrency=args.ocr_workers,
+            index_batch_size=args.batch_size,
+            summary_concurrency=args.summary_workers,
+        )
+        with priority_scope(args.priority):
+            return await use_case.execute(
+                BulkIngestRequest(
+                    request_id=request_id,
+                    user_id=args.user_id,
+                    files=iter_resume_files(args.source),
+                    skip_summaries=args.skip_summaries,
+                    tenant_id=args.tenant_id,
+                ),
+                on_progress=print_progress,
+            )
+    finally:
+        await container.aclose()
+
+
+async def migrate_embeddings(args: argparse.Namespace) -> MigrationProgress:
+    """Backfill the migration target collection and optionally switch reads to it."""
+
+    settings = get_settings()
+    if not settings.vector_migration_target_model:
+        raise SystemExit("VECTOR_MIGRATION_TARGET_MODEL must be set to migrate embeddings.")
+    container = ServiceContainer(settings)
+    try:
+        migration = EmbeddingMigration(
+            container.vector_store(),
+            batch_size=args.batch_size or settings.vector_migration_batch_size,
+            max_chunks_per_second=(
+                settings.vector_migration_max_chunks_per_second
+                if args.max_rate is None
+                else args.max_rate
+            ),
+        )
+        progress = await migration.run(on_progress=print_migration_progress)
+        if args.swap:
+            migration.swap(drop_legacy=args.drop_legacy_collection)
+        return progress
+    finally:
+        await container.aclose()
+
+
+def print_migration_progress(progress: MigrationProgress) -> None:
+    eta = progress.eta_seconds()
+    print(
+        f"[{progress.elapsed_seconds:8.1f}s] {progress.processed}/{progress.total} "
+        f"({progress.percent():.1f}%) copied={progress.copied} skipped={progress.skipped} "
+        f"chunks/s={progress.chunks_per_second():.1f} eta={'?' if eta is None else f'{eta:.0f}s'}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def print_progress(stats: BulkIngestStats) -> None:
+    print(
+        f"[{stats.elapsed_seconds:8.1f}s] processed={stats.processed} reused={stats.reused} "
+        f"skipped={stats.skipped} failed={stats.failed} chunks={stats.chunks} "
+        f"files/s={stats.files_per_second():.2f} chunks/s={stats.chunks_per_second():.1f}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging(get_settings().log_level)
+    if args.command == "migrate-embeddings":
+        progress = asyncio.run(migrate_embeddings(args))
+        print(
+            json.dumps(
+                {**asdict(progress), "chunks_per_second": round(progress.chunks_per_second(), 3)},
+                indent=2,
+            )
+        )
+        return 0
+    stats = asyncio.run(ingest(args))
+    for filename, error in stats.failures.items():
+        logger.warning("bulk_ingest_file_failed", filename=filename, error=error)
+    print(
+        json.dumps(
+            {
+                **asdict(stats),
+                "files_per_second": round(stats.files_per_second(), 3),
+                "chunks_per_second": round(stats.chunks_per_second(), 3),
+            },
+            indent=2,
+        )
+    )
+    return 1 if stats.failed else 0
+
+
+def app() -> None:
+    """Console script entry point declared in ``pyproject.toml``."""
+
+    sys.exit(main())
+
+
+if __name__ == "__main__":
+    app()
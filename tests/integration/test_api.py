@@ -1,17 +1,27 @@
 """Integration tests for FastAPI layer."""
 
+import os
 from typing import Any
 
 import pytest
+from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
+from resume_ai.application.dto.audit_query import AuditLogPage
 from resume_ai.application.dto.resume_request import (
     ProcessResumesResponse,
     QueryAnswerResponse,
     ResumeSummaryResponse,
 )
+from resume_ai.application.dto.resume_search import ResumeMatch, SearchResumesResponse
+from resume_ai.application.services.admission import AdmissionController
+from resume_ai.application.services.readiness import ReadinessService
+from resume_ai.application.services.workload_scheduler import Priority, current_priority
+from resume_ai.infrastructure.config.settings import get_settings
 from resume_ai.interfaces.api import dependencies
 from resume_ai.interfaces.api.main import app
+from resume_ai.interfaces.api.request_size import RequestSizeLimitMiddleware
+from resume_ai.interfaces.api.warmup import WarmupState
 
 
 class StubUseCase:
@@ -42,8 +52,31 @@ class StubAuditRepository:
     async def save(self, log) -> None:
         self.items.append(log)
 
-    async def list_logs(self, limit: int = 50):
-        return self.items[:limit]
+    async def list_logs(self, query=None):
+        return AuditLogPage(items=self.items[: query.limit], next_cursor=None)
+
+
+class StubSearchUseCase:
+    def __init__(self) -> None:
+        self.requests: list[Any] = []
+        self.priorities: list[Priority] = []
+
+    async def execute(self, request):
+        self.requests.append(request)
+        self.priorities.append(current_priority())
+        return SearchResumesResponse(
+            request_id=request.request_id,
+            matches=[
+                ResumeMatch(
+                    resume_id="ABC123",
+                    filename="resume.pdf",
+                    score=0.82,
+                    skills=["Python"],
+                    years_of_experience=6.0,
+                    snippets=["Built Python services."],
+                )
+            ],
+        )
 
 
 @pytest.fixture()
@@ -76,7 +109,200 @@ def test_process_resumes_endpoint_returns_payload(test_client: TestClient) -> No
     assert body["query_answer"]["answer"] == "Candidate matches."
 
 
+def test_uploads_are_spooled_once_and_removed_after_the_response(
+    test_client: TestClient, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(get_settings(), "upload_spool_dir", str(tmp_path))
+    received: list[Any] = []
+
+    class RecordingUseCase(StubUseCase):
+        async def execute(self, request):
+            received.extend(
+                (upload.path, upload.size, os.path.exists(upload.path)) for upload in request.files
+            )
+            return await super().execute(request)
+
+    app.dependency_overrides[dependencies.provide_use_case] = lambda: RecordingUseCase()
+    response = test_client.post(
+        "/v1/resumes/process",
+        data={"request_id": "req-4", "user_id": "fabio"},
+        files=[("files", ("resume.pdf", b"dummy", "application/pdf"))],
+    )
+
+    assert response.status_code == 200
+    [(path, size, existed)] = received
+    assert os.path.dirname(path) == str(tmp_path) and size == 5 and existed
+    assert os.listdir(tmp_path) == []
+
+
+def test_oversized_upload_is_refused_while_streaming(
+    test_client: TestClient, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(get_settings(), "upload_spool_dir", str(tmp_path))
+    monkeypatch.setattr(get_settings(), "max_upload_bytes", 4)
+
+    response = test_client.post(
+        "/v1/resumes/process",
+        data={"request_id": "req-5", "user_id": "fabio"},
+        files=[("files", ("resume.pdf", b"dummy", "application/pdf"))],
+    )
+
+    assert response.status_code == 413
+    assert os.listdir(tmp_path) == []
+
+
+def test_chunked_body_over_the_request_limit_is_refused() -> None:
+    limited = FastAPI()
+    limited.add_middleware(RequestSizeLimitMiddleware, max_bytes=8)
+
+    @limited.post("/echo")
+    async def echo(request: Request) -> dict[str, int]:
+        return {"size": len(await request.body())}
+
+    with TestClient(limited) as client:
+        small = client.post("/echo", content=iter([b"1234", b"5678"]))
+        large = client.post("/echo", content=iter([b"1234", b"5678", b"9"]))
+        declared = client.post("/echo", content=b"x" * 9)
+
+    assert small.json() == {"size": 8}
+    assert "content-length" not in large.request.headers
+    assert large.status_code == 413
+    assert declared.status_code == 413
+
+
 def test_list_logs_endpoint_returns_items(test_client: TestClient) -> None:
     response = test_client.get("/v1/logs")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+def test_metrics_endpoint_exposes_prometheus_payload(test_client: TestClient) -> None:
+    test_client.get("/v1/logs")
+
+    response = test_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert 'resume_ai_http_request_seconds_count{method="GET",route="/v1/logs"' in response.text
+
+
+def test_readiness_is_separate_from_liveness(test_client: TestClient) -> None:
+    async def healthy() -> None:
+        return None
+
+    async def broken() -> None:
+        raise ConnectionError("connection refused")
+
+    container = test_client.app.state.container
+    container.warmup = WarmupState(finished=False)
+    assert test_client.get("/health").status_code == 200
+    assert test_client.get("/ready").json()["status"] == "starting"
+
+    container.warmup = WarmupState(finished=True)
+    app.dependency_overrides[dependencies.provide_readiness_service] = lambda: ReadinessService(
+        {"mongo": healthy, "qdrant": broken}
+    )
+    try:
+        response = test_client.get("/ready")
+    finally:
+        app.dependency_overrides.pop(dependencies.provide_readiness_service, None)
+
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "degraded"
+    assert body["dependencies"]["mongo"]["ok"] is True
+    assert body["dependencies"]["qdrant"]["error"] == "connection refused"
+
+
+def test_search_endpoint_queries_indexed_resumes(test_client: TestClient) -> None:
+    stub = StubSearchUseCase()
+    app.dependency_overrides[dependencies.provide_search_use_case] = lambda: stub
+    try:
+        response = test_client.post(
+            "/v1/resumes/search",
+            json={
+                "request_id": "req-2",
+                "user_id": "fabio",
+                "query": "Python engineers",
+                "filters": {"skills": ["Python"], "min_years": 5},
+                "limit": 3,
+            },
+            headers={"X-Tenant-ID": "acme"},
+        )
+    finally:
+        app.dependency_overrides.pop(dependencies.provide_search_use_case, None)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["matches"][0]["resume_id"] == "ABC123"
+    assert body["query_answer"] is None
+    assert stub.requests[0].filters.skills == ("Python",)
+    assert stub.requests[0].limit == 3
+    assert stub.requests[0].tenant_id == "acme"
+
+
+def test_invalid_tenant_header_is_rejected(test_client: TestClient) -> None:
+    response = test_client.get("/v1/logs", headers={"X-Tenant-ID": "acme/globex"})
+
+    assert response.status_code == 400
+
+
+def test_process_endpoint_rejects_with_retry_after_when_queue_is_full(
+    test_client: TestClient,
+) -> None:
+    full = AdmissionController(max_pages=1, max_tokens=1, max_queue_depth=0)
+    app.dependency_overrides[dependencies.provide_admission_controller] = lambda: full
+    try:
+        response = test_client.post(
+            "/v1/resumes/process",
+            data={"request_id": "req-3", "user_id": "bulk"},
+            files=[("files", ("resume.pdf", b"dummy", "application/pdf"))],
+        )
+    finally:
+        app.dependency_overrides.pop(dependencies.provide_admission_controller, None)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+def test_invalid_priority_header_is_rejected(test_client: TestClient) -> None:
+    stub = StubSearchUseCase()
+    app.dependency_overrides[dependencies.provide_search_use_case] = lambda: stub
+    try:
+        response = test_client.post(
+            "/v1/resumes/search",
+            json={"request_id": "req-4", "user_id": "fabio", "query": "Python engineers"},
+            headers={"X-Priority": "urgent"},
+        )
+    finally:
+        app.dependency_overrides.pop(dependencies.provide_search_use_case, None)
+
+    assert response.status_code == 400
+    assert stub.requests == []
+
+
+def test_only_trusted_callers_run_interactive(test_client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "interactive_priority_token", "s3cret")
+    stub = StubSearchUseCase()
+    app.dependency_overrides[dependencies.provide_search_use_case] = lambda: stub
+    payload = {"request_id": "req-6", "user_id": "fabio", "query": "Python engineers"}
+    try:
+        for headers in (
+            {},
+            {"X-Priority": "interactive"},
+            {"X-Priority": "interactive", "X-Priority-Token": "guess"},
+            {"X-Priority": "background"},
+            {"X-Priority-Token": "s3cret"},
+            {"X-Priority": "batch", "X-Priority-Token": "s3cret"},
+        ):
+            assert test_client.post("/v1/resumes/search", json=payload, headers=headers).is_success
+    finally:
+        app.dependency_overrides.pop(dependencies.provide_search_use_case, None)
+
+    assert stub.priorities == [
+        Priority.BATCH,
+        Priority.BATCH,
+        Priority.BATCH,
+        Priority.BACKGROUND,
+        Priority.INTERACTIVE,
+        Priority.BATCH,
+    ]
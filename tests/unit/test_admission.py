@@ -0,0 +1,134 @@
+"""Unit tests for AdmissionController."""
+
+import asyncio
+
+import pytest
+
+from resume_ai.application.services.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    WorkCost,
+)
+
+ONE_PAGE = WorkCost(pages=1, tokens=100)
+
+
+async def _run_all(controller: AdmissionController, users: list[str]) -> list[str]:
+    """Queue one request per entry behind a blocker and return the order they ran in."""
+
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def blocker() -> None:
+        async with controller.admit("blocker", ONE_PAGE):
+            await release.wait()
+
+    async def request(user_id: str) -> None:
+        async with controller.admit(user_id, ONE_PAGE):
+            order.append(user_id)
+
+    blocking = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+    tasks = []
+    for user_id in users:
+        tasks.append(asyncio.create_task(request(user_id)))
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocking, *tasks)
+    return order
+
+
+@pytest.mark.asyncio()
+async def test_heavy_user_does_not_starve_others() -> None:
+    controller = AdmissionController(max_pages=1, max_tokens=1_000)
+
+    order = await _run_all(controller, ["bulk", "bulk", "bulk", "bulk", "alice", "bob"])
+
+    assert order.index("alice") <= 1
+    assert order.index("bob") <= 2
+    assert order[-1] == "bulk"
+
+
+@pytest.mark.asyncio()
+async def test_weights_give_proportionally_more_turns() -> None:
+    controller = AdmissionController(max_pages=1, max_tokens=1_000, weights={"gold": 2.0})
+
+    order = await _run_all(controller, ["gold"] * 4 + ["basic"] * 4)
+
+    assert order[:3].count("gold") == 2
+    assert order[:6].count("gold") == 4
+
+
+@pytest.mark.asyncio()
+async def test_budgets_are_measured_in_pages_and_tokens() -> None:
+    controller = AdmissionController(max_pages=10, max_tokens=1_000)
+    running = 0
+    peak = 0
+
+    async def request(cost: WorkCost) -> None:
+        nonlocal running, peak
+        async with controller.admit("user", cost):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(request(WorkCost(pages=4, tokens=100)) for _ in range(4)))
+    assert peak == 2
+    peak = 0
+    await asyncio.gather(*(request(WorkCost(pages=1, tokens=600)) for _ in range(3)))
+    assert peak == 1
+
+
+@pytest.mark.asyncio()
+async def test_full_queue_is_rejected_early_with_retry_hint() -> None:
+    controller = AdmissionController(
+        max_pages=1, max_tokens=1_000, max_queue_depth=10, max_queued_per_user=1
+    )
+    release = asyncio.Event()
+
+    async def hold(user_id: str) -> None:
+        async with controller.admit(user_id, ONE_PAGE):
+            await release.wait()
+
+    running = asyncio.create_task(hold("bulk"))
+    queued = asyncio.create_task(hold("bulk"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError) as excinfo:
+        controller.check("bulk")
+    assert excinfo.value.retry_after >= 1
+    controller.check("alice")
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert controller.queue_depth == 0
+
+
+@pytest.mark.asyncio()
+async def test_waiting_past_the_timeout_gives_up_its_place() -> None:
+    controller = AdmissionController(max_pages=1, max_tokens=1_000)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with controller.admit("a", ONE_PAGE):
+            await release.wait()
+
+    running = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    with pytest.raises(AdmissionRejectedError):
+        async with controller.admit("b", ONE_PAGE, timeout=0.01):
+            pass
+    assert controller.queue_depth == 0
+
+    release.set()
+    await running
+    async with controller.admit("b", ONE_PAGE, timeout=0.01):
+        pass
+
+
+def test_cost_estimate_counts_pages_and_llm_tokens() -> None:
+    cost = WorkCost.estimate(pages=3, files=2, has_query=True, tokens_per_page=800)
+
+    assert cost.pages == 3
+    assert cost.tokens == 3 * 800 + 2 * 400 + 2 * 500
@@ -0,0 +1,142 @@
+"""Unit tests for the buffered audit writer."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.infrastructure.persistence.buffered_audit_repository import (
+    BufferedAuditRepository,
+    _serialize,
+)
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.batches: list[list[AuditLog]] = []
+        self.available = True
+        self.poisoned: set[str] = set()
+
+    async def save_many(self, logs) -> None:
+        if not self.available:
+            raise ConnectionError("mongo down")
+        if any(log.request_id in self.poisoned for log in logs):
+            raise ValueError("document failed validation")
+        self.batches.append(list(logs))
+
+    async def ping(self) -> None:
+        if not self.available:
+            raise ConnectionError("mongo down")
+
+    async def list_logs(self, query=None):
+        return [log for batch in self.batches for log in batch]
+
+    async def ensure_indexes(self) -> None:
+        return None
+
+
+def _log(request_id: str) -> AuditLog:
+    return AuditLog(
+        request_id=request_id,
+        user_id="fabio",
+        timestamp=datetime(2025, 11, 6, tzinfo=timezone.utc),
+        query=None,
+        result={"summaries": []},
+    )
+
+
+@pytest.mark.asyncio()
+async def test_queued_logs_are_flushed_in_batches_on_stop() -> None:
+    sink = RecordingSink()
+    repository = BufferedAuditRepository(sink, batch_size=2, flush_interval=60)
+
+    await repository.start()
+    for index in range(3):
+        await repository.save(_log(str(index)))
+    await repository.stop()
+
+    assert [[log.request_id for log in batch] for batch in sink.batches] == [["0", "1"], ["2"]]
+
+
+@pytest.mark.asyncio()
+async def test_failed_batches_are_spilled_and_replayed(tmp_path) -> None:
+    sink = RecordingSink()
+    sink.available = False
+    repository = BufferedAuditRepository(
+        sink, batch_size=10, flush_interval=0.01, spill_path=str(tmp_path / "spill.jsonl")
+    )
+
+    await repository.start()
+    await repository.save(_log("lost?"))
+    await repository.stop()
+    sink.available = True
+    await repository.save(_log("next"))
+
+    assert [log.request_id for batch in sink.batches for log in batch] == ["lost?", "next"]
+    assert sink.batches[0][0].timestamp == _log("x").timestamp
+    assert not (tmp_path / "spill.jsonl").exists()
+
+
+@pytest.mark.asyncio()
+async def test_flusher_survives_a_failing_spill(tmp_path) -> None:
+    sink = RecordingSink()
+    sink.available = False
+    (tmp_path / "not-a-dir").write_text("")
+    repository = BufferedAuditRepository(
+        sink,
+        batch_size=1,
+        flush_interval=0.01,
+        max_queue_size=1,
+        spill_path=str(tmp_path / "not-a-dir" / "spill.jsonl"),
+    )
+
+    await repository.start()
+    for index in range(3):
+        await asyncio.wait_for(repository.save(_log(str(index))), timeout=1)
+    sink.available = True
+    await repository.save(_log("after"))
+    await asyncio.wait_for(repository.stop(), timeout=1)
+
+    saved = [log.request_id for batch in sink.batches for log in batch]
+    assert "0" not in saved and saved[-1] == "after"
+
+
+@pytest.mark.asyncio()
+async def test_undecodable_and_rejected_spill_lines_are_quarantined(tmp_path) -> None:
+    spill = tmp_path / "spill.jsonl"
+    spill.write_text(
+        _serialize(_log("good")) + "\n" + _serialize(_log("poison")) + "\n" + '{"request_id": "to'
+    )
+    sink = RecordingSink()
+    sink.poisoned.add("poison")
+    repository = BufferedAuditRepository(sink, spill_path=str(spill))
+
+    await repository.save(_log("next"))
+    await repository.save(_log("later"))
+
+    assert [log.request_id for batch in sink.batches for log in batch] == [
+        "good",
+        "next",
+        "later",
+    ]
+    assert not spill.exists()
+    rejected = (tmp_path / "spill.jsonl.rejected").read_text().splitlines()
+    assert rejected == ['{"request_id": "to', _serialize(_log("poison"))]
+
+
+@pytest.mark.asyncio()
+async def test_spill_is_kept_while_the_sink_is_down(tmp_path) -> None:
+    spill = tmp_path / "spill.jsonl"
+    spill.write_text(_serialize(_log("kept")) + "\n")
+    sink = RecordingSink()
+    sink.available = False
+    repository = BufferedAuditRepository(sink, spill_path=str(spill))
+
+    await repository.save(_log("next"))
+
+    assert spill.read_text().splitlines() == [
+        _serialize(_log("kept")),
+        _serialize(_log("next")),
+    ]
+    assert not (tmp_path / "spill.jsonl.rejected").exists()
@@ -0,0 +1,175 @@
+"""Unit tests for the bulk ingestion pipeline."""
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from resume_ai.application.dto.bulk_ingest import BulkIngestRequest
+from resume_ai.application.interfaces.ingest_checkpoint import InMemoryIngestCheckpoint
+from resume_ai.application.use_cases.bulk_ingest import BulkIngestUseCase
+from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
+from resume_ai.domain.models.resume import ResumeSummary
+from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+
+RESUME_TEXT = "Skills: Python, AWS\n\nWork Experience\nBackend Engineer - Acme\n2019 - 2024"
+
+
+class StubOCR:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def extract_text(self, file: UploadedFile) -> str:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if file.filename == "broken.pdf":
+            raise RuntimeError("unreadable PDF")
+        return f"{file.filename}\n{RESUME_TEXT}"
+
+
+class StubLLM:
+    def __init__(self) -> None:
+        self.summaries = 0
+
+    async def summarize_resume(self, resume):
+        self.summaries += 1
+        return ResumeSummary(resume_id=resume.resume_id, summary="", highlights=["Python"])
+
+    async def answer_query(self, query, resumes):
+        raise AssertionError("Bulk ingestion never answers queries.")
+
+
+class StubVectorStore:
+    def __init__(self) -> None:
+        self.upserts: list[list] = []
+
+    async def upsert_chunks(self, chunks):
+        self.upserts.append(list(chunks))
+
+    async def fetch_resume_chunks(self, resume_id: str, tenant_id: str = "default"):
+        return []
+
+    async def link_resume(self, resume_id: str, request_id: str, tenant_id: str = "default"):
+        return None
+
+    async def query(self, text: str, limit: int = 5, filters=None, tenant_id: str = "default"):
+        return []
+
+
+class StubAuditRepository:
+    def __init__(self) -> None:
+        self.saved = []
+
+    async def save(self, log) -> None:
+        self.saved.append(log)
+
+
+class StubClock:
+    def now(self) -> datetime:
+        return datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _files(count: int) -> list[UploadedFile]:
+    return [
+        UploadedFile(
+            filename=f"resume-{index}.pdf", content_type="application/pdf", data=b"%d" % index
+        )
+        for index in range(count)
+    ]
+
+
+def _use_case(ocr, llm, vector_store, audit, checkpoint, batch_size=1):
+    process = ProcessResumesUseCase(
+        ocr_service=ocr,
+        llm_service=llm,
+        vector_store=vector_store,
+        audit_repository=audit,
+        clock=StubClock(),
+    )
+    return BulkIngestUseCase(
+        process_use_case=process,
+        audit_repository=audit,
+        clock=StubClock(),
+        checkpoint=checkpoint,
+        ocr_concurrency=3,
+        index_batch_size=batch_size,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_bulk_ingest_batches_upserts_and_resumes_from_checkpoint() -> None:
+    ocr, llm, store, audit = StubOCR(), StubLLM(), StubVectorStore(), StubAuditRepository()
+    checkpoint = InMemoryIngestCheckpoint()
+    use_case = _use_case(ocr, llm, store, audit, checkpoint, batch_size=6)
+    files = [*_files(5), UploadedFile(filename="broken.pdf", content_type="application/pdf")]
+
+    first = await use_case.execute(
+        BulkIngestRequest(request_id="bulk-1", user_id="cli", files=files, skip_summaries=True)
+    )
+    second = await use_case.execute(
+        BulkIngestRequest(request_id="bulk-2", user_id="cli", files=[*files, *_files(7)])
+    )
+
+    assert (first.processed, first.failed, first.summaries) == (5, 1, 0)
+    assert "broken.pdf" in first.failures
+    assert len(store.upserts) < 5, "chunks of several resumes share one upsert call"
+    assert (second.skipped, second.processed, second.failed) == (10, 2, 1)
+    assert llm.summaries == 2
+    assert ocr.calls == 5 + 1 + 2 + 1
+    assert {log.request_id for log in audit.saved} == {"bulk-1", "bulk-2"}
+
+
+@pytest.mark.asyncio()
+async def test_bulk_ingest_stops_when_indexing_fails() -> None:
+    class FailingStore(StubVectorStore):
+        async def upsert_chunks(self, chunks):
+            raise ConnectionError("qdrant unavailable")
+
+    class RecordingCheckpoint(InMemoryIngestCheckpoint):
+        def __init__(self) -> None:
+            super().__init__()
+            self.marked: list[str] = []
+
+        def mark_done(self, resume_ids) -> None:
+            self.marked.extend(resume_ids)
+
+    checkpoint = RecordingCheckpoint()
+    use_case = _use_case(StubOCR(), StubLLM(), FailingStore(), StubAuditRepository(), checkpoint)
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(
+            use_case.execute(BulkIngestRequest(request_id="b", user_id="cli", files=_files(20))),
+            timeout=2,
+        )
+    assert checkpoint.marked == []
+
+
+@pytest.mark.asyncio()
+async def test_bulk_ingest_reads_and_hashes_files_off_the_event_loop() -> None:
+    loop_thread = threading.current_thread()
+    threads: list[threading.Thread] = []
+
+    class ThreadRecordingFile(UploadedFile):
+        def content_hash(self) -> str:
+            threads.append(threading.current_thread())
+            return super().content_hash()
+
+    def read_files():
+        for index in range(3):
+            threads.append(threading.current_thread())
+            yield ThreadRecordingFile(
+                filename=f"resume-{index}.pdf", content_type="application/pdf", data=b"%d" % index
+            )
+
+    use_case = _use_case(
+        StubOCR(), StubLLM(), StubVectorStore(), StubAuditRepository(), InMemoryIngestCheckpoint()
+    )
+
+    stats = await use_case.execute(
+        BulkIngestRequest(request_id="b", user_id="cli", files=read_files(), skip_summaries=True)
+    )
+
+    assert stats.processed == 3
+    assert len(threads) == 6
+    assert loop_thread not in threads
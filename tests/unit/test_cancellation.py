@@ -0,0 +1,64 @@
+"""Unit tests for request deadlines and disconnect cancellation."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from resume_ai.interfaces.api.cancellation import (
+    CLIENT_CLOSED_REQUEST,
+    request_deadline,
+    run_until_disconnected,
+)
+
+
+class FakeRequest:
+    def __init__(self, headers: dict[str, str] | None = None, disconnect_after: int = 0) -> None:
+        self.headers = headers or {}
+        self.polls = 0
+        self.disconnect_after = disconnect_after
+
+        class _URL:
+            path = "/v1/resumes/process"
+
+        self.url = _URL()
+
+    async def is_disconnected(self) -> bool:
+        self.polls += 1
+        return bool(self.disconnect_after) and self.polls >= self.disconnect_after
+
+
+def test_request_deadline_prefers_header_over_default() -> None:
+    assert request_deadline(FakeRequest(), None).remaining() is None
+    assert 0 < request_deadline(FakeRequest(), 30).remaining() <= 30
+    assert request_deadline(FakeRequest({"X-Request-Timeout": "2.5"}), 30).remaining() <= 2.5
+    with pytest.raises(HTTPException):
+        request_deadline(FakeRequest({"X-Request-Timeout": "soon"}), 30)
+
+
+@pytest.mark.asyncio()
+async def test_disconnect_cancels_the_pending_work() -> None:
+    cancelled = asyncio.Event()
+
+    async def work() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    with pytest.raises(HTTPException) as excinfo:
+        await run_until_disconnected(FakeRequest(disconnect_after=2), work(), poll_interval=0.01)
+
+    assert excinfo.value.status_code == CLIENT_CLOSED_REQUEST
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio()
+async def test_connected_client_receives_the_result() -> None:
+    async def work() -> str:
+        await asyncio.sleep(0.03)
+        return "done"
+
+    assert await run_until_disconnected(FakeRequest(), work(), poll_interval=0.01) == "done"
@@ -0,0 +1,98 @@
+"""Unit tests for the query planner and candidate index."""
+
+from resume_ai.application.services.candidate_filter import (
+    CandidateIndex,
+    QueryMode,
+    QueryPlanner,
+)
+from resume_ai.domain.models.resume import ResumeChunk
+
+
+def _chunk(resume_id: str, text: str, skills: str, years: str) -> ResumeChunk:
+    return ResumeChunk(
+        chunk_id=f"{resume_id}-0",
+        text=text,
+        metadata={"resume_id": resume_id, "skills": skills, "years_of_experience": years},
+    )
+
+
+INDEX = CandidateIndex.from_chunks(
+    [
+        _chunk("r1", "Built services with Java and Spring.", "java|spring", "6"),
+        _chunk("r2", "Go developer running Kubernetes clusters.", "go|kubernetes", "3"),
+        _chunk("r3", "Java engineer who migrated workloads to Kubernetes.", "java", "8"),
+    ]
+)
+
+
+def test_pure_filter_query_is_answered_from_the_index() -> None:
+    plan = QueryPlanner().plan("5+ years Java")
+
+    assert plan.mode is QueryMode.FILTER
+    assert plan.criteria.min_years == 5
+    assert [match.resume_id for match in INDEX.match(plan.criteria)] == ["r3", "r1"]
+
+
+def test_all_skills_are_required_unless_query_says_or() -> None:
+    planner = QueryPlanner()
+
+    both = planner.plan("Who knows Kubernetes and Go?")
+    either = planner.plan("Candidates with Java or Go")
+
+    assert [match.resume_id for match in INDEX.match(both.criteria)] == ["r2"]
+    assert {match.resume_id for match in INDEX.match(either.criteria)} == {"r1", "r2", "r3"}
+
+
+def test_ranking_intent_shortlists_and_open_questions_go_to_llm() -> None:
+    planner = QueryPlanner()
+
+    assert planner.plan("Who is the best Java candidate for a lead role?").mode is (
+        QueryMode.SHORTLIST
+    )
+    assert planner.plan("Who fits a senior backend engineer role?").mode is QueryMode.LLM
+
+
+def test_negated_skills_exclude_candidates_instead_of_requiring_them() -> None:
+    plan = QueryPlanner().plan("Java developers not using Spring")
+
+    assert plan.mode is QueryMode.FILTER
+    assert plan.criteria.skills == ("Java",)
+    assert plan.criteria.excluded_skills == ("Spring",)
+    assert [match.resume_id for match in INDEX.match(plan.criteria)] == ["r3"]
+
+
+def test_only_known_skills_become_filters() -> None:
+    index = CandidateIndex.from_chunks(
+        [_chunk("r4", "Skills: teamwork, Python", "teamwork|python", "4")]
+    )
+
+    plan = QueryPlanner().plan("Python people with great teamwork")
+
+    assert plan.criteria.skills == ("Python",)
+    assert plan.mode is QueryMode.SHORTLIST
+    assert [match.resume_id for match in index.match(plan.criteria)] == ["r4"]
+
+
+def test_portuguese_no_and_o_are_articles_not_negation_or_alternatives() -> None:
+    planner = QueryPlanner()
+
+    contraction = planner.plan("Desenvolvedor Python com experiência no Kubernetes")
+    article = planner.plan("o desenvolvedor Java e Go")
+    alternative = planner.plan("Desenvolvedor Java o Go")
+
+    assert contraction.criteria.skills == ("Python", "Kubernetes")
+    assert contraction.criteria.excluded_skills == ()
+    assert not article.criteria.match_any_skill
+    assert alternative.criteria.match_any_skill
+    assert planner.plan("Python with no experience in Kubernetes").criteria.excluded_skills == (
+        "Kubernetes",
+    )
+
+
+def test_upper_bounds_on_experience_are_left_to_the_llm() -> None:
+    planner = QueryPlanner()
+
+    for query in ("Candidates with less than 2 years of Python", "Java com menos de 3 anos"):
+        plan = planner.plan(query)
+        assert plan.mode is QueryMode.LLM
+        assert plan.criteria.min_years is None
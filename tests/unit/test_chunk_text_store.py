@@ -0,0 +1,63 @@
+"""Unit tests for chunk text stores and text-less Qdrant payloads."""
+
+import os
+
+import pytest
+from qdrant_client import QdrantClient
+
+from resume_ai.application.interfaces.chunk_text_store import InMemoryChunkTextStore
+from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.infrastructure.storage.chunk_text_store import FileChunkTextStore
+from resume_ai.infrastructure.storage.text_codec import ZLIB
+from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
+
+
+class ConstantEmbeddings:
+    async def embed_documents(self, texts):
+        return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+    async def embed_query(self, text: str) -> list[float]:
+        return [1.0, 0.0, 0.0, 0.0]
+
+
+@pytest.mark.asyncio()
+async def test_file_store_round_trips_compressed_texts(tmp_path) -> None:
+    store = FileChunkTextStore(str(tmp_path), codec=ZLIB)
+    text = "Senior Python engineer. " * 50
+
+    await store.put_many({"ab12": text, "cd34": "short"})
+    await store.put_many({"cd34": "replaced"})
+
+    assert await store.get_many(["ab12", "cd34", "missing"]) == {
+        "ab12": text,
+        "cd34": "replaced",
+    }
+    assert os.path.getsize(tmp_path / "ab" / "ab12") < len(text)
+
+
+@pytest.mark.asyncio()
+async def test_qdrant_payloads_omit_text_kept_in_the_text_store() -> None:
+    client = QdrantClient(location=":memory:")
+    texts = InMemoryChunkTextStore()
+    store = QdrantVectorStore(
+        url=":memory:",
+        collection_name="resumes",
+        vector_size=4,
+        similarity="cosine",
+        embedding_service=ConstantEmbeddings(),
+        embedding_model="model",
+        client=client,
+        text_store=texts,
+    )
+    chunk = ResumeChunk(
+        chunk_id="8d5e957f-2cb4-4f5a-9c3b-1f0c2f1e7a10",
+        text="Built data pipelines in Python",
+        metadata={"resume_id": "resume-1", "position": "0"},
+    )
+
+    await store.upsert_chunks([chunk])
+
+    points, _ = client.scroll("resumes", with_payload=True)
+    assert "text" not in points[0].payload
+    assert [hit.text for hit in await store.query("python", limit=3)] == [chunk.text]
+    assert [hit.text for hit in await store.fetch_resume_chunks("resume-1")] == [chunk.text]
@@ -0,0 +1,59 @@
+"""Unit tests for CrossEncoderReranker."""
+
+import pytest
+
+from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.infrastructure.llm.cross_encoder_reranker import CrossEncoderReranker
+
+
+class FakeCrossEncoder:
+    """Scores a pair by how many query words the chunk contains."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[tuple[str, str]]] = []
+
+    def predict(self, pairs, batch_size: int, show_progress_bar: bool):
+        self.batches.append(list(pairs))
+        return [
+            float(sum(word in text.split() for word in query.split())) for query, text in pairs
+        ]
+
+
+def _chunks(*texts: str) -> list[ResumeChunk]:
+    return [
+        ResumeChunk(chunk_id=f"chunk-{index}", text=text, metadata={"resume_id": "r"})
+        for index, text in enumerate(texts)
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_rerank_orders_by_score_and_applies_cutoff() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(top_k=2, min_score=1.0, model=model)
+    chunks = _chunks("java spring", "python aws", "python django aws", "cobol")
+
+    ranked = await reranker.rerank("python aws", chunks)
+
+    assert [chunk.chunk_id for chunk in ranked] == ["chunk-1", "chunk-2"]
+    assert ranked[0].metadata == {"resume_id": "r", "rerank_score": "2.000000"}
+    # All candidates are scored in one batch.
+    assert len(model.batches) == 1 and len(model.batches[0]) == 4
+
+    strict = CrossEncoderReranker(top_k=5, min_score=3.0, model=FakeCrossEncoder())
+    assert await strict.rerank("python aws", chunks) == []
+
+
+@pytest.mark.asyncio()
+async def test_scores_are_cached_per_query_and_chunk() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(top_k=5, cache_size=3, model=model)
+    chunks = _chunks("python", "aws", "go")
+
+    await reranker.rerank("python", chunks)
+    await reranker.rerank("python", chunks[:2])
+    assert len(model.batches) == 1
+
+    # Another query misses the cache, and the cache keeps only the newest scores.
+    await reranker.rerank("aws", chunks[:1])
+    await reranker.rerank("python", chunks)
+    assert [len(batch) for batch in model.batches] == [3, 1, 1]
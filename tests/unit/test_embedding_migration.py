@@ -0,0 +1,127 @@
+"""Unit tests for versioned Qdrant collections and the embedding migration."""
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.http import models as rest
+
+from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.infrastructure.vectorstore.migration import EmbeddingMigration
+from resume_ai.infrastructure.vectorstore.qdrant_store import (
+    CollectionVersion,
+    QdrantVectorStore,
+    versioned_collection_name,
+)
+
+
+class AxisEmbeddings:
+    """Embeds every text onto one axis, so scores reveal which model produced a vector."""
+
+    def __init__(self, size: int, axis: int) -> None:
+        self.size = size
+        self.axis = axis
+        self.embedded: list[str] = []
+
+    async def embed_documents(self, texts):
+        texts = list(texts)
+        self.embedded.extend(texts)
+        return [self._vector() for _ in texts]
+
+    async def embed_query(self, text: str) -> list[float]:
+        return self._vector()
+
+    def _vector(self) -> list[float]:
+        vector = [0.0] * self.size
+        vector[self.axis] = 1.0
+        return vector
+
+
+def _chunk(index: int) -> ResumeChunk:
+    return ResumeChunk(
+        chunk_id=f"00000000-0000-0000-0000-{index:012d}",
+        text=f"chunk {index}",
+        metadata={"resume_id": f"resume-{index}", "position": "0"},
+    )
+
+
+def _target(embeddings: AxisEmbeddings) -> CollectionVersion:
+    return CollectionVersion(
+        name=versioned_collection_name("resumes", "new-model", embeddings.size),
+        vector_size=embeddings.size,
+        embedding_service=embeddings,
+    )
+
+
+def _store(client: QdrantClient, target: CollectionVersion | None = None) -> QdrantVectorStore:
+    return QdrantVectorStore(
+        url=":memory:",
+        collection_name="resumes",
+        vector_size=4,
+        similarity="cosine",
+        embedding_service=AxisEmbeddings(4, 0),
+        embedding_model="old-model",
+        migration_target=target,
+        client=client,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_migration_backfills_target_and_swap_switches_reads() -> None:
+    client = QdrantClient(location=":memory:")
+    await _store(client).upsert_chunks([_chunk(1), _chunk(2), _chunk(3)])
+    new_embeddings = AxisEmbeddings(8, 1)
+    store = _store(client, target=_target(new_embeddings))
+
+    await store.upsert_chunks([_chunk(4)])
+    assert new_embeddings.embedded == ["chunk 4"]
+    assert client.count("resumes__old_model__4").count == 4
+
+    migration = EmbeddingMigration(store, batch_size=2)
+    progress = await migration.run()
+
+    assert (progress.total, progress.copied, progress.skipped) == (4, 3, 1)
+    assert sorted(new_embeddings.embedded) == ["chunk 1", "chunk 2", "chunk 3", "chunk 4"]
+
+    migration.swap()
+    results = await store.query("anything", limit=10)
+    assert client.get_aliases().aliases[0].collection_name == "resumes__new_model__8"
+    assert len(results) == 4
+    assert float(results[0].metadata["score"]) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio()
+async def test_migration_is_throttled_to_the_configured_rate() -> None:
+    client = QdrantClient(location=":memory:")
+    await _store(client).upsert_chunks([_chunk(index) for index in range(4)])
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    progress = await EmbeddingMigration(
+        _store(client, target=_target(AxisEmbeddings(8, 1))),
+        batch_size=2,
+        max_chunks_per_second=2,
+        monotonic=lambda: now[0],
+        sleep=fake_sleep,
+    ).run()
+
+    assert sleeps == [1.0, 1.0]
+    assert progress.chunks_per_second() == pytest.approx(2.0)
+    assert progress.percent() == 100.0
+
+
+def test_swap_of_a_legacy_collection_requires_dropping_it() -> None:
+    client = QdrantClient(location=":memory:")
+    client.create_collection(
+        "resumes", vectors_config=rest.VectorParams(size=4, distance=rest.Distance.COSINE)
+    )
+    store = _store(client, target=_target(AxisEmbeddings(8, 1)))
+    assert store.primary.name == "resumes"
+
+    with pytest.raises(RuntimeError):
+        store.promote_migration_target()
+    store.promote_migration_target(drop_legacy=True)
+
+    assert client.get_aliases().aliases[0].collection_name == "resumes__new_model__8"
@@ -0,0 +1,135 @@
+"""Unit tests for audit query building in the Mongo repository."""
+
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from resume_ai.application.dto.audit_query import AuditLogQuery
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.infrastructure.persistence.mongo_audit_repository import (
+    InvalidCursorError,
+    MongoAuditRepository,
+    _archive_document,
+    _decode_entries,
+    _entry_matches,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip_builds_keyset_filter() -> None:
+    timestamp = datetime(2025, 11, 6, 12, 30)
+    object_id = ObjectId()
+    cursor = encode_cursor({"timestamp": timestamp, "_id": object_id})
+
+    built = MongoAuditRepository._build_filter(
+        AuditLogQuery(user_id="fabio", cursor=cursor, tenant_id="acme")
+    )
+
+    assert decode_cursor(cursor) == (timestamp, object_id)
+    assert built == {
+        "$and": [
+            {"tenant_id": "acme"},
+            {"user_id": "fabio"},
+            {
+                "$or": [
+                    {"timestamp": {"$lt": timestamp}},
+                    {"timestamp": timestamp, "_id": {"$lt": object_id}},
+                ]
+            },
+        ]
+    }
+
+
+def test_invalid_cursor_is_rejected() -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_archived_entries_round_trip_and_respect_filters() -> None:
+    entries = [
+        {
+            "_id": ObjectId(),
+            "request_id": f"req-{hour}",
+            "user_id": "fabio" if hour % 2 else "ana",
+            "timestamp": datetime(2025, 1, 1, hour),
+            "query": None,
+            "result": {"summaries": []},
+        }
+        for hour in range(4)
+    ]
+
+    archived = _archive_document("2025-01-01", entries)
+    decoded = _decode_entries(archived)
+    cursor = encode_cursor(entries[3])
+    query = AuditLogQuery(
+        user_id="fabio", since=datetime(2025, 1, 1, tzinfo=timezone.utc), cursor=cursor
+    )
+
+    assert archived["user_ids"] == ["ana", "fabio"]
+    assert decoded == entries
+    assert [
+        entry["request_id"]
+        for entry in decoded
+        if _entry_matches(entry, query, decode_cursor(cursor))
+    ] == ["req-1"]
+
+
+def test_default_tenant_includes_entries_written_before_tenancy() -> None:
+    legacy = {"_id": ObjectId(), "request_id": "old", "user_id": "ana"}
+    legacy["timestamp"] = datetime(2025, 1, 1)
+    tenant_entry = {**legacy, "_id": ObjectId(), "request_id": "new", "tenant_id": "acme"}
+
+    assert MongoAuditRepository._build_filter(AuditLogQuery()) == {
+        "tenant_id": {"$in": ["default", None]}
+    }
+    assert _entry_matches(legacy, AuditLogQuery(), None)
+    assert not _entry_matches(legacy, AuditLogQuery(tenant_id="acme"), None)
+    assert _entry_matches(tenant_entry, AuditLogQuery(tenant_id="acme"), None)
+    assert _archive_document("2025-01-01", [tenant_entry])["tenant_id"] == "acme"
+
+
+class UniqueIdCollection:
+    def __init__(self) -> None:
+        self.documents: dict[ObjectId, dict] = {}
+
+    async def insert_many(self, documents, ordered=True):
+        errors = []
+        for index, document in enumerate(documents):
+            if document["_id"] in self.documents:
+                errors.append({"index": index, "code": 11000})
+            else:
+                self.documents[document["_id"]] = document
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(documents) - len(errors)})
+
+
+@pytest.mark.asyncio()
+async def test_replayed_logs_are_stored_once() -> None:
+    repository = MongoAuditRepository("mongodb://localhost:27017/resume_ai")
+    repository._collection = UniqueIdCollection()
+    logs = [
+        AuditLog(
+            request_id=f"req-{index}",
+            user_id="fabio",
+            timestamp=datetime(2025, 11, 6, 12, 30, tzinfo=timezone.utc),
+            query=None,
+            result={"summaries": []},
+        )
+        for index in range(3)
+    ]
+
+    await repository.save_many(logs[:2])
+    await repository.save_many(logs)
+
+    assert sorted(doc["request_id"] for doc in repository._collection.documents.values()) == [
+        "req-0",
+        "req-1",
+        "req-2",
+    ]
+    assert all(
+        object_id.generation_time == logs[0].timestamp
+        for object_id in repository._collection.documents
+    )
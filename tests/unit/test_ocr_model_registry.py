@@ -0,0 +1,114 @@
+"""Unit tests for OCRModelRegistry and OCR language detection."""
+
+import threading
+
+from resume_ai.infrastructure.ocr.language import detect_language, recognition_group
+from resume_ai.infrastructure.ocr.model_registry import OCRModelRegistry
+from resume_ai.infrastructure.ocr.paddle_ocr_service import _directory_bytes
+
+MB = 2**20
+
+
+class FakeLoader:
+    def __init__(self, sizes: dict[str, int]) -> None:
+        self.sizes = sizes
+        self.loads: list[str] = []
+
+    def __call__(self, key: str) -> tuple[str, int]:
+        self.loads.append(key)
+        return f"model-{key}", self.sizes[key]
+
+
+def test_models_load_lazily_once() -> None:
+    loader = FakeLoader({"en": 100 * MB, "latin": 100 * MB})
+    registry = OCRModelRegistry(loader, memory_budget_bytes=500 * MB)
+
+    assert registry.loaded == []
+    with registry.use("latin") as model:
+        assert model == "model-latin"
+    with registry.use("latin"):
+        pass
+
+    assert loader.loads == ["latin"]
+    assert registry.resident_bytes == 100 * MB
+
+
+def test_least_recently_used_model_is_evicted_over_budget() -> None:
+    loader = FakeLoader({"en": 100 * MB, "latin": 100 * MB, "cyrillic": 100 * MB})
+    registry = OCRModelRegistry(loader, memory_budget_bytes=250 * MB, pinned={"en"})
+
+    for key in ("en", "latin", "cyrillic"):
+        with registry.use(key):
+            pass
+
+    # The pinned default survives although it is the least recently used.
+    assert registry.loaded == ["en", "cyrillic"]
+    with registry.use("latin"):
+        pass
+    assert registry.loaded == ["en", "latin"]
+    assert loader.loads == ["en", "latin", "cyrillic", "latin"]
+
+
+def test_models_in_use_are_not_evicted() -> None:
+    loader = FakeLoader({"latin": 100 * MB, "arabic": 100 * MB})
+    registry = OCRModelRegistry(loader, memory_budget_bytes=150 * MB)
+
+    with registry.use("latin"), registry.use("arabic"):
+        assert registry.loaded == ["latin", "arabic"]
+    # The first one released is evicted while the other is still running.
+    assert registry.loaded == ["latin"]
+
+
+def test_concurrent_first_use_loads_once() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    loads: list[str] = []
+
+    def slow_loader(key: str) -> tuple[str, int]:
+        loads.append(key)
+        started.set()
+        release.wait(timeout=5)
+        return key, MB
+
+    registry = OCRModelRegistry(slow_loader, memory_budget_bytes=10 * MB)
+    results: list[str] = []
+
+    def worker() -> None:
+        with registry.use("latin") as model:
+            results.append(model)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    started.wait(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert loads == ["latin"]
+    assert results == ["latin"] * 3
+
+
+def test_detect_language_from_english_model_output() -> None:
+    # The English recognizer drops diacritics; stopwords still identify the language.
+    portuguese = "Experiencia de 5 anos com Python e AWS para uma empresa de tecnologia"
+    spanish = "Experiencia de 5 anos con Python y AWS en una empresa del sector"
+    english = "Five years of experience with Python and AWS in the cloud"
+    candidates = ["en", "pt", "es"]
+
+    assert detect_language(portuguese, candidates) == "pt"
+    assert detect_language(spanish, candidates) == "es"
+    assert detect_language(english, candidates) == "en"
+    assert detect_language("Python AWS Docker", candidates) is None
+    assert recognition_group("pt") == recognition_group("es") == "latin"
+    assert recognition_group("en") == "en"
+
+
+def test_models_are_sized_by_their_weight_files(tmp_path) -> None:
+    (tmp_path / "inference.pdiparams").write_bytes(b"\0" * 3000)
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "inference.pdmodel").write_bytes(b"\0" * 500)
+
+    assert _directory_bytes(str(tmp_path)) == 3500
+    assert _directory_bytes(str(tmp_path / "missing")) == 0
+    assert _directory_bytes(None) == 0
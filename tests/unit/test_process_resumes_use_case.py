@@ -1,18 +1,26 @@
 """Unit tests for ProcessResumesUseCase."""
 
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
+from qdrant_client import QdrantClient
 
 from resume_ai.application.dto.resume_request import ProcessResumesRequest
-from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase
+from resume_ai.application.use_cases.process_resumes import ProcessResumesUseCase, join_chunks
 from resume_ai.domain.models.audit import AuditLog
 from resume_ai.domain.models.resume import ResumeDocument, ResumeSummary
+from resume_ai.domain.value_objects.deadline import Deadline
 from resume_ai.domain.value_objects.uploaded_file import UploadedFile
+from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
 
 
 class StubOCR:
+    def __init__(self) -> None:
+        self.calls = 0
+
     async def extract_text(self, file: UploadedFile) -> str:
+        self.calls += 1
         return (
             "Gabriel is a senior backend engineer with experience in Python, AWS, and mentoring.\n"
             "He led projects with FastAPI, PostgreSQL, and event-driven architectures."
@@ -38,11 +46,22 @@ class StubLLM:
 class StubVectorStore:
     def __init__(self) -> None:
         self.chunks = []
+        self.links: list[tuple[str, str]] = []
 
     async def upsert_chunks(self, chunks):
         self.chunks.extend(list(chunks))
 
-    async def query(self, text: str, limit: int = 5):
+    async def fetch_resume_chunks(self, resume_id: str, tenant_id: str = "default"):
+        return [
+            chunk
+            for chunk in self.chunks
+            if chunk.metadata["resume_id"] == resume_id and chunk.metadata["tenant_id"] == tenant_id
+        ]
+
+    async def link_resume(self, resume_id: str, request_id: str, tenant_id: str = "default"):
+        self.links.append((resume_id, request_id))
+
+    async def query(self, text: str, limit: int = 5, filters=None, tenant_id: str = "default"):
         return []
 
 
@@ -100,3 +119,213 @@ async def test_process_resumes_use_case_generates_summaries_and_logs() -> None:
     assert audit_repo.saved[0].request_id == "1234"
     assert audit_repo.saved[0].result["summaries"][0]["filename"] == "resume.pdf"
 
+
+
+@pytest.mark.asyncio()
+async def test_filter_query_is_answered_without_llm() -> None:
+    class NoQueryLLM(StubLLM):
+        async def answer_query(self, query: str, resumes):
+            raise AssertionError("Filter queries must not reach the LLM.")
+
+    audit_repo = StubAuditRepository()
+    use_case = ProcessResumesUseCase(
+        ocr_service=StubOCR(),
+        llm_service=NoQueryLLM(),
+        vector_store=StubVectorStore(),
+        audit_repository=audit_repo,
+        clock=StubClock(),
+    )
+
+    response = await use_case.execute(
+        ProcessResumesRequest(
+            request_id="5678",
+            user_id="fabio",
+            query="Candidates who know Python and AWS",
+            files=[UploadedFile(filename="resume.pdf", content_type="application/pdf", data=b"x")],
+        )
+    )
+
+    assert response.query_answer is not None
+    assert response.query_answer.referenced_resumes == [response.summaries[0].resume_id]
+    assert response.query_answer.justifications == ["resume.pdf: Python, AWS"]
+
+
+@pytest.mark.asyncio()
+async def test_resumes_are_reranked_separately_and_irrelevant_ones_skip_the_llm() -> None:
+    class RecordingReranker:
+        def __init__(self, keep: bool) -> None:
+            self.keep = keep
+            self.calls: list[set[str]] = []
+
+        async def rerank(self, query: str, chunks):
+            self.calls.append({chunk.metadata["resume_id"] for chunk in chunks})
+            return list(chunks[:1]) if self.keep else []
+
+    class RecordingLLM(StubLLM):
+        def __init__(self) -> None:
+            self.contexts: list[list[int]] = []
+
+        async def answer_query(self, query: str, resumes):
+            self.contexts.append([len(resume.chunks) for resume in resumes])
+            return await super().answer_query(query, resumes)
+
+    files = [
+        UploadedFile(filename=f"{name}.pdf", content_type="application/pdf", data=name.encode())
+        for name in ("ana", "bia")
+    ]
+    for keep in (True, False):
+        reranker = RecordingReranker(keep)
+        llm = RecordingLLM()
+        use_case = ProcessResumesUseCase(
+            ocr_service=StubOCR(),
+            llm_service=llm,
+            vector_store=StubVectorStore(),
+            audit_repository=StubAuditRepository(),
+            clock=StubClock(),
+            reranker=reranker,
+        )
+
+        response = await use_case.execute(
+            ProcessResumesRequest(
+                request_id="rerank", user_id="fabio", query="Who mentors well?", files=files
+            )
+        )
+
+        assert [len(ids) for ids in reranker.calls] == [1, 1]
+        assert response.query_answer is not None
+        if keep:
+            assert llm.contexts == [[1, 1]]
+        else:
+            assert llm.contexts == []
+            assert response.query_answer.referenced_resumes == []
+
+
+@pytest.mark.asyncio()
+async def test_reuploaded_resume_is_linked_instead_of_reprocessed() -> None:
+    ocr = StubOCR()
+    vector_store = StubVectorStore()
+    use_case = ProcessResumesUseCase(
+        ocr_service=ocr,
+        llm_service=StubLLM(),
+        vector_store=vector_store,
+        audit_repository=StubAuditRepository(),
+        clock=StubClock(),
+    )
+    upload = UploadedFile(filename="resume.pdf", content_type="application/pdf", data=b"same")
+
+    first = await use_case.execute(
+        ProcessResumesRequest(request_id="r1", user_id="fabio", query=None, files=[upload, upload])
+    )
+    stored = list(vector_store.chunks)
+    second = await use_case.execute(
+        ProcessResumesRequest(request_id="r2", user_id="fabio", query=None, files=[upload])
+    )
+
+    assert ocr.calls == 1
+    assert vector_store.chunks == stored
+    assert len(first.summaries) == 1
+    assert second.summaries[0].resume_id == first.summaries[0].resume_id
+    assert vector_store.links == [(first.summaries[0].resume_id, "r2")]
+
+
+@pytest.mark.asyncio()
+async def test_resume_restored_from_qdrant_keeps_its_profile() -> None:
+    class ExperienceOCR:
+        async def extract_text(self, file: UploadedFile) -> str:
+            return (
+                "Summary\nSenior engineer with Python and AWS.\n\n"
+                "Experience\nBackend Engineer, Acme 01/2019 - present\n"
+                "Developer, Foo 03/2015 - 12/2018\n"
+            )
+
+    class ConstantEmbeddings:
+        async def embed_documents(self, texts):
+            return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+        async def embed_query(self, text: str) -> list[float]:
+            return [1.0, 0.0, 0.0, 0.0]
+
+    vector_store = QdrantVectorStore(
+        url=":memory:",
+        collection_name="resumes",
+        vector_size=4,
+        similarity="cosine",
+        embedding_service=ConstantEmbeddings(),
+        embedding_model="model",
+        client=QdrantClient(location=":memory:"),
+    )
+    use_case = ProcessResumesUseCase(
+        ocr_service=ExperienceOCR(),
+        llm_service=StubLLM(),
+        vector_store=vector_store,
+        audit_repository=StubAuditRepository(),
+        clock=StubClock(),
+    )
+    upload = UploadedFile(filename="resume.pdf", content_type="application/pdf", data=b"cv")
+    resume_id = use_case.resume_id_for(upload)
+
+    extracted = await use_case.extract_resume(resume_id, "r1", upload)
+    await use_case.index_chunks(extracted.chunks)
+    restored = await use_case.reuse_indexed_resume(resume_id, "r2", upload)
+
+    assert restored is not None
+    assert extracted.profile.dates == ["2019-01/present", "2015-03/2018-12"]
+    assert restored.profile == extracted.profile
+
+
+@pytest.mark.asyncio()
+async def test_deadline_returns_finished_summaries_and_marks_the_rest() -> None:
+    class SlowSecondSummaryLLM(StubLLM):
+        def __init__(self) -> None:
+            self.calls = 0
+            self.cancelled = False
+
+        async def summarize_resume(self, resume: ResumeDocument) -> ResumeSummary:
+            self.calls += 1
+            if self.calls > 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    self.cancelled = True
+                    raise
+            return await super().summarize_resume(resume)
+
+    llm = SlowSecondSummaryLLM()
+    audit_repo = StubAuditRepository()
+    use_case = ProcessResumesUseCase(
+        ocr_service=StubOCR(),
+        llm_service=llm,
+        vector_store=StubVectorStore(),
+        audit_repository=audit_repo,
+        clock=StubClock(),
+    )
+
+    response = await use_case.execute(
+        ProcessResumesRequest(
+            request_id="late",
+            user_id="fabio",
+            query="Who has the strongest leadership track record?",
+            files=[
+                UploadedFile(filename="a.pdf", content_type="application/pdf", data=b"a"),
+                UploadedFile(filename="b.pdf", content_type="application/pdf", data=b"b"),
+            ],
+            deadline=Deadline.after(0.2),
+        )
+    )
+
+    assert [summary.complete for summary in response.summaries] == [True, False]
+    assert response.summaries[0].summary
+    assert response.summaries[1].filename == "b.pdf"
+    assert response.query_answer is not None and not response.query_answer.complete
+    assert not response.complete
+    assert llm.cancelled
+    assert audit_repo.saved[0].result["complete"] is False
+
+
+def test_rejoined_chunks_do_not_repeat_their_overlap() -> None:
+    chunks = ["Built pipelines in Python and Go", "Python and Go for ten years"]
+
+    assert join_chunks(chunks, max_overlap=15) == "Built pipelines in Python and Go for ten years"
+    assert join_chunks(["Summary line", "Other line"], max_overlap=15) == (
+        "Summary line\nOther line"
+    )
@@ -0,0 +1,72 @@
+"""Unit tests for re-indexing and request links in QdrantVectorStore."""
+
+import asyncio
+
+import pytest
+from qdrant_client import QdrantClient
+
+from resume_ai.application.use_cases.process_resumes import chunk_id_for
+from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.infrastructure.vectorstore.qdrant_store import (
+    MAX_LINKED_REQUESTS,
+    QdrantVectorStore,
+)
+
+
+class ConstantEmbeddings:
+    async def embed_documents(self, texts):
+        return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+    async def embed_query(self, text: str) -> list[float]:
+        return [1.0, 0.0, 0.0, 0.0]
+
+
+def _store() -> QdrantVectorStore:
+    return QdrantVectorStore(
+        url=":memory:",
+        collection_name="resumes",
+        vector_size=4,
+        similarity="cosine",
+        embedding_service=ConstantEmbeddings(),
+        embedding_model="model",
+        client=QdrantClient(location=":memory:"),
+    )
+
+
+def _chunks(resume_id: str, count: int) -> list[ResumeChunk]:
+    return [
+        ResumeChunk(
+            chunk_id=chunk_id_for("default", resume_id, str(position)),
+            text=f"{resume_id} chunk {position}",
+            metadata={"resume_id": resume_id, "position": str(position), "request_id": "req-0"},
+        )
+        for position in range(count)
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_reindexing_a_resume_removes_chunks_it_no_longer_has() -> None:
+    store = _store()
+    await store.upsert_chunks([*_chunks("resume-1", 3), *_chunks("resume-2", 2)])
+
+    await store.upsert_chunks(_chunks("resume-1", 2))
+
+    assert len(await store.fetch_resume_chunks("resume-1")) == 2
+    assert len(await store.fetch_resume_chunks("resume-2")) == 2
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_links_are_all_kept_up_to_the_bound() -> None:
+    store = _store()
+    await store.upsert_chunks(_chunks("resume-1", 2))
+
+    await asyncio.gather(*(store.link_resume("resume-1", f"req-{n}") for n in range(1, 4)))
+    points, _ = store._client.scroll("resumes", with_payload=["request_ids"])
+    assert {tuple(point.payload["request_ids"]) for point in points} == {
+        ("req-0", "req-1", "req-2", "req-3")
+    }
+
+    for n in range(4, MAX_LINKED_REQUESTS + 10):
+        await store.link_resume("resume-1", f"req-{n}")
+    points, _ = store._client.scroll("resumes", with_payload=["request_ids"])
+    assert all(len(point.payload["request_ids"]) == MAX_LINKED_REQUESTS for point in points)
@@ -0,0 +1,60 @@
+"""Unit tests for the cached dependency readiness checks."""
+
+import asyncio
+
+import pytest
+
+from resume_ai.application.services.readiness import ReadinessService
+
+
+class FakeMonotonic:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio()
+async def test_check_reports_each_dependency_and_caches_until_ttl() -> None:
+    calls = {"mongo": 0}
+
+    async def mongo() -> None:
+        calls["mongo"] += 1
+
+    async def qdrant() -> None:
+        await asyncio.sleep(10)
+
+    clock = FakeMonotonic()
+    service = ReadinessService(
+        {"mongo": mongo, "qdrant": qdrant}, timeout=0.01, ttl=5, monotonic=clock
+    )
+
+    first = await service.check()
+    clock.now += 1
+    cached = await service.check()
+    clock.now += 5
+    await service.check()
+
+    assert not first.ready
+    assert first.dependencies["mongo"].ok
+    assert first.dependencies["qdrant"].error == "timed out"
+    assert cached.age_seconds == 1
+    assert calls["mongo"] == 2
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_checks_share_one_probe_run() -> None:
+    calls = 0
+
+    async def probe() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+
+    service = ReadinessService({"llm": probe})
+
+    reports = await asyncio.gather(*(service.check() for _ in range(5)))
+
+    assert calls == 1
+    assert all(report.ready for report in reports)
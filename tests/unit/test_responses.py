@@ -0,0 +1,62 @@
+"""Unit tests for the direct dataclass JSON responses."""
+
+import json
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from resume_ai.application.dto.resume_request import (
+    ProcessResumesResponse,
+    QueryAnswerResponse,
+    ResumeSummaryResponse,
+)
+from resume_ai.application.dto.resume_search import ResumeMatch, SearchResumesResponse
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.interfaces.api.responses import DataclassJSONResponse
+from resume_ai.interfaces.api.schemas.audit import AuditLogSchema
+from resume_ai.interfaces.api.schemas.resume import (
+    ProcessResumesResponseSchema,
+    SearchResumesResponseSchema,
+)
+
+
+def _encoded_like_pydantic(content, schema) -> None:
+    body = DataclassJSONResponse(content).body
+    assert json.loads(body) == json.loads(schema.model_validate_json(body).model_dump_json())
+
+
+def test_process_response_encodes_exactly_like_its_schema() -> None:
+    response = ProcessResumesResponse(
+        request_id="req",
+        summaries=[
+            ResumeSummaryResponse("id-1", "a.pdf", "Engineer.", ["Python"]),
+            ResumeSummaryResponse("id-2", "b.pdf", "", [], complete=False),
+        ],
+        query_answer=QueryAnswerResponse("req", "a.pdf fits.", ["Python"], ["id-1"]),
+    )
+
+    _encoded_like_pydantic(response, ProcessResumesResponseSchema)
+    assert json.loads(DataclassJSONResponse(response).body)["complete"] is False
+
+
+def test_search_response_encodes_exactly_like_its_schema() -> None:
+    response = SearchResumesResponse(
+        request_id="req",
+        matches=[ResumeMatch("id-1", "a.pdf", 0.9, ["Python"], None, ["Built APIs."])],
+    )
+
+    _encoded_like_pydantic(response, SearchResumesResponseSchema)
+
+
+def test_audit_logs_encode_timestamps_like_pydantic() -> None:
+    log = AuditLog(
+        request_id="req",
+        user_id="fabio",
+        timestamp=datetime(2025, 11, 6, 12, 30, tzinfo=timezone.utc),
+        query=None,
+        result={"summaries": []},
+    )
+
+    body = json.loads(DataclassJSONResponse([log]).body)
+
+    assert body[0]["timestamp"] == "2025-11-06T12:30:00Z"
+    assert body == [json.loads(AuditLogSchema(**asdict(log)).model_dump_json())]
@@ -0,0 +1,58 @@
+"""Unit tests for the deterministic resume parser."""
+
+from datetime import datetime, timezone
+
+from resume_ai.domain.services.resume_parser import ResumeParser, find_skills
+
+RESUME_TEXT = """Maria Silva
+maria@example.com | +55 11 99999-0000
+
+Summary
+Backend engineer focused on distributed systems.
+
+Technical Skills: Python, Kubernetes, PostgreSQL
+Go; Terraform
+
+Work Experience
+Senior Backend Engineer - Acme Corp
+Jan 2019 - Present
+Software Developer at Initech
+03/2015 - 12/2018
+
+Education
+BSc Computer Science, 2010 - 2014
+"""
+
+
+def test_parser_extracts_sections_and_structured_fields() -> None:
+    profile = ResumeParser().parse(
+        RESUME_TEXT, reference_date=datetime(2025, 1, 1, tzinfo=timezone.utc)
+    )
+
+    assert set(profile.sections) == {"contact", "summary", "skills", "experience", "education"}
+    assert profile.skills[:5] == ["Python", "Kubernetes", "PostgreSQL", "Go", "Terraform"]
+    assert profile.titles == ["Senior Backend Engineer", "Software Developer"]
+    assert profile.dates == ["2019-01/present", "2015-03/2018-12"]
+    assert profile.years_of_experience == 9.9
+
+
+def test_find_skills_ignores_lowercase_go_in_prose() -> None:
+    assert find_skills("Ready to go with Golang and k8s") == ["Go", "Kubernetes"]
+
+
+def test_years_come_only_from_experience_sections_and_claims() -> None:
+    parser = ResumeParser()
+    reference = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    no_experience = parser.parse(
+        "Ana Costa\nBSc Computer Science, 2010 - 2014\nLived abroad for 3 years in school",
+        reference_date=reference,
+    )
+    stated = parser.parse(
+        "Summary\nBackend engineer with 8+ years of professional experience.",
+        reference_date=reference,
+    )
+
+    assert no_experience.years_of_experience is None
+    assert no_experience.dates == []
+    assert stated.years_of_experience == 8.0
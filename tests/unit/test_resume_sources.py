@@ -0,0 +1,41 @@
+"""Unit tests for resume file discovery."""
+
+import tarfile
+import zipfile
+
+from resume_ai.infrastructure.storage.ingest_checkpoint import FileIngestCheckpoint
+from resume_ai.infrastructure.storage.resume_sources import iter_resume_files
+
+
+def test_iter_resume_files_walks_directories_and_archives(tmp_path) -> None:
+    source = tmp_path / "resumes"
+    (source / "nested").mkdir(parents=True)
+    (source / "b.pdf").write_bytes(b"b")
+    (source / "nested" / "a.png").write_bytes(b"a")
+    (source / "notes.txt").write_text("ignored")
+    zip_path = tmp_path / "resumes.zip"
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        archive.writestr("x/one.pdf", b"one")
+        archive.writestr("readme.md", b"ignored")
+    tar_path = tmp_path / "resumes.tar.gz"
+    with tarfile.open(tar_path, "w:gz") as archive:
+        archive.add(source / "b.pdf", arcname="two.pdf")
+
+    from_directory = list(iter_resume_files(str(source)))
+    from_zip = list(iter_resume_files(str(zip_path)))
+    from_tar = list(iter_resume_files(str(tar_path)))
+
+    assert [file.filename for file in from_directory] == ["b.pdf", "a.png"]
+    assert from_directory[1].content_type == "image/png"
+    assert [(file.filename, file.data) for file in from_zip] == [("one.pdf", b"one")]
+    assert from_tar[0].content_hash() == from_directory[0].content_hash()
+
+
+def test_file_checkpoint_survives_restarts(tmp_path) -> None:
+    path = str(tmp_path / "state" / "checkpoint.txt")
+    FileIngestCheckpoint(path).mark_done(["r1", "r2"])
+
+    restored = FileIngestCheckpoint(path)
+
+    assert restored.contains("r1") and restored.contains("r2")
+    assert not restored.contains("r3")
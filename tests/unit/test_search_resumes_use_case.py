@@ -0,0 +1,224 @@
+"""Unit tests for SearchResumesUseCase."""
+
+from datetime import datetime, timezone
+
+import pytest
+from qdrant_client import QdrantClient
+
+from resume_ai.application.dto.resume_search import ChunkFilter, SearchResumesRequest
+from resume_ai.application.use_cases.process_resumes import chunk_id_for
+from resume_ai.application.use_cases.search_resumes import SearchResumesUseCase
+from resume_ai.domain.models.audit import AuditLog
+from resume_ai.domain.models.resume import ResumeChunk, ResumeProfile
+from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
+
+
+def _chunk(resume_id: str, position: int, score: float, skills: str = "Python") -> ResumeChunk:
+    return ResumeChunk(
+        chunk_id=f"{resume_id}-{position}",
+        text=f"{resume_id} chunk {position}",
+        metadata={
+            "resume_id": resume_id,
+            "filename": f"{resume_id}.pdf",
+            "position": str(position),
+            "score": str(score),
+            "skills": skills,
+            "years_of_experience": "6",
+        },
+    )
+
+
+class StubVectorStore:
+    def __init__(self, chunks: list[ResumeChunk]) -> None:
+        self.chunks = chunks
+        self.queries: list[tuple[str, int, ChunkFilter | None]] = []
+        self.tenants: list[str] = []
+
+    async def query(
+        self,
+        text: str,
+        limit: int = 5,
+        filters: ChunkFilter | None = None,
+        tenant_id: str = "default",
+    ):
+        self.queries.append((text, limit, filters))
+        self.tenants.append(tenant_id)
+        return self.chunks[:limit]
+
+
+class StubLLM:
+    def __init__(self) -> None:
+        self.resumes = []
+
+    async def answer_query(self, query: str, resumes):
+        self.resumes = list(resumes)
+        return {
+            "answer": "alice fits best",
+            "justifications": ["Python"],
+            "referenced_resumes": [resumes[0].resume_id],
+        }
+
+
+class StubAuditRepository:
+    def __init__(self) -> None:
+        self.saved: list[AuditLog] = []
+
+    async def save(self, log: AuditLog) -> None:
+        self.saved.append(log)
+
+
+class StubClock:
+    def now(self) -> datetime:
+        return datetime(2025, 11, 6, tzinfo=timezone.utc)
+
+
+def _use_case(store: StubVectorStore, llm: StubLLM, audit: StubAuditRepository):
+    return SearchResumesUseCase(
+        vector_store=store, llm_service=llm, audit_repository=audit, clock=StubClock()
+    )
+
+
+@pytest.mark.asyncio()
+async def test_search_groups_chunks_by_resume_and_skips_llm() -> None:
+    store = StubVectorStore(
+        [_chunk("alice", 0, 0.9), _chunk("bob", 0, 0.8), _chunk("alice", 1, 0.7)]
+    )
+    llm = StubLLM()
+    audit = StubAuditRepository()
+
+    response = await _use_case(store, llm, audit).execute(
+        SearchResumesRequest(request_id="req", user_id="u", query="backend engineer", limit=2)
+    )
+
+    assert [match.resume_id for match in response.matches] == ["alice", "bob"]
+    assert response.matches[0].snippets == ["alice chunk 0", "alice chunk 1"]
+    assert response.matches[0].filename == "alice.pdf"
+    assert response.matches[0].skills == ["Python"]
+    assert response.query_answer is None
+    assert llm.resumes == []
+    assert store.queries[0][1] == 10
+    assert audit.saved[0].result["search"]["matches"][0]["resume_id"] == "alice"
+
+
+@pytest.mark.asyncio()
+async def test_search_turns_query_criteria_into_filters_and_answers() -> None:
+    store = StubVectorStore([_chunk("alice", 0, 0.9)])
+    llm = StubLLM()
+    audit = StubAuditRepository()
+
+    response = await _use_case(store, llm, audit).execute(
+        SearchResumesRequest(
+            request_id="req",
+            user_id="u",
+            query="Python developers with 5+ years",
+            filters=ChunkFilter(sections=("experience",)),
+            answer=True,
+        )
+    )
+
+    filters = store.queries[0][2]
+    assert filters.skills == ("Python",)
+    assert filters.min_years == 5
+    assert filters.sections == ("experience",)
+    assert response.query_answer.answer == "alice fits best"
+    assert llm.resumes[0].extracted_text == "alice chunk 0"
+
+
+@pytest.mark.asyncio()
+async def test_search_normalises_requested_skills_and_rejects_empty_query() -> None:
+    store = StubVectorStore([])
+    use_case = _use_case(store, StubLLM(), StubAuditRepository())
+
+    await use_case.execute(
+        SearchResumesRequest(
+            request_id="req", user_id="u", query="anyone", filters=ChunkFilter(skills=("python",))
+        )
+    )
+    assert store.queries[0][2].skills == ("Python",)
+
+    with pytest.raises(ValueError):
+        await use_case.execute(SearchResumesRequest(request_id="req", user_id="u", query="  "))
+
+
+@pytest.mark.asyncio()
+async def test_skill_filters_match_resumes_indexed_in_qdrant() -> None:
+    class ConstantEmbeddings:
+        async def embed_documents(self, texts):
+            return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+        async def embed_query(self, text: str) -> list[float]:
+            return [1.0, 0.0, 0.0, 0.0]
+
+    store = QdrantVectorStore(
+        url=":memory:",
+        collection_name="resumes",
+        vector_size=4,
+        similarity="cosine",
+        embedding_service=ConstantEmbeddings(),
+        embedding_model="model",
+        client=QdrantClient(location=":memory:"),
+    )
+    for resume_id, skills in (("alice", ["Python", "AWS"]), ("bob", ["Go"])):
+        profile = ResumeProfile(skills=skills, years_of_experience=6.0)
+        await store.upsert_chunks(
+            [
+                ResumeChunk(
+                    chunk_id=chunk_id_for("default", resume_id, "0"),
+                    text=f"{resume_id} builds services",
+                    metadata={"resume_id": resume_id, "position": "0", **profile.to_metadata()},
+                )
+            ]
+        )
+    use_case = SearchResumesUseCase(
+        vector_store=store,
+        llm_service=StubLLM(),
+        audit_repository=StubAuditRepository(),
+        clock=StubClock(),
+    )
+
+    requested = await use_case.execute(
+        SearchResumesRequest(
+            request_id="req", user_id="u", query="anyone", filters=ChunkFilter(skills=("python",))
+        )
+    )
+    planned = await use_case.execute(
+        SearchResumesRequest(request_id="req", user_id="u", query="Candidates with Python or Go")
+    )
+
+    assert [match.resume_id for match in requested.matches] == ["alice"]
+    assert requested.matches[0].skills == ["Python", "AWS"]
+    assert sorted(match.resume_id for match in planned.matches) == ["alice", "bob"]
+
+
+class StubReranker:
+    """Keeps the chunks of the given resumes, reversing their retrieval order."""
+
+    def __init__(self, keep: set[str]) -> None:
+        self.keep = keep
+
+    async def rerank(self, query: str, chunks):
+        return [chunk for chunk in reversed(chunks) if chunk.metadata["resume_id"] in self.keep]
+
+
+@pytest.mark.asyncio()
+async def test_search_reranks_chunks_before_grouping_and_answering() -> None:
+    store = StubVectorStore(
+        [_chunk("alice", 0, 0.9), _chunk("bob", 0, 0.8), _chunk("carol", 0, 0.7)]
+    )
+    llm = StubLLM()
+    use_case = SearchResumesUseCase(
+        vector_store=store,
+        llm_service=llm,
+        audit_repository=StubAuditRepository(),
+        clock=StubClock(),
+        reranker=StubReranker(keep={"alice", "carol"}),
+    )
+
+    response = await use_case.execute(
+        SearchResumesRequest(
+            request_id="req", user_id="u", query="backend engineer", limit=3, answer=True
+        )
+    )
+
+    assert [match.resume_id for match in response.matches] == ["carol", "alice"]
+    assert [resume.resume_id for resume in llm.resumes] == ["carol", "alice"]
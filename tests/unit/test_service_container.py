@@ -0,0 +1,51 @@
+"""Unit tests for the lifespan-managed service container."""
+
+import asyncio
+
+import pytest
+
+from resume_ai.infrastructure.config.settings import AppSettings
+from resume_ai.interfaces.api.dependencies.container import ServiceContainer
+
+
+class ClosableClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio()
+async def test_aclose_waits_for_in_flight_requests_then_closes_clients() -> None:
+    container = ServiceContainer(AppSettings(SHUTDOWN_DRAIN_TIMEOUT_SECONDS=1.0))
+    client = ClosableClient()
+    assert container._singleton("vector_store", lambda: client) is client
+    assert container._singleton("vector_store", ClosableClient) is client
+
+    released = asyncio.Event()
+
+    async def request() -> None:
+        async with container.track_request():
+            await released.wait()
+
+    task = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    closing = asyncio.create_task(container.aclose())
+    await asyncio.sleep(0.01)
+    assert not closing.done()
+
+    released.set()
+    await asyncio.gather(task, closing)
+
+    assert client.closed
+
+
+@pytest.mark.asyncio()
+async def test_mongo_chunk_texts_share_the_audit_store_client() -> None:
+    container = ServiceContainer(AppSettings(CHUNK_TEXT_STORE="mongo"))
+
+    store = container.chunk_text_store()
+
+    assert store._collection.database.client is container.audit_store()._client
+    await container.aclose()
@@ -0,0 +1,84 @@
+"""Unit tests for tenant partitioning of indexed chunks."""
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.http import models as rest
+
+from resume_ai.application.use_cases.process_resumes import chunk_id_for
+from resume_ai.domain.models.resume import ResumeChunk
+from resume_ai.domain.value_objects.tenant import DEFAULT_TENANT_ID, parse_tenant_id
+from resume_ai.infrastructure.vectorstore.qdrant_store import QdrantVectorStore
+
+
+class ConstantEmbeddings:
+    async def embed_documents(self, texts):
+        return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+    async def embed_query(self, text: str) -> list[float]:
+        return [1.0, 0.0, 0.0, 0.0]
+
+
+def _store(client: QdrantClient) -> QdrantVectorStore:
+    return QdrantVectorStore(
+        url=":memory:",
+        collection_name="resumes",
+        vector_size=4,
+        similarity="cosine",
+        embedding_service=ConstantEmbeddings(),
+        embedding_model="model",
+        client=client,
+    )
+
+
+def _chunk(tenant_id: str, resume_id: str = "resume-1") -> ResumeChunk:
+    return ResumeChunk(
+        chunk_id=chunk_id_for(tenant_id, resume_id, "0"),
+        text=f"{tenant_id} chunk",
+        metadata={"tenant_id": tenant_id, "resume_id": resume_id, "position": "0"},
+    )
+
+
+@pytest.mark.asyncio()
+async def test_tenants_only_see_their_own_chunks() -> None:
+    store = _store(QdrantClient(location=":memory:"))
+    await store.upsert_chunks([_chunk("acme"), _chunk("globex")])
+
+    acme = await store.query("anything", limit=10, tenant_id="acme")
+    fetched = await store.fetch_resume_chunks("resume-1", tenant_id="globex")
+
+    assert [chunk.text for chunk in acme] == ["acme chunk"]
+    assert [chunk.metadata["tenant_id"] for chunk in fetched] == ["globex"]
+    assert await store.query("anything", limit=10) == []
+
+
+@pytest.mark.asyncio()
+async def test_chunks_indexed_before_tenancy_join_the_default_tenant() -> None:
+    client = QdrantClient(location=":memory:")
+    client.create_collection(
+        "resumes", vectors_config=rest.VectorParams(size=4, distance=rest.Distance.COSINE)
+    )
+    legacy = _chunk(DEFAULT_TENANT_ID)
+    client.upsert(
+        "resumes",
+        points=[
+            rest.PointStruct(
+                id=legacy.chunk_id,
+                vector=[1.0, 0.0, 0.0, 0.0],
+                payload={"resume_id": "resume-1", "position": "0", "text": legacy.text},
+            )
+        ],
+    )
+
+    store = _store(client)
+
+    assert [chunk.chunk_id for chunk in await store.fetch_resume_chunks("resume-1")] == [
+        legacy.chunk_id
+    ]
+    assert chunk_id_for(DEFAULT_TENANT_ID, "resume-1", "0") != chunk_id_for("acme", "resume-1", "0")
+
+
+def test_tenant_ids_are_validated() -> None:
+    assert parse_tenant_id(None) == parse_tenant_id("  ") == DEFAULT_TENANT_ID
+    assert parse_tenant_id(" acme-eu.1 ") == "acme-eu.1"
+    with pytest.raises(ValueError):
+        parse_tenant_id("acme/../globex")
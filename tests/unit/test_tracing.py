@@ -0,0 +1,52 @@
+"""Unit tests for the recording tracer."""
+
+import pytest
+
+from resume_ai.infrastructure.observability.tracing import (
+    BatchSpanProcessor,
+    RecordingTracer,
+    Span,
+)
+
+
+class MemoryExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+    def shutdown(self) -> None:
+        return None
+
+
+def test_nested_spans_share_request_trace_and_record_errors() -> None:
+    exporter = MemoryExporter()
+    tracer = RecordingTracer(BatchSpanProcessor(exporter, flush_interval=0.01))
+
+    with tracer.span("process_resumes.execute", request_id="req-1"):
+        with tracer.span("ocr.page", page=1):
+            pass
+        with pytest.raises(RuntimeError), tracer.span("llm.answer_query"):
+            raise RuntimeError("boom")
+    tracer.shutdown()
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["process_resumes.execute"]
+    assert root.attributes == {"request_id": "req-1"}
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert spans["ocr.page"].parent_id == root.span_id
+    assert spans["ocr.page"].attributes == {"page": 1, "request_id": "req-1"}
+    assert spans["llm.answer_query"].status == "error"
+
+
+def test_root_spans_of_a_reused_request_id_start_separate_traces() -> None:
+    exporter = MemoryExporter()
+    tracer = RecordingTracer(BatchSpanProcessor(exporter, flush_interval=0.01))
+
+    for _ in range(2):
+        with tracer.span("process_resumes.execute", request_id="req-1"):
+            pass
+    tracer.shutdown()
+
+    assert len({span.trace_id for span in exporter.spans}) == 2
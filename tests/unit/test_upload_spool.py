@@ -0,0 +1,37 @@
+"""Unit tests for streamed upload spooling."""
+
+import hashlib
+import os
+
+import pytest
+
+from resume_ai.infrastructure.storage.upload_spool import UploadSpool, UploadTooLargeError
+
+
+def test_spool_writes_file_reference_with_hash(tmp_path) -> None:
+    spool = UploadSpool("cv.pdf", "application/pdf", str(tmp_path), max_bytes=10)
+    spool.write(b"res")
+    spool.write(b"ume")
+
+    upload = spool.finish()
+
+    assert upload.data == b""
+    assert upload.path is not None and upload.path.endswith(".pdf")
+    assert upload.size == 6
+    with upload.open() as stream:
+        assert stream.read() == b"resume"
+    assert upload.content_hash() == hashlib.sha256(b"resume").hexdigest()
+    spool.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_refuses_bytes_past_the_limit_before_writing_them(tmp_path) -> None:
+    spool = UploadSpool("cv.pdf", "application/pdf", str(tmp_path), max_bytes=10)
+    spool.write(b"x" * 8)
+
+    with pytest.raises(UploadTooLargeError):
+        spool.write(b"x" * 3)
+
+    assert spool.size == 8
+    spool.close()
+    assert os.listdir(tmp_path) == []
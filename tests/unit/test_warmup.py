@@ -0,0 +1,46 @@
+"""Unit tests for the startup warm-up runner."""
+
+import asyncio
+import time
+
+import pytest
+
+from resume_ai.interfaces.api.warmup import WarmupState, run_warmup
+
+
+@pytest.mark.asyncio()
+async def test_run_warmup_runs_steps_concurrently_and_records_failures() -> None:
+    async def open_connection() -> None:
+        await asyncio.sleep(0.05)
+
+    def load_model() -> None:
+        time.sleep(0.05)
+
+    def broken() -> None:
+        raise RuntimeError("missing credentials")
+
+    started = time.perf_counter()
+    state = await run_warmup(
+        {"db": open_connection, "model": load_model, "llm": broken}, timeout=1.0
+    )
+
+    assert time.perf_counter() - started < 0.09
+    assert state.finished
+    assert state.steps["db"].ok and state.steps["model"].ok
+    assert state.steps["llm"].error == "missing credentials"
+    assert not state.ready
+
+
+@pytest.mark.asyncio()
+async def test_run_warmup_times_out_slow_steps() -> None:
+    async def hang() -> None:
+        await asyncio.sleep(10)
+
+    state = await run_warmup({"qdrant": hang}, timeout=0.01)
+
+    assert state.steps["qdrant"].error == "timed out"
+
+
+def test_disabled_warmup_is_ready_immediately() -> None:
+    assert WarmupState(enabled=False).ready
+    assert not WarmupState().ready
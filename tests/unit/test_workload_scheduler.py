@@ -0,0 +1,119 @@
+"""Unit tests for WorkloadScheduler and workload classes."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from resume_ai.application.services.workload_scheduler import (
+    Priority,
+    WorkloadScheduler,
+    current_priority,
+    parse_priority,
+    priority_scope,
+)
+
+
+@pytest.mark.asyncio()
+async def test_reserved_slots_are_kept_for_interactive_work() -> None:
+    scheduler = WorkloadScheduler("ocr", slots=2, reserved_interactive=1)
+
+    async with scheduler.acquire(Priority.BATCH):
+        second_batch = asyncio.create_task(_hold(scheduler, Priority.BATCH))
+        await asyncio.sleep(0)
+        assert not second_batch.done()
+
+        # The interactive request does not queue behind the backfill.
+        async with scheduler.acquire(Priority.INTERACTIVE):
+            assert scheduler.in_use == 2
+    await second_batch
+    assert scheduler.in_use == 0
+
+
+@pytest.mark.asyncio()
+async def test_freed_slots_go_to_the_most_urgent_class_first() -> None:
+    scheduler = WorkloadScheduler("llm", slots=1)
+    order: list[str] = []
+
+    async def run(priority: Priority) -> None:
+        async with scheduler.acquire(priority):
+            order.append(priority.value)
+
+    async with scheduler.acquire(Priority.BATCH):
+        tasks = [
+            asyncio.create_task(run(priority))
+            for priority in (Priority.BACKGROUND, Priority.BATCH, Priority.INTERACTIVE)
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depths() == {"interactive": 1, "batch": 1, "background": 1}
+    await asyncio.gather(*tasks)
+
+    assert order == ["interactive", "batch", "background"]
+
+
+@pytest.mark.asyncio()
+async def test_cancelled_waiters_leave_the_queue() -> None:
+    scheduler = WorkloadScheduler("llm", slots=1)
+
+    async with scheduler.acquire(Priority.BATCH):
+        waiting = asyncio.create_task(_hold(scheduler, Priority.BATCH))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler.queue_depths()["batch"] == 0
+    assert scheduler.in_use == 0
+
+
+@pytest.mark.asyncio()
+async def test_run_calls_in_a_thread_within_the_class_of_the_request() -> None:
+    scheduler = WorkloadScheduler("ocr", slots=1)
+
+    with priority_scope(Priority.BATCH):
+        seen = await scheduler.run(current_priority)
+
+    assert seen is Priority.BATCH
+    assert current_priority() is Priority.INTERACTIVE
+    assert scheduler.in_use == 0
+
+
+@pytest.mark.asyncio()
+async def test_queued_batch_pages_hold_no_executor_thread() -> None:
+    scheduler = WorkloadScheduler("ocr", slots=1)
+    executor = ThreadPoolExecutor(max_workers=2)
+    asyncio.get_running_loop().set_default_executor(executor)
+    started: list[str] = []
+    release = threading.Event()
+
+    def read_page(name: str) -> None:
+        started.append(name)
+        release.wait(timeout=5)
+
+    with priority_scope(Priority.BATCH):
+        batch = [
+            asyncio.create_task(scheduler.run(read_page, f"batch-{index}")) for index in range(4)
+        ]
+    while not started:
+        await asyncio.sleep(0.01)
+    # Three batch pages are queued, yet a thread is still free for unrelated work.
+    assert await asyncio.to_thread(lambda: "free") == "free"
+    interactive = asyncio.create_task(scheduler.run(read_page, "interactive"))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*batch, interactive)
+    executor.shutdown()
+
+    assert started == ["batch-0", "interactive", "batch-1", "batch-2", "batch-3"]
+
+
+def test_parse_priority() -> None:
+    assert parse_priority(None) is Priority.INTERACTIVE
+    assert parse_priority(" Batch ") is Priority.BATCH
+    with pytest.raises(ValueError):
+        parse_priority("urgent")
+
+
+async def _hold(scheduler: WorkloadScheduler, priority: Priority) -> None:
+    async with scheduler.acquire(priority):
+        await asyncio.sleep(0)